@@ -0,0 +1,6 @@
+# bench/__init__.py
+# 벤치마크는 Notion/GitHub 비밀값 없이도 돌아가야 하므로 필수 설정값을 더미로 채운 뒤 모듈을 불러온다.
+import os
+
+for _key in ("NOTION_TOKEN", "NOTION_DB_ID", "NOTION_ACT_DB_ID", "NOTION_TITLE_DB_ID", "NOTION_PAGE_ID", "GB_ICAL_URL"):
+    os.environ.setdefault(_key, "bench")
@@ -0,0 +1,99 @@
+"""벤치마크용 합성 티켓 스트림."""
+import random
+from datetime import datetime, timedelta
+from typing import Iterator, Tuple
+
+PROVIDERS = ("놀티켓", "멜론티켓", "YES24", "티켓링크", "세종문화회관", "예술의전당", "LG 아트센터")
+CATEGORIES = ("뮤지컬", "연극", "콘서트", "클래식")
+VENUES = ("예스24아트원 1관", "세종문화회관 대극장", "예술의전당 오페라극장", "KBS아레나", "수원SK아트리움", "부산 드림씨어터")
+SYLLABLES = "가나다라마바사아자차카타파하별빛바다노을시간여름겨울"
+
+
+def work_name(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 6)))
+
+
+def near_duplicate(name: str, open_dt: datetime, rng: random.Random) -> Tuple[str, datetime]:
+    """예매처마다 조금씩 다르게 올라오는 제목/오픈 일시를 흉내 낸다(띄어쓰기, 긴 제목의 오탈자, 몇 분 차이)."""
+    if len(name) >= 3 and rng.random() < 0.5:
+        cut = rng.randint(1, len(name) - 1)
+        name = f"{name[:cut]} {name[cut:]}"
+    elif len(name) >= 6:
+        idx = len(name) - 1
+        name = name[:idx] + rng.choice(SYLLABLES) + name[idx + 1:]
+    return name, open_dt + timedelta(minutes=rng.randint(-5, 5))
+
+
+def ticket_fields(
+    count: int, seed: int = 0, near_dup_rate: float = 0.0, span_hours: int = 24 * 7
+) -> Iterator[Tuple[str, str, datetime, str, str, str]]:
+    """(원본 제목, 예매처, 오픈 일시, 장르, 공연장, 출연진)을 count개 만든다.
+
+    한 작품을 여러 예매처가 같은 오픈 일시로 올리는 경우가 섞이도록 작품 수를 티켓 수보다 적게 둔다.
+    near_dup_rate 비율만큼은 제목/오픈 일시를 조금 흔들어 정확한 키로는 합쳐지지 않게 한다.
+    오픈 일시는 base부터 span_hours 시간 안에 분포한다.
+    """
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 5, 10, 0)
+    works = [
+        (work_name(rng), rng.choice(CATEGORIES), rng.choice(VENUES), base + timedelta(hours=rng.randint(0, span_hours)))
+        for _ in range(max(1, count // 3))
+    ]
+    for _ in range(count):
+        name, category, venue, open_dt = rng.choice(works)
+        if near_dup_rate and rng.random() < near_dup_rate:
+            name, open_dt = near_duplicate(name, open_dt, rng)
+        title = f"{category} 〈{name}〉"
+        cast = "-" if rng.random() < 0.3 else ", ".join(work_name(rng) for _ in range(rng.randint(1, 4)))
+        yield title, rng.choice(PROVIDERS), open_dt, category, venue, cast
+
+
+REGION_PREFIXES = ("", "", "[서울] ", "[부산] ", "［경기］ ", "[단독] ", "[선예매] ")
+ROUND_SUFFIXES = ("", "", " 티켓오픈 안내", " 1차 티켓오픈", " 2차 티켓 오픈", " 추가 회차 티켓오픈", " 마지막 티켓오픈")
+PROVIDER_TITLE_FORMATS = {
+    # 예매처마다 같은 작품을 다르게 표기하는 방식을 흉내 낸다.
+    "놀티켓": "{region}{category} 〈{name}〉{round}",
+    "멜론티켓": "{region}{category} [{name}]{round}",
+    "YES24": "{region}{year}{category} 〈{name}〉 ({extra}){round}",
+    "티켓링크": "{category} {name}{round}",
+    "세종문화회관": "{year}{name} ({extra})",
+    "예술의전당": "[{category}] {name}",
+    "LG 아트센터": "{name}",
+}
+
+
+def provider_ticket_fields(
+    count: int, seed: int = 0
+) -> Iterator[Tuple[str, str, datetime, str, str, str, str]]:
+    """병합 단계용 합성 티켓 (원본 제목, 예매처, 오픈 일시, 장르, 공연장, 출연진, 오픈 회차)를 만든다.
+
+    예매처별 제목 형식(꺾쇠/대괄호 작품명, 지역·단독 머리말, N차 티켓오픈 꼬리말, 연도, 괄호 부가 정보)과
+    여러 예매처가 같은 작품을 올리는 경우, 출연진이 빠진 항목이 섞인다. 오픈 일시는 1000건당 하루씩 늘어난다.
+    """
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 5, 10, 0)
+    span_hours = max(24 * 7, count * 24 // 1000)
+    providers = tuple(PROVIDER_TITLE_FORMATS)
+    works = []
+    for _ in range(max(1, count // 3)):
+        name = work_name(rng) if rng.random() < 0.7 else f"{work_name(rng)} {work_name(rng)}"
+        cast = ", ".join(work_name(rng) for _ in range(rng.randint(1, 4)))
+        open_dt = base + timedelta(hours=rng.randint(0, span_hours), minutes=rng.choice((0, 0, 30)))
+        works.append((name, rng.choice(CATEGORIES), rng.choice(VENUES), open_dt, cast))
+    for _ in range(count):
+        name, category, venue, open_dt, cast = rng.choice(works)
+        provider = rng.choice(providers)
+        round_suffix = rng.choice(ROUND_SUFFIXES)
+        title = PROVIDER_TITLE_FORMATS[provider].format(
+            region=rng.choice(REGION_PREFIXES),
+            category=category,
+            name=name,
+            round=round_suffix,
+            year=rng.choice(("", "2026 ")),
+            extra=rng.choice(("앵콜", "내한", "오리지널", "서울")),
+        )
+        yield (
+            title, provider, open_dt, category, venue,
+            "-" if rng.random() < 0.35 else cast,
+            round_suffix.strip() or "-",
+        )
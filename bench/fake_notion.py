@@ -0,0 +1,660 @@
+"""네트워크 없이 NotionRepository를 돌리기 위한 프로세스 안의 Notion API 대역.
+
+notion-client AsyncClient와 같은 모양(client.data_sources.query(...) 등)의 비동기 메서드를 제공하며,
+writer가 쓰는 엔드포인트만 구현한다.
+- databases/data_sources: retrieve, query, update(속성 추가)
+- pages: create, retrieve, update(양방향 relation은 반대쪽 페이지도 맞춘다)
+- blocks: children.list, children.append(after 포함), delete
+
+실제 API처럼 요청 한 번의 블록 100개, rich_text 2000자(UTF-16), relation 100개 제한을 검사하고,
+조회 결과의 relation은 25개까지만 돌려주며 has_more를 붙인다. last_edited_time은 분 단위로 내린다.
+FakeFaults로 호출마다 지연, 429(Retry-After 포함), 타임아웃을 넣을 수 있다. 오류는 요청을 처리하기 전에 낸다.
+"""
+import asyncio
+import functools
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+import httpx
+from notion_client.errors import APIErrorCode, APIResponseError, RequestTimeoutError
+
+from notion_writer.payload import MAX_BLOCKS_PER_REQUEST, MAX_TEXT_UNITS, utf16_len
+from utils.config import settings
+
+# 페이지 조회 결과에 담기는 relation 수. 넘으면 잘리고 has_more가 붙는다.
+RELATION_PREVIEW = 25
+MAX_RELATIONS_PER_PROPERTY = 100
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class FakeFaults:
+    """호출마다 넣는 지연과 오류.
+
+    latency/jitter: 응답 지연(초). jitter만큼 고르게 흔든다.
+    rate_limit_per_sec: 서버 쪽 토큰 버킷(0이면 끔). 넘으면 429와 다음 토큰까지의 Retry-After를 돌려준다.
+    rate_limit_ratio/timeout_ratio/server_error_ratio: 무작위로 429/타임아웃/503을 낼 비율.
+    lost_response_ratio: 요청을 처리한 뒤 응답 대신 타임아웃을 낼 비율(쓰기가 반영된 채 재시도된다).
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit_per_sec: float = 0.0
+    rate_limit_burst: int = 10
+    rate_limit_ratio: float = 0.0
+    retry_after: float = 1.0
+    timeout_ratio: float = 0.0
+    server_error_ratio: float = 0.0
+    lost_response_ratio: float = 0.0
+    seed: int = 0
+
+
+def _api_error(code: APIErrorCode, status: int, message: str, headers: Optional[dict] = None) -> APIResponseError:
+    return APIResponseError(
+        code=code, status=status, message=message, headers=httpx.Headers(headers or {}), raw_body_text=message
+    )
+
+
+def _not_found(object_id: str) -> APIResponseError:
+    return _api_error(APIErrorCode.ObjectNotFound, 404, f"Could not find object with ID: {object_id}.")
+
+
+def _invalid(message: str) -> APIResponseError:
+    return _api_error(APIErrorCode.ValidationError, 400, message)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _minute_iso(now: float) -> str:
+    moment = datetime.fromtimestamp(now, timezone.utc).replace(second=0, microsecond=0)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _rich_text(items: list) -> list:
+    if len(items) > 100:
+        raise _invalid("rich_text should have at most 100 items.")
+    result = []
+    for item in items:
+        content = item.get("text", {}).get("content", item.get("plain_text", ""))
+        if utf16_len(content) > MAX_TEXT_UNITS:
+            raise _invalid(f"text.content.length should be ≤ {MAX_TEXT_UNITS}, instead was {utf16_len(content)}.")
+        result.append({"type": "text", "text": {"content": content}, "plain_text": content})
+    return result
+
+
+def _clone(value):
+    """응답마다 새 객체를 돌려주기 위한 복사. JSON 값(dict/list/스칼라)만 다루므로 deepcopy보다 훨씬 빠르다."""
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
+
+
+def _plain_text(items: list) -> str:
+    return "".join(item.get("plain_text", "") for item in items or [])
+
+
+class _Namespace:
+    pass
+
+
+class FakeNotion:
+    """Notion 작업 공간 하나를 메모리에 흉내 내는 비동기 클라이언트 대역.
+
+    calls는 엔드포인트별 호출 수(오류 포함), faults는 넣은 오류 수다.
+    add_database/add_page는 호출로 세지 않는 준비용 메서드로, 10만 건 단위의 DB를 빠르게 채울 때 쓴다.
+    """
+
+    def __init__(self, faults: Optional[FakeFaults] = None, clock: Callable[[], float] = time.time):
+        self.fault_plan = faults or FakeFaults()
+        self._clock = clock
+        self._rng = random.Random(self.fault_plan.seed)
+        self._tokens = float(self.fault_plan.rate_limit_burst)
+        self._refilled = time.monotonic()
+        self._ids = 0
+        self.calls: Counter = Counter()
+        self.faults: Counter = Counter()
+        # DB ID → {"data_source_id", "properties"(이름 → 스키마)}
+        self._databases: Dict[str, dict] = {}
+        self._data_sources: Dict[str, str] = {}
+        # 데이터 소스별 페이지 ID(생성 순서)
+        self._page_order: Dict[str, List[str]] = {}
+        self._pages: Dict[str, dict] = {}
+        self._blocks: Dict[str, dict] = {}
+        # 페이지/블록 ID → 자식 블록 ID(순서대로)
+        self._children: Dict[str, List[str]] = {}
+
+        self.databases = _Namespace()
+        self.databases.retrieve = self._endpoint("databases.retrieve", self._retrieve_database)
+        self.databases.query = self._endpoint("databases.query", self._query_database)
+        self.databases.update = self._endpoint("databases.update", self._update_database)
+        self.data_sources = _Namespace()
+        self.data_sources.retrieve = self._endpoint("data_sources.retrieve", self._retrieve_data_source)
+        self.data_sources.query = self._endpoint("data_sources.query", self._query)
+        self.data_sources.update = self._endpoint("data_sources.update", self._update_data_source)
+        self.pages = _Namespace()
+        self.pages.create = self._endpoint("pages.create", self._create_page)
+        self.pages.retrieve = self._endpoint("pages.retrieve", self._retrieve_page)
+        self.pages.update = self._endpoint("pages.update", self._update_page)
+        self.blocks = _Namespace()
+        self.blocks.delete = self._endpoint("blocks.delete", self._delete_block)
+        self.blocks.children = _Namespace()
+        self.blocks.children.list = self._endpoint("blocks.children.list", self._list_children)
+        self.blocks.children.append = self._endpoint("blocks.children.append", self._append_children)
+
+    async def aclose(self) -> None:
+        pass
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def _new_id(self) -> str:
+        self._ids += 1
+        return str(uuid.UUID(int=self._ids))
+
+    def _now(self) -> str:
+        return _minute_iso(self._clock())
+
+    # ---- 지연/오류 -------------------------------------------------------
+
+    def _endpoint(self, name: str, handler):
+        async def call(**kwargs):
+            self.calls[name] += 1
+            await self._inject_faults()
+            kwargs.pop("auth", None)
+            result = handler(**kwargs)
+            plan = self.fault_plan
+            if plan.lost_response_ratio and self._rng.random() < plan.lost_response_ratio:
+                self.faults["lost_response"] += 1
+                raise RequestTimeoutError()
+            return result
+
+        return call
+
+    async def _inject_faults(self) -> None:
+        plan = self.fault_plan
+        delay = plan.latency + (self._rng.uniform(-plan.jitter, plan.jitter) if plan.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if plan.timeout_ratio and self._rng.random() < plan.timeout_ratio:
+            self.faults["timeout"] += 1
+            raise RequestTimeoutError()
+        if plan.rate_limit_ratio and self._rng.random() < plan.rate_limit_ratio:
+            raise self._rate_limited(plan.retry_after)
+        if plan.server_error_ratio and self._rng.random() < plan.server_error_ratio:
+            self.faults["service_unavailable"] += 1
+            raise _api_error(APIErrorCode.ServiceUnavailable, 503, "Notion is unavailable, please try again later.")
+        if plan.rate_limit_per_sec > 0:
+            now = time.monotonic()
+            self._tokens = min(plan.rate_limit_burst, self._tokens + (now - self._refilled) * plan.rate_limit_per_sec)
+            self._refilled = now
+            if self._tokens < 1:
+                raise self._rate_limited((1 - self._tokens) / plan.rate_limit_per_sec)
+            self._tokens -= 1
+
+    def _rate_limited(self, retry_after: float) -> APIResponseError:
+        self.faults["rate_limited"] += 1
+        return _api_error(
+            APIErrorCode.RateLimited, 429, "You have been rate limited. Please try again in a few minutes.",
+            {"retry-after": f"{retry_after:.3f}"},
+        )
+
+    # ---- 준비용 메서드(호출 수에 들어가지 않음) -----------------------------
+
+    def add_database(self, database_id: str, properties: Dict[str, dict]) -> str:
+        """DB와 그 아래 data source 하나를 만들고 data source ID를 돌려준다.
+
+        properties는 이름 → {"type": ..., 종류별 설정}. relation의 dual_property는 link_dual()로 잇는다.
+        """
+        data_source_id = f"{database_id}-ds"
+        schema = {}
+        for name, prop in properties.items():
+            kind = prop["type"]
+            schema[name] = {"id": "title" if kind == "title" else self._new_id()[-8:], "name": name, **prop}
+            schema[name].setdefault(kind, {})
+        self._databases[database_id] = {"data_source_id": data_source_id, "properties": schema}
+        self._data_sources[data_source_id] = database_id
+        self._page_order[data_source_id] = []
+        return data_source_id
+
+    def link_dual(self, database_id: str, prop: str, other_database_id: str, other_prop: str) -> None:
+        """두 DB의 relation 속성을 양방향(dual)으로 잇는다."""
+        for db, name, other_db, other_name in (
+                (database_id, prop, other_database_id, other_prop),
+                (other_database_id, other_prop, database_id, prop),
+        ):
+            other_ds = self._databases[other_db]["data_source_id"]
+            other_schema = self._databases[other_db]["properties"][other_name]
+            self._databases[db]["properties"][name].update(type="relation", relation={
+                "database_id": other_db,
+                "data_source_id": other_ds,
+                "type": "dual_property",
+                "dual_property": {"synced_property_name": other_name, "synced_property_id": other_schema["id"]},
+            })
+
+    def add_page(self, database_id: str, properties: dict, last_edited_time: Optional[str] = None) -> str:
+        """쓰기 형식의 속성으로 페이지를 바로 만든다. last_edited_time을 주면 그 시각에 수정된 것으로 둔다."""
+        page = self._new_page(self._databases[database_id]["data_source_id"], properties)
+        if last_edited_time:
+            page["created_time"] = page["last_edited_time"] = last_edited_time
+        return page["id"]
+
+    def edit_page(self, page_id: str, properties: dict) -> None:
+        """API를 거치지 않고 페이지 속성을 고친다(누군가 Notion에서 직접 고친 상황)."""
+        self._set_properties(self._page(page_id), properties)
+
+    def trash_page(self, page_id: str) -> None:
+        page = self._page(page_id)
+        page["in_trash"] = True
+        page["last_edited_time"] = self._now()
+
+    def pages_in(self, database_id: str) -> Iterable[dict]:
+        """휴지통에 없는 페이지(조회 결과 모양, relation은 잘리지 않음)."""
+        for page_id in self._page_order[self._databases[database_id]["data_source_id"]]:
+            page = self._pages[page_id]
+            if not page["in_trash"]:
+                yield self._render(page, preview=False)
+
+    def block_count(self, block_id: str) -> int:
+        return len(self._children.get(block_id, ()))
+
+    # ---- databases / data sources -----------------------------------------
+
+    def _database(self, database_id: str) -> dict:
+        if database_id not in self._databases:
+            raise _not_found(database_id)
+        return self._databases[database_id]
+
+    def _data_source(self, data_source_id: str) -> dict:
+        if data_source_id not in self._data_sources:
+            raise _not_found(data_source_id)
+        return self._databases[self._data_sources[data_source_id]]
+
+    def _retrieve_database(self, database_id: str) -> dict:
+        db = self._database(database_id)
+        return {
+            "object": "database",
+            "id": database_id,
+            "data_sources": [{"id": db["data_source_id"], "name": database_id}],
+            "properties": _clone(db["properties"]),
+        }
+
+    def _retrieve_data_source(self, data_source_id: str) -> dict:
+        db = self._data_source(data_source_id)
+        return {
+            "object": "data_source",
+            "id": data_source_id,
+            "parent": {"type": "database_id", "database_id": self._data_sources[data_source_id]},
+            "properties": _clone(db["properties"]),
+        }
+
+    def _update_database(self, database_id: str, properties: Optional[dict] = None, **_) -> dict:
+        self._add_properties(self._database(database_id), properties or {})
+        return self._retrieve_database(database_id)
+
+    def _update_data_source(self, data_source_id: str, properties: Optional[dict] = None, **_) -> dict:
+        self._add_properties(self._data_source(data_source_id), properties or {})
+        return self._retrieve_data_source(data_source_id)
+
+    def _add_properties(self, db: dict, properties: dict) -> None:
+        for name, config in properties.items():
+            if name in db["properties"]:
+                continue
+            kind = next(iter(config))
+            db["properties"][name] = {"id": self._new_id()[-8:], "name": name, "type": kind, kind: config[kind]}
+
+    def _query_database(self, database_id: str, **body) -> dict:
+        return self._query(self._database(database_id)["data_source_id"], **body)
+
+    def _query(
+            self,
+            data_source_id: str,
+            filter: Optional[dict] = None,
+            sorts: Optional[list] = None,
+            start_cursor: Optional[str] = None,
+            page_size: int = MAX_PAGE_SIZE,
+            filter_properties: Optional[list] = None,
+            **_,
+    ) -> dict:
+        """생성 순서대로 filter에 맞는 페이지를 page_size개씩 돌려준다. 커서는 다음에 볼 위치다."""
+        if sorts:
+            raise _invalid("sorts is not supported by the fake client.")
+        schema = self._data_source(data_source_id)["properties"]
+        names = None
+        if filter_properties is not None:
+            by_id = {prop["id"]: name for name, prop in schema.items()}
+            names = {by_id.get(prop_id, prop_id) for prop_id in filter_properties}
+        order = self._page_order[data_source_id]
+        position = int(start_cursor or 0)
+        limit = max(1, min(page_size, MAX_PAGE_SIZE))
+        results = []
+        while position < len(order) and len(results) < limit:
+            page = self._pages[order[position]]
+            position += 1
+            if not page["in_trash"] and (filter is None or self._matches(page, filter, schema)):
+                results.append(self._render(page, names))
+        # 더 남았는지는 실제 API처럼 뒤를 다 보지 않고 위치로만 판단한다(빈 마지막 묶음이 올 수 있다).
+        has_more = position < len(order)
+        return {
+            "object": "list",
+            "results": results,
+            "has_more": has_more,
+            "next_cursor": str(position) if has_more else None,
+        }
+
+    def _matches(self, page: dict, condition: dict, schema: dict) -> bool:
+        if "and" in condition:
+            return all(self._matches(page, part, schema) for part in condition["and"])
+        if "or" in condition:
+            return any(self._matches(page, part, schema) for part in condition["or"])
+        if "timestamp" in condition:
+            kind = condition["timestamp"]
+            return _compare_time(page[kind], condition[kind])
+        name = condition.get("property")
+        if name not in schema:
+            raise _invalid(f"Could not find property with name or id: {name}")
+        kind = next(key for key in condition if key != "property")
+        rule = condition[kind]
+        value = page["properties"].get(name)
+        if kind in ("title", "rich_text"):
+            text = _plain_text((value or {}).get(kind))
+            if "equals" in rule:
+                return text == rule["equals"]
+            if "contains" in rule:
+                return rule["contains"] in text
+            if "is_empty" in rule:
+                return not text
+        elif kind == "date":
+            start = ((value or {}).get("date") or {}).get("start")
+            if "is_empty" in rule:
+                return not start
+            return bool(start) and _compare_time(start, rule)
+        raise _invalid(f"Unsupported filter in the fake client: {condition}")
+
+    # ---- pages ----------------------------------------------------------
+
+    def _page(self, page_id: str) -> dict:
+        if page_id not in self._pages:
+            raise _not_found(page_id)
+        return self._pages[page_id]
+
+    def _new_page(self, data_source_id: str, properties: dict) -> dict:
+        now = self._now()
+        page = {
+            "id": self._new_id(),
+            "data_source_id": data_source_id,
+            "created_time": now,
+            "last_edited_time": now,
+            "in_trash": False,
+            "properties": {},
+            # relation 속성 이름 → {페이지 ID: None}(순서 유지)
+            "relations": {},
+        }
+        self._pages[page["id"]] = page
+        self._page_order[data_source_id].append(page["id"])
+        self._children[page["id"]] = []
+        self._set_properties(page, properties)
+        return page
+
+    def _create_page(self, parent: dict, properties: dict, children: Optional[list] = None, **_) -> dict:
+        data_source_id = parent.get("data_source_id")
+        if data_source_id is None:
+            data_source_id = self._database(parent.get("database_id"))["data_source_id"]
+        self._data_source(data_source_id)
+        self._check_blocks(children or [])
+        page = self._new_page(data_source_id, properties)
+        self._insert_blocks(page["id"], children or [], None)
+        return self._render(page)
+
+    def _retrieve_page(self, page_id: str, **_) -> dict:
+        return self._render(self._page(page_id))
+
+    def _update_page(self, page_id: str, properties: Optional[dict] = None, **body) -> dict:
+        page = self._page(page_id)
+        trash = body.get("in_trash", body.get("archived"))
+        if page["in_trash"] and trash is not False:
+            raise _invalid("Can't edit block that is archived. You must unarchive the block before editing.")
+        if trash is not None:
+            page["in_trash"] = bool(trash)
+        self._set_properties(page, properties or {})
+        return self._render(page)
+
+    def _set_properties(self, page: dict, properties: dict) -> None:
+        schema = self._data_source(page["data_source_id"])["properties"]
+        for name, value in properties.items():
+            if name not in schema:
+                raise _invalid(f"{name} is not a property that exists.")
+            kind = schema[name]["type"]
+            if kind == "relation":
+                ids = [rel["id"] for rel in value.get("relation") or []]
+                if len(ids) > MAX_RELATIONS_PER_PROPERTY:
+                    raise _invalid(
+                        f"body.properties.{name}.relation.length should be ≤ {MAX_RELATIONS_PER_PROPERTY}, "
+                        f"instead was {len(ids)}."
+                    )
+                self._set_relation(page, name, ids, schema[name]["relation"])
+            elif kind in ("title", "rich_text"):
+                page["properties"][name] = {kind: _rich_text(value.get(kind) or [])}
+            elif kind == "date":
+                date = value.get("date")
+                if date and date.get("start") and "T" in date["start"]:
+                    # Notion은 날짜-시각을 밀리초까지 붙여 돌려준다.
+                    date = dict(date, start=_parse_time(date["start"]).isoformat(timespec="milliseconds"))
+                page["properties"][name] = {"date": date}
+            else:
+                page["properties"][name] = {kind: _clone(value.get(kind))}
+        page["last_edited_time"] = self._now()
+
+    def _set_relation(self, page: dict, name: str, ids: List[str], config: dict) -> None:
+        before = page["relations"].get(name, {})
+        after = dict.fromkeys(ids)
+        page["relations"][name] = after
+        dual = config.get("dual_property")
+        if not dual:
+            return
+        other_name = dual["synced_property_name"]
+        now = self._now()
+        for other_id in before.keys() - after.keys():
+            other = self._pages.get(other_id)
+            if other is not None:
+                other["relations"].get(other_name, {}).pop(page["id"], None)
+                other["last_edited_time"] = now
+        for other_id in after.keys() - before.keys():
+            other = self._page(other_id)
+            other["relations"].setdefault(other_name, {})[page["id"]] = None
+            other["last_edited_time"] = now
+
+    def _render(self, page: dict, names: Optional[set] = None, preview: bool = True) -> dict:
+        """page 객체. names가 있으면 그 속성만 담고, preview면 relation을 25개까지로 자른다."""
+        schema = self._data_source(page["data_source_id"])["properties"]
+        properties = {}
+        for name, prop in schema.items():
+            if names is not None and name not in names:
+                continue
+            kind = prop["type"]
+            if kind == "relation":
+                ids = list(page["relations"].get(name, {}))
+                shown = ids[:RELATION_PREVIEW] if preview else ids
+                value = {"relation": [{"id": rel} for rel in shown], "has_more": len(shown) < len(ids)}
+            else:
+                value = _clone(page["properties"].get(name)) or {kind: [] if kind in ("title", "rich_text") else None}
+            properties[name] = {"id": prop["id"], "type": kind, **value}
+        return {
+            "object": "page",
+            "id": page["id"],
+            "created_time": page["created_time"],
+            "last_edited_time": page["last_edited_time"],
+            "in_trash": page["in_trash"],
+            "archived": page["in_trash"],
+            "parent": {"type": "data_source_id", "data_source_id": page["data_source_id"]},
+            "properties": properties,
+        }
+
+    # ---- blocks ---------------------------------------------------------
+
+    def _check_blocks(self, blocks: list, depth: int = 0) -> None:
+        if len(blocks) > MAX_BLOCKS_PER_REQUEST:
+            raise _invalid(f"body.children.length should be ≤ {MAX_BLOCKS_PER_REQUEST}, instead was {len(blocks)}.")
+        if depth > 2:
+            raise _invalid("body.children exceeds the maximum nesting depth of 2.")
+        for block in blocks:
+            body = block[block["type"]]
+            _rich_text(body.get("rich_text") or [])
+            self._check_blocks(body.get("children") or [], depth + 1)
+
+    def _insert_blocks(self, parent_id: str, blocks: list, after: Optional[str]) -> List[dict]:
+        siblings = self._children[parent_id]
+        position = len(siblings)
+        if after is not None:
+            if after not in siblings:
+                raise _invalid(f"Block {after} is not a child of {parent_id}.")
+            position = siblings.index(after) + 1
+        created = []
+        for block in blocks:
+            kind = block["type"]
+            body = dict(block[kind])
+            children = body.pop("children", None) or []
+            body["rich_text"] = _rich_text(body.get("rich_text") or [])
+            record = {
+                "object": "block",
+                "id": self._new_id(),
+                "parent_id": parent_id,
+                "type": kind,
+                kind: body,
+                "in_trash": False,
+            }
+            self._blocks[record["id"]] = record
+            self._children[record["id"]] = []
+            self._insert_blocks(record["id"], children, None)
+            created.append(record)
+        siblings[position:position] = [record["id"] for record in created]
+        return [self._render_block(record) for record in created]
+
+    def _render_block(self, record: dict) -> dict:
+        block = {key: value for key, value in record.items() if key != "parent_id"}
+        block["has_children"] = bool(self._children.get(record["id"]))
+        block["archived"] = record["in_trash"]
+        return _clone(block)
+
+    def _parent_of(self, block_id: str) -> List[str]:
+        if block_id in self._pages:
+            if self._pages[block_id]["in_trash"]:
+                raise _invalid("Can't edit block that is archived. You must unarchive the block before editing.")
+            return self._children[block_id]
+        record = self._blocks.get(block_id)
+        if record is None:
+            raise _not_found(block_id)
+        if record["in_trash"]:
+            raise _invalid("Can't edit block that is archived. You must unarchive the block before editing.")
+        return self._children[block_id]
+
+    def _list_children(self, block_id: str, start_cursor: Optional[str] = None, page_size: int = MAX_PAGE_SIZE,
+                       **_) -> dict:
+        if block_id not in self._children:
+            raise _not_found(block_id)
+        children = self._children[block_id]
+        start = int(start_cursor or 0)
+        end = start + max(1, min(page_size, MAX_PAGE_SIZE))
+        has_more = end < len(children)
+        return {
+            "object": "list",
+            "results": [self._render_block(self._blocks[block]) for block in children[start:end]],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+    def _append_children(self, block_id: str, children: list, after: Optional[str] = None, **_) -> dict:
+        self._parent_of(block_id)
+        self._check_blocks(children)
+        created = self._insert_blocks(block_id, children, after)
+        self._touch(block_id)
+        return {"object": "list", "results": created, "has_more": False, "next_cursor": None}
+
+    def _delete_block(self, block_id: str, **_) -> dict:
+        record = self._blocks.get(block_id)
+        if record is None:
+            raise _not_found(block_id)
+        if record["in_trash"]:
+            raise _invalid("Can't edit block that is archived. You must unarchive the block before editing.")
+        record["in_trash"] = True
+        self._children[record["parent_id"]].remove(block_id)
+        self._touch(record["parent_id"])
+        return self._render_block(record)
+
+    def _touch(self, block_id: str) -> None:
+        """블록이 바뀌면 그 블록이 속한 페이지의 last_edited_time도 바뀐다."""
+        while block_id in self._blocks:
+            block_id = self._blocks[block_id]["parent_id"]
+        if block_id in self._pages:
+            self._pages[block_id]["last_edited_time"] = self._now()
+
+
+def _compare_time(value: str, rule: dict) -> bool:
+    moment = _parse_time(value)
+    for op, target in rule.items():
+        bound = _parse_time(target)
+        if bound.tzinfo is None:
+            bound = bound.replace(tzinfo=timezone.utc)
+        if op == "equals":
+            ok = moment == bound
+        elif op == "on_or_after":
+            ok = moment >= bound
+        elif op == "on_or_before":
+            ok = moment <= bound
+        elif op == "after":
+            ok = moment > bound
+        elif op == "before":
+            ok = moment < bound
+        else:
+            raise _invalid(f"Unsupported date filter in the fake client: {op}")
+        if not ok:
+            return False
+    return True
+
+
+def ticket_workspace(
+        fake: FakeNotion,
+        ticket_db: str = "tickets",
+        actor_db: str = "actors",
+        work_db: str = "works",
+        detail_links: int = 5,
+) -> None:
+    """writer가 쓰는 세 DB(티켓/배우/작품)를 만든다. 출연 배우/관련 작품은 양방향 relation이다.
+
+    티켓 DB에는 지문 속성(NOTION_FINGERPRINT_PROPERTY)도 미리 둔다.
+    """
+    text = {"type": "rich_text"}
+    tickets = {
+        "공연 제목": {"type": "title"},
+        "구분": text,
+        "오픈 일시": {"type": "date"},
+        "오픈 회차": text,
+        "공연 기간": text,
+        "오픈 타입": {"type": "multi_select"},
+        "공연 장소": text,
+        "출연진": text,
+        "예매처": {"type": "multi_select"},
+        "단독 판매": {"type": "checkbox"},
+        "출연 배우": {"type": "relation"},
+        "관련 작품": {"type": "relation"},
+        "등록 링크": {"type": "url"},
+        "지역": {"type": "select"},
+    }
+    for idx in range(detail_links):
+        tickets["상세 링크" if idx == 0 else f"상세 링크{idx + 1}"] = {"type": "url"}
+    if settings.NOTION_FINGERPRINT_PROPERTY:
+        tickets[settings.NOTION_FINGERPRINT_PROPERTY] = text
+    fake.add_database(ticket_db, tickets)
+    fake.add_database(actor_db, {"이름": {"type": "title"}, "출연 공연": {"type": "relation"}})
+    fake.add_database(work_db, {"공연명": {"type": "title"}, "관련 공연": {"type": "relation"}})
+    fake.link_dual(ticket_db, "출연 배우", actor_db, "출연 공연")
+    fake.link_dual(ticket_db, "관련 작품", work_db, "관련 공연")
@@ -0,0 +1,92 @@
+"""퍼지 병합(블록 인덱스) 후보 탐색 비용이 티켓 수에 거의 선형으로 느는지 확인한다.
+
+    python -m bench.fuzzy [티켓 수 ...]   (기본 1000 10000 100000)
+
+합성 작품명은 글자 종류가 적어 한 시간대에 몰리면 블록이 실제보다 훨씬 커진다.
+실제 오픈 일정처럼 티켓이 늘면 기간도 늘도록 1000건당 하루치로 오픈 일시를 펼친다.
+2000건 이하에서는 블록 탐색 결과를 모든 쌍 비교와 맞춰 보는데, 기본 max_block 외에 아주 작은 max_block과
+오픈 일시를 몇 시간에 몰아넣은 입력으로도 비교해 max_block보다 큰 블록을 건너뛰는 경로도 확인한다.
+"""
+import sys
+from collections import Counter
+from itertools import combinations
+
+import bench  # noqa: F401  (더미 설정값 주입)
+from bench.corpus import ticket_fields
+from bench.timing import time_and_peak
+from merge.fuzzy import dice, find_near_duplicates, group_near_duplicates, title_grams
+from utils.config import settings
+from utils.utils import normalize_title_for_merge
+
+
+def build_entries(size: int, span_hours: int | None = None):
+    """merge_ticket_sources처럼 정확한 키로 먼저 합친 뒤 남은 (병합 제목, 오픈 일시, 예매처) 목록."""
+    exact = {}
+    span_hours = span_hours or max(24 * 7, size * 24 // 1000)
+    for title, provider, open_dt, _, _, _ in ticket_fields(size, near_dup_rate=0.3, span_hours=span_hours):
+        merge_title = normalize_title_for_merge(title)
+        exact.setdefault((merge_title, open_dt), (merge_title, open_dt, set()))[2].add(provider)
+    return list(exact.values())
+
+
+def pairwise(entries, threshold: float, tolerance_minutes: int) -> set:
+    """블록 없이 모든 쌍을 비교하는 기준 구현. 작은 입력에서 결과 비교용으로만 쓴다."""
+    grams = [title_grams(title) for title, _, _ in entries]
+    found = set()
+    for left, right in combinations(range(len(entries)), 2):
+        if entries[left][2] & entries[right][2]:
+            continue
+        if abs((entries[left][1] - entries[right][1]).total_seconds()) > tolerance_minutes * 60:
+            continue
+        if dice(grams[left], grams[right]) >= threshold:
+            found.add((left, right))
+    return found
+
+
+def largest_block(entries, tolerance_minutes: int) -> int:
+    window = max(1, tolerance_minutes) * 60
+    sizes = Counter(
+        (int(open_dt.timestamp() // window), gram) for title, open_dt, _ in entries for gram in title_grams(title)
+    )
+    return max(sizes.values(), default=0)
+
+
+def check_against_pairwise(label: str, entries, options: dict) -> None:
+    """블록 탐색이 찾은 쌍이 모든 쌍 비교와 같은지 확인한다. 다르면 AssertionError."""
+    expected = pairwise(entries, options["threshold"], options["tolerance_minutes"])
+    for max_block in (options["max_block"], 2):
+        found = {(left, right) for _, left, right in find_near_duplicates(entries, **dict(options, max_block=max_block))}
+        assert found == expected, f"{label} max_block={max_block}: 누락 {len(expected - found)}쌍, 초과 {len(found - expected)}쌍"
+    print(
+        f"{'':>17}  {label}: 모든 쌍 비교와 같음 ({len(expected):,}쌍, 가장 큰 블록 "
+        f"{largest_block(entries, options['tolerance_minutes']):,}, max_block {options['max_block']}/2)"
+    )
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    options = dict(
+        threshold=settings.MERGE_FUZZY_THRESHOLD,
+        tolerance_minutes=settings.MERGE_FUZZY_TIME_TOLERANCE_MINUTES,
+        max_block=settings.MERGE_FUZZY_MAX_BLOCK,
+    )
+    for size in sizes:
+        entries = build_entries(size)
+        groups, elapsed, _ = time_and_peak(lambda: group_near_duplicates(entries, **options), trace_memory=False)
+        absorbed = sum(len(members) for members in groups.values())
+        print(
+            f"티켓 {size:>9,}건(정확 병합 후 {len(entries):,}건)  블록 탐색 {elapsed * 1000:9.1f} ms  "
+            f"건당 {elapsed / size * 1e6:6.1f} µs  흡수 {absorbed:,}건"
+        )
+        if size <= 2_000:
+            _, naive, _ = time_and_peak(
+                lambda: pairwise(entries, options["threshold"], options["tolerance_minutes"]), trace_memory=False
+            )
+            print(f"{'':>17}  전체 쌍 비교 {naive * 1000:8.1f} ms")
+            check_against_pairwise("기본 입력", entries, options)
+            # 오픈 일시를 몇 시간에 몰아 흔한 글자쌍 블록이 max_block을 넘게 만든다.
+            check_against_pairwise("3시간에 몰린 입력", build_entries(size, span_hours=3), options)
+
+
+if __name__ == "__main__":
+    main()
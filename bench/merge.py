@@ -0,0 +1,146 @@
+"""티켓 레코드 생성/검증과 병합 비용을 잰다.
+
+    python -m bench.merge [티켓 수 ...]   (기본 10000 100000)
+"""
+import json
+import random
+import sys
+from datetime import datetime
+
+import bench  # noqa: F401  (더미 설정값 주입)
+from bench.corpus import ticket_fields
+from bench.timing import format_bytes, time_and_peak
+from merge.merge import TicketMerger, _record_to_row, merge_ticket_sources
+from models.ticket import CONTENT_STORE, TicketInfo, TicketRecord, validate_tickets
+from utils.config import settings
+
+
+def build_info(fields):
+    return [
+        TicketInfo(title=title, open_datetime=open_dt, source=provider, category=category, venue=venue, cast=cast)
+        for title, provider, open_dt, category, venue, cast in fields
+    ]
+
+
+def build_records(fields):
+    return [
+        TicketRecord(title=title, open_datetime=open_dt, source=provider, category=category, venue=venue, cast=cast)
+        for title, provider, open_dt, category, venue, cast in fields
+    ]
+
+
+def build_records_bulk(fields):
+    return TicketRecord.from_rows(
+        (title, open_dt, "-", "-", cast, "-", category, "-", set(), venue, set(), False, "", provider, set(), "", "")
+        for title, provider, open_dt, category, venue, cast in fields
+    )
+
+
+def build_records_with_content(fields):
+    """같은 작품(상세 페이지)의 티켓이 같은 content를 공유하도록 만든다."""
+    pages = {}
+    records = []
+    for title, provider, open_dt, category, venue, cast in fields:
+        content = pages.setdefault((title, provider), {"공연정보": f"{title} {venue}\n" * 40, "출연진": cast})
+        records.append(TicketRecord(
+            title=title, open_datetime=open_dt, source=provider, category=category, venue=venue, cast=cast,
+            content=content,
+        ))
+    return records, len(pages)
+
+
+def combine_shards(fields, shards: int, order=None, build=build_records) -> TicketMerger:
+    """샤드별로 병합한 상태를 JSON으로 주고받은 뒤 order(기본은 왼쪽부터) 순서대로 합친다."""
+    size = -(-len(fields) // shards)
+    states = [
+        json.dumps(TicketMerger().add_many(build(fields[start:start + size])).to_state())
+        for start in range(0, len(fields), size)
+    ]
+    merger = TicketMerger()
+    for idx in order or range(len(states)):
+        merger.combine(TicketMerger.from_state(json.loads(states[idx])))
+    return merger
+
+
+def check_order_independent(fields, shards: int = 8) -> None:
+    """티켓을 뒤섞어 add하거나 샤드를 뒤섞은 순서로 합쳐도 차례로 병합한 결과와 같은지 확인한다."""
+    def build(part):
+        return [
+            TicketRecord(
+                title=title, open_datetime=open_dt, source=provider, category=category, venue=venue, cast=cast,
+                detail_url=f"https://{provider}/{idx}", content={"공연정보": f"{title} {venue}", "출연진": cast},
+            )
+            for idx, title, provider, open_dt, category, venue, cast in part
+        ]
+
+    def rows(records):
+        return [_record_to_row(tk) for tk in records]
+
+    numbered = [(idx, *row) for idx, row in enumerate(fields)]
+    expected = rows(merge_ticket_sources(build(numbered)))
+    rng = random.Random(0)
+    shuffled = list(numbered)
+    rng.shuffle(shuffled)
+    assert rows(merge_ticket_sources(build(shuffled))) == expected, "add 순서에 따라 결과가 다름"
+    order = list(range(shards))
+    rng.shuffle(order)
+    assert rows(combine_shards(numbered, shards, order, build).snapshot()) == expected, "combine 순서에 따라 결과가 다름"
+    print(f"  순서 무관성 확인: 뒤섞은 add, 샤드 {shards}개를 {order} 순서로 combine 모두 같음")
+
+
+def check_provider_priority() -> None:
+    """두 예매처가 같은 공연을 팔면 넣는 순서와 상관없이 MERGE_PROVIDER_PRIORITY가 앞선 예매처의 값이 남는지 확인한다."""
+    first, second = settings.MERGE_PROVIDER_PRIORITY[0], settings.MERGE_PROVIDER_PRIORITY[-1]
+    open_dt = datetime(2026, 3, 1, 14)
+
+    def ticket(provider: str, tag: str) -> TicketRecord:
+        return TicketRecord(
+            title="뮤지컬 〈우선순위〉", open_datetime=open_dt, source=provider, detail_url=f"https://{tag}.example/1",
+            category=f"{tag} 구분", open_type=f"{tag} 오픈", venue=f"{tag} 극장", cast=f"{tag} 배우",
+        )
+
+    for order in ((first, second), (second, first)):
+        merged = merge_ticket_sources([ticket(provider, provider) for provider in order])
+        assert len(merged) == 1
+        tk = merged[0]
+        got = (tk.source, tk.detail_url, tk.category, tk.open_type, tk.venue, tk.cast)
+        assert got == (first, f"https://{first}.example/1", f"{first} 구분", f"{first} 오픈", f"{first} 극장",
+                       f"{first} 배우"), f"{order} 순서로 넣었을 때 {got}"
+        assert tk.providers == {first, second}
+    print(f"예매처 우선순위 확인: {first}/{second} 중복 → {first}의 값이 남음")
+
+
+def report(label: str, fn) -> object:
+    # tracemalloc은 실행을 크게 늦추므로 시간과 최대 메모리는 따로 잰다.
+    result, elapsed, _ = time_and_peak(fn, trace_memory=False)
+    _, _, peak = time_and_peak(fn)
+    print(f"  {label:<34} {elapsed * 1000:10.1f} ms  peak {format_bytes(peak):>9}")
+    return result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    check_provider_priority()
+    for size in sizes:
+        fields = list(ticket_fields(size))
+        print(f"티켓 {size:,}건")
+        report("TicketInfo 생성(검증 포함)", lambda: build_info(fields))
+        report("TicketRecord 생성", lambda: build_records(fields))
+        report("TicketRecord.from_rows", lambda: build_records_bulk(fields))
+        merged = report("merge_ticket_sources(TicketRecord)", lambda: merge_ticket_sources(build_records(fields)))
+        # 크롤링과 겹쳐 미리 add해 두면 마지막 크롤러가 끝난 뒤 남는 비용은 snapshot()뿐이다.
+        merger = TicketMerger().add_many(build_records(fields))
+        report("TicketMerger.snapshot()", merger.snapshot)
+        report("샤드 8개 combine + snapshot", lambda: combine_shards(fields, 8).snapshot())
+        report(f"validate_tickets(병합 {len(merged):,}건)", lambda: validate_tickets(merged))
+        if size <= 20_000:
+            check_order_independent(fields)
+        (_, pages), elapsed, _ = time_and_peak(lambda: build_records_with_content(fields), trace_memory=False)
+        print(
+            f"  {'content 저장(페이지 ' + format(pages, ',') + '개)':<34} {elapsed * 1000:10.1f} ms  "
+            f"고유 본문 {len(CONTENT_STORE):,}개 / {format_bytes(CONTENT_STORE.memory_bytes)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""병합 단계(제목 정규화 + merge_ticket_sources) 비용을 티켓 수별로 잰다.
+
+    python -m bench.merge_stage [티켓 수 ...]   (기본 1000 10000 100000 1000000)
+
+corpus.provider_ticket_fields가 예매처별 제목 형식(지역 머리말, N차 티켓오픈 꼬리말, 괄호 부가 정보)과
+출연진 누락을 섞어 만든 티켓 스트림을 쓴다. 1M건은 입력을 리스트로 들고 있지 않도록 스트림으로 흘려 넣으며,
+최대 메모리에는 레코드 생성분이 포함되므로 '레코드 생성만' 줄과 비교해서 읽는다.
+"""
+import sys
+
+import bench  # noqa: F401  (더미 설정값 주입)
+from bench.corpus import provider_ticket_fields
+from bench.timing import format_bytes, time_and_peak, time_per_call
+from merge.merge import merge_ticket_sources
+from models.ticket import TicketRecord
+from utils.utils import normalize_title, normalize_title_for_merge
+
+
+def record_stream(size: int):
+    for title, provider, open_dt, category, venue, cast, round_info in provider_ticket_fields(size):
+        yield TicketRecord(
+            title=title, open_datetime=open_dt, source=provider, category=category, venue=venue, cast=cast,
+            round_info=round_info,
+        )
+
+
+def count_records(size: int) -> int:
+    return sum(1 for _ in record_stream(size))
+
+
+def report(label: str, size: int, fn) -> object:
+    # tracemalloc은 실행을 크게 늦추므로 시간과 최대 메모리는 따로 잰다.
+    result, elapsed, _ = time_and_peak(fn, trace_memory=False)
+    _, _, peak = time_and_peak(fn)
+    print(
+        f"  {label:<28} {elapsed * 1000:11.1f} ms  건당 {elapsed / size * 1e6:7.2f} µs  "
+        f"peak {format_bytes(peak):>9}"
+    )
+    return result
+
+
+def normalization_costs() -> None:
+    titles = sorted({title for title, *_ in provider_ticket_fields(2_000)})
+    normalized = [normalize_title(title) for title in titles]
+    per_title, _ = time_per_call(lambda: [normalize_title(title) for title in titles])
+    per_merge, _ = time_per_call(lambda: [normalize_title_for_merge(title) for title in normalized])
+    print(f"제목 {len(titles):,}개")
+    print(f"  {'normalize_title':<28} 건당 {per_title / len(titles) * 1e6:7.2f} µs")
+    print(f"  {'normalize_title_for_merge':<28} 건당 {per_merge / len(titles) * 1e6:7.2f} µs")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000]
+    normalization_costs()
+    for size in sizes:
+        print(f"티켓 {size:,}건")
+        report("레코드 생성만", size, lambda: count_records(size))
+        merged = report("생성 + merge_ticket_sources", size, lambda: merge_ticket_sources(record_stream(size)))
+        providers = sum(len(tk.providers) for tk in merged)
+        print(f"  병합 결과 {len(merged):,}건, 예매처 연결 {providers:,}개")
+
+
+if __name__ == "__main__":
+    main()
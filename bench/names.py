@@ -0,0 +1,84 @@
+"""NotionRepository의 배우/작품 이름 매칭 비용을 이름 수별로 잰다.
+
+    python -m bench.names [이름 수, 기본 10000]
+
+이름마다 경계 정규식/부분 문자열 검사를 돌리던 방식과 NameMatcher(자동자 + 본문별 메모)를 비교하고,
+두 방식의 매칭 결과가 같은지도 확인한다.
+"""
+import random
+import re
+import sys
+
+import bench  # noqa: F401  (더미 설정값 주입)
+from bench.corpus import SYLLABLES, provider_ticket_fields, work_name
+from bench.timing import time_per_call
+from notion_writer.name_matcher import NameMatcher
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+
+
+def actor_names(count: int, rng: random.Random) -> list[str]:
+    names = set()
+    while len(names) < count:
+        if rng.random() < 0.1:
+            names.add(f"{rng.choice(('Kim', 'Lee', 'Park'))} {work_name(rng)}")
+        else:
+            names.add(rng.choice(SURNAMES) + "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 2))))
+    return sorted(names)
+
+
+def regex_cast_names(names, text: str) -> list[str]:
+    return [name for name in names if re.search(rf'(?<!\w){re.escape(name)}(?!\w)', text)]
+
+
+def substring_title_names(names, text: str) -> list[str]:
+    return [name for name in names if name in text]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = random.Random(0)
+    actors = actor_names(size, rng)
+    works = sorted({work_name(rng) for _ in range(size)})
+    tickets = []
+    for title, *_ in provider_ticket_fields(20):
+        cast = ", ".join(rng.choice(actors) for _ in range(rng.randint(0, 6))) or "-"
+        tickets.append((title, cast))
+
+    # writer는 티켓 하나에 대해 출연진 2번, 제목 3번(배우 2 + 작품 1)을 조회한다.
+    def old_way():
+        for title, cast in tickets:
+            for _ in range(2):
+                regex_cast_names(actors, cast) + regex_cast_names(actors, title)
+            substring_title_names(works, title)
+            substring_title_names(works, title)
+
+    def new_way(actor_matcher, title_matcher):
+        for title, cast in tickets:
+            for _ in range(2):
+                actor_matcher.find(cast) + actor_matcher.find(title)
+            title_matcher.find(title)
+            title_matcher.find(title)
+
+    check_actor, check_title = NameMatcher(actors), NameMatcher(works, word_boundary=False)
+    for title, cast in tickets:
+        for text in (title, cast):
+            assert set(regex_cast_names(actors, text)) == set(check_actor.find(text)), text
+        assert set(substring_title_names(works, title)) == set(check_title.find(title)), title
+
+    old, _ = time_per_call(old_way, min_seconds=0.5, max_calls=3)
+    build, _ = time_per_call(lambda: (NameMatcher(actors), NameMatcher(works, word_boundary=False)))
+    uncached = NameMatcher(actors, cache_size=0), NameMatcher(works, word_boundary=False, cache_size=0)
+    cold, _ = time_per_call(lambda: new_way(*uncached))
+    actor_matcher, title_matcher = NameMatcher(actors), NameMatcher(works, word_boundary=False)
+    warm, _ = time_per_call(lambda: new_way(actor_matcher, title_matcher))
+    per = len(tickets)
+    print(f"배우 {len(actors):,}명 / 작품 {len(works):,}개 / 티켓 {per}건 (결과 동일)")
+    print(f"  {'이름별 정규식':<20} 티켓당 {old / per * 1000:9.3f} ms")
+    print(f"  {'자동자 생성':<20} {build * 1000:12.1f} ms (저장소 생성 시 1번)")
+    print(f"  {'자동자(메모 없이)':<20} 티켓당 {cold / per * 1000:9.3f} ms")
+    print(f"  {'자동자(메모 적중)':<20} 티켓당 {warm / per * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""크롤러 추출기에 큰 본문과 악의적인 입력을 넣어 호출당 시간을 잰다.
+
+    python -m bench.parsers [본문 크기(KB), 기본 100]
+
+닫히지 않은 괄호, 날짜 없는 마커 반복, 끝나지 않는 JSON 배열처럼
+지연 와일드카드 정규식이 제곱 시간으로 무너지는 입력을 일부러 만든다.
+이어서 크롤러별 parse_regions로 필요한 영역만 파싱했을 때의 시간과 최대 메모리를 전체 파싱과 비교한다.
+"""
+import random
+import sys
+
+import bench  # noqa: F401  (더미 설정값 주입)
+from bs4 import BeautifulSoup
+
+from bench.timing import format_bytes, time_and_peak, time_per_call
+from crawler.interpark import InterParkCrawler
+from crawler.lgart import LGArtCrawler
+from crawler.melon import MelonCrawler
+from crawler.sac import SacCrawler
+from crawler.sejongpac import SejongPac
+from crawler.yes24 import Yes24Crawler
+from utils.utils import (
+    clean_cast_text,
+    extract_cast_from_lines,
+    extract_open_round_period,
+    extract_performance_period,
+    normalize_title,
+    normalize_title_for_merge,
+    resolve_region,
+)
+
+WORDS = ("공연", "뮤지컬", "티켓오픈", "선예매", "캐스팅", "출연", "서울", "대학로", "안내", "회차", "일시", "장소")
+
+
+def korean_text(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts, length = [], 0
+    while length < size:
+        word = rng.choice(WORDS)
+        sep = "\n" if rng.random() < 0.05 else " "
+        parts.append(word + sep)
+        length += len(word) + 1
+    return "".join(parts)[:size]
+
+
+def build_cases(size: int):
+    text = korean_text(size)
+    one_line = text.replace("\n", " ")
+    sac = SacCrawler.__new__(SacCrawler)
+
+    def sac_schedule(body: str):
+        soup = BeautifulSoup(f"<div>{body}</div>", "html.parser")
+        return lambda: sac._parse_schedule(soup)
+
+    return [
+        ("normalize_title / 일반 본문", lambda: normalize_title(one_line)),
+        ("normalize_title / 닫히지 않은 (", lambda: normalize_title("(공연 " * (size // 4))),
+        ("normalize_title / 닫히지 않은 [", lambda: normalize_title("[서울 " * (size // 4))),
+        ("normalize_title_for_merge / 일반 본문", lambda: normalize_title_for_merge(one_line)),
+        ("SacCrawler._parse_schedule / 일반 본문", sac_schedule(text)),
+        ("SacCrawler._parse_schedule / 날짜 없는 마커 반복", sac_schedule("선예매 일반예매 " * (size // 10))),
+        ("SacCrawler._parse_schedule / 시 없는 날짜 반복", sac_schedule("선예매 " + "1월 2일 " * (size // 6))),
+        ("InterPark ticketDates / 끝나지 않는 배열",
+         lambda: InterParkCrawler._extract_ticket_dates_from_html('"ticketDates": [' + '{"a": 1},' * (size // 9))),
+        ("InterPark ticketDates / 반복 키",
+         lambda: InterParkCrawler._extract_ticket_dates_from_html('"ticketDates": [] ' * (size // 18))),
+        ("LGArt data 객체 / 반복 후보",
+         lambda: LGArtCrawler._extract_vue_data("data: {" * (size // 7), "Article")),
+        ("clean_cast_text / 일반 본문", lambda: clean_cast_text(text)),
+        ("extract_cast_from_lines / 일반 본문", lambda: extract_cast_from_lines(text.splitlines())),
+        ("extract_open_round_period / 일반 본문", lambda: extract_open_round_period(text)),
+        ("extract_performance_period / 일반 본문", lambda: extract_performance_period(text)),
+        ("resolve_region / 일반 본문", lambda: resolve_region(text, one_line)),
+    ]
+
+
+def noise_html(size: int) -> str:
+    """메뉴, 푸터, 스크립트처럼 크롤러가 쓰지 않는 마크업을 size 바이트 정도 만든다."""
+    block = (
+        '<div class="gnb"><ul>' + '<li><a href="#">메뉴</a><span>공연 안내</span></li>' * 10 + "</ul></div>"
+        '<div class="footer"><p>주소 서울특별시</p><p>문의 1544-0000</p></div>'
+    )
+    return block * max(1, size // len(block))
+
+
+def build_pages(size: int):
+    noise = noise_html(size)
+    return [
+        (MelonCrawler, "list",
+         noise + '<ul class="list_ticket_cont">'
+         + '<li><a class="tit" href="./x">공연</a><span class="date">2026.01.01 14:00</span></li>' * 20 + "</ul>"),
+        (SejongPac, "list",
+         noise + '<div class="tbl_list"><table><tbody>'
+         + "<tr>" + "<td>값</td>" * 6 + "</tr>" * 10 + "</tbody></table></div>"),
+        (SacCrawler, "detail",
+         noise + '<p class="title">공연</p><div class="cwa-top"><ul><li><span>장소</span><span>오페라극장</span></li></ul></div>'
+         + '<div class="ctl-sub"><p>선예매 1월 2일 오후 2시</p></div>' * 4),
+        (Yes24Crawler, "detail",
+         noise + '<div class="noti-vt-tit"><span>단독판매</span></div>'
+         + '<div class="noti-view-coment"><div class="noti-view-comen-tit">공연 개요</div>'
+         + '<div class="noti-view-comen-txt">공연 장소 : 예스24아트원</div></div>'),
+    ]
+
+
+def main():
+    size_kb = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    size = size_kb * 1024
+    print(f"입력 크기: {size_kb}KB")
+    for name, fn in build_cases(size):
+        per_call, calls = time_per_call(fn, max_calls=50)
+        print(f"{name:<45} {per_call * 1000:10.2f} ms/call ({calls}회)")
+
+    print()
+    print("영역 파싱(parse_regions) vs 전체 파싱")
+    for crawler_cls, region, html in build_pages(size):
+        strainer = crawler_cls.parse_regions[region]
+        _, full_time, full_peak = time_and_peak(lambda: BeautifulSoup(html, "html.parser"))
+        _, part_time, part_peak = time_and_peak(lambda: BeautifulSoup(html, "html.parser", parse_only=strainer))
+        print(
+            f"{crawler_cls.__name__:<14} {region:<6} "
+            f"전체 {full_time * 1000:8.1f} ms / {format_bytes(full_peak):>9}   "
+            f"영역 {part_time * 1000:8.1f} ms / {format_bytes(part_peak):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
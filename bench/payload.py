@@ -0,0 +1,77 @@
+"""100KB 공지 본문을 Notion 블록으로 바꾸는 비용을 잰다.
+
+    python -m bench.payload [본문 KB ...]   (기본 100)
+
+글자마다 UTF-16 길이를 세던 이전 분할과 notion_writer.payload.chunk_text(슬라이스 계산 + 줄 경계)를 비교하고,
+페이지 하나를 쓰는 데 필요한 블록 수와 100블록 단위 요청 수도 함께 보여 준다.
+"""
+import random
+import sys
+
+import bench  # noqa: F401  (더미 설정값 주입)
+from bench.corpus import SYLLABLES
+from bench.timing import time_per_call
+from notion_writer.payload import MAX_BLOCKS_PER_REQUEST, MAX_TEXT_UNITS, chunk_text, utf16_len
+from notion_writer.writer import NotionRepository
+
+EMOJI = "🎭🎫🎶✨📢"
+
+
+def per_char_chunk_text(text: str, limit: int = MAX_TEXT_UNITS) -> list[str]:
+    """이전 writer의 분할: 글자마다 UTF-16 길이를 더해 가며 자른다."""
+    chunks, current, current_len = [], [], 0
+    for ch in text:
+        ch_len = 2 if ord(ch) > 0xFFFF else 1
+        if current_len + ch_len > limit:
+            chunks.append("".join(current))
+            current, current_len = [], 0
+        current.append(ch)
+        current_len += ch_len
+    if current:
+        chunks.append("".join(current))
+    return chunks or [""]
+
+
+def notice_text(size_kb: int, emoji_rate: float, rng: random.Random) -> str:
+    """예매 공지처럼 짧은 줄이 이어지는 본문을 UTF-8 기준 size_kb 남짓 만든다."""
+    lines, size = [], 0
+    while size < size_kb * 1024:
+        words = []
+        for _ in range(rng.randint(3, 15)):
+            word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+            if rng.random() < emoji_rate:
+                word += rng.choice(EMOJI)
+            words.append(word)
+        line = " ".join(words)
+        lines.append(line)
+        size += len(line.encode()) + 1
+    return "\n".join(lines)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100]
+    rng = random.Random(0)
+    repo = NotionRepository(client=object())
+    print(f"{'본문':>6} {'이모지':>6} {'이전 분할':>10} {'슬라이스':>10} {'배속':>6} {'조각':>5} {'줄 경계':>7} {'블록':>5} {'요청':>4}")
+    for size_kb in sizes:
+        for emoji_rate in (0.0, 0.2):
+            text = notice_text(size_kb, emoji_rate, rng)
+            old_chunks = per_char_chunk_text(text)
+            new_chunks = chunk_text(text)
+            assert "".join(new_chunks) == text
+            assert all(utf16_len(chunk) <= MAX_TEXT_UNITS for chunk in new_chunks)
+            old, _ = time_per_call(lambda: per_char_chunk_text(text), max_calls=50)
+            new, _ = time_per_call(lambda: chunk_text(text), max_calls=500)
+            on_line = sum(1 for chunk in new_chunks[:-1] if chunk.endswith("\n"))
+            blocks = repo._build_contents({"공지": text, "기본 정보": "공연 기간: 2026.01.01 ~ 2026.02.28"}, "")
+            requests = -(-len(blocks) // MAX_BLOCKS_PER_REQUEST)
+            print(
+                f"{size_kb:>5}KB {emoji_rate:>6.0%} {old * 1000:>8.2f}ms {new * 1000:>8.3f}ms {old / new:>5.0f}x "
+                f"{len(new_chunks):>5} {on_line:>3}/{max(1, len(new_chunks) - 1):<3} {len(blocks):>5} {requests:>4}"
+            )
+            if len(old_chunks) != len(new_chunks):
+                print(f"       (이전 분할 조각 {len(old_chunks)}개 — 줄 경계에서 자르느라 조각이 조금 늘 수 있다)")
+
+
+if __name__ == "__main__":
+    main()
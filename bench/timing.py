@@ -0,0 +1,38 @@
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+
+def time_per_call(fn: Callable[[], Any], min_seconds: float = 0.2, max_calls: int = 1000) -> Tuple[float, int]:
+    """fn을 최소 min_seconds 동안 반복 호출해 호출당 평균 시간(초)과 호출 횟수를 돌려준다."""
+    calls = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while calls < max_calls and (calls == 0 or elapsed < min_seconds):
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - started
+    return elapsed / calls, calls
+
+
+def time_and_peak(fn: Callable[[], Any], trace_memory: bool = True) -> Tuple[Any, float, int]:
+    """fn을 한 번 실행해 (결과, 소요 시간(초), 최대 추가 메모리(byte))를 돌려준다."""
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = fn()
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
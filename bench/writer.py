@@ -0,0 +1,180 @@
+"""NotionRepository의 write_all / sync_existing_ticket_relations 처리량과 티켓당 API 호출 수를 잰다.
+
+    python -m bench.writer [--tickets 1000] [--existing 100000] [--latency 0.0] [--rate-limit 0] ...
+
+bench.fake_notion의 Notion 대역에 기존 티켓 페이지(--existing건, relation 없음)와 배우/작품 DB를 채운 뒤,
+실행 단계마다 새 저장소를 만들어(실제 실행처럼 캐시/미러만 이어받는다) 걸린 시간과 엔드포인트별 호출 수를 보여 준다.
+1. 첫 실행: 미러/이름 맵 전체 조회 + 새 티켓 생성
+2. 같은 티켓으로 다시 실행(지문이 같아 쓰기 없음)
+3. 일부 티켓의 본문 한 섹션만 바꿔 실행
+4. 티켓 DB 전체 relation 동기화
+5. 배우 몇 명의 이름을 바꾼 뒤 변경분만 relation 동기화
+호출 수는 대역이 받은 요청 수이며 429/타임아웃으로 다시 보낸 요청도 포함한다.
+--latency/--rate-limit/--rate-limit-ratio/--timeout-ratio/--server-error-ratio/--lost-response-ratio로
+지연과 오류를 넣을 수 있고(응답을 잃은 생성이 페이지를 중복으로 만들지 않았는지도 확인한다),
+governor 속도는 --rate(초당, 0이면 제한 없음)로 정한다. 실제 Notion처럼 --rate 3이면 그만큼 오래 걸린다.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import bench  # noqa: F401  (더미 설정값 주입)
+from bench.corpus import CATEGORIES, SYLLABLES, ticket_fields, work_name
+from bench.fake_notion import FakeFaults, FakeNotion, ticket_workspace
+from bench.names import actor_names
+from merge.merge import merge_ticket_sources
+from models.ticket import TicketRecord
+from notion_writer.governor import NOTION_GOVERNOR
+from notion_writer.writer import NotionRepository
+from utils.config import settings
+
+TICKET_DB, ACTOR_DB, WORK_DB = "tickets", "actors", "works"
+# 준비한 페이지는 오래전에 수정된 것으로 두어 변경분 조회에 나오지 않게 한다.
+SEEDED_AT = "2025-01-01T00:00:00.000Z"
+
+
+def text_block(rng: random.Random, size: int) -> str:
+    lines, length = [], 0
+    while length < size:
+        line = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(20, 80)))
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def seed_workspace(fake: FakeNotion, args, rng: random.Random) -> tuple[list[str], list[str], dict]:
+    """배우/작품 DB와 기존 티켓 페이지를 채우고 (배우 이름, 작품 이름, 배우 이름 → 페이지 ID)를 돌려준다."""
+    ticket_workspace(fake, TICKET_DB, ACTOR_DB, WORK_DB)
+    actors = actor_names(args.actors, rng)
+    works = sorted({work_name(rng) for _ in range(args.works)})
+    actor_pages = {
+        name: fake.add_page(ACTOR_DB, {"이름": {"title": [{"text": {"content": name}}]}}, SEEDED_AT) for name in actors
+    }
+    for name in works:
+        fake.add_page(WORK_DB, {"공연명": {"title": [{"text": {"content": name}}]}}, SEEDED_AT)
+    base = datetime(2025, 1, 6, 10, 0, tzinfo=settings.DEFAULT_TIMEZONE)
+    for _ in range(args.existing):
+        cast = ", ".join(rng.sample(actors, rng.randint(0, 3))) or "-"
+        fake.add_page(TICKET_DB, {
+            "공연 제목": {"title": [{"text": {"content": f"{rng.choice(CATEGORIES)} 〈{rng.choice(works)}〉"}}]},
+            "오픈 일시": {"date": {"start": (base + timedelta(hours=rng.randint(0, 24 * 360))).isoformat()}},
+            "출연진": {"rich_text": [{"text": {"content": cast}}]},
+        }, SEEDED_AT)
+    return actors, works, actor_pages
+
+
+def build_tickets(args, actors: list[str], revision: int = 0) -> list[TicketRecord]:
+    """크롤링 결과처럼 병합된 티켓. revision이 바뀌면 --changed 비율의 티켓에서 할인 정보 섹션만 달라진다."""
+    rng = random.Random(1)
+    records = []
+    for idx, (title, provider, open_dt, category, venue, _) in enumerate(ticket_fields(args.tickets, seed=1)):
+        cast = ", ".join(rng.sample(actors, rng.randint(0, 4))) or "-"
+        # 50건에 1건은 100블록이 넘는 긴 공지다.
+        notice = text_block(rng, 250_000 if idx % 50 == 0 else 3_000)
+        # revision과 상관없이 같은 난수를 뽑아야 나머지 티켓 내용이 그대로다.
+        changed = rng.random() < args.changed and revision
+        records.append(TicketRecord(
+            title=title, open_datetime=open_dt, source=provider, category=category, venue=venue, cast=cast,
+            content={"공연 소개": notice, "출연진": cast, "할인 정보": f"조기 예매 할인 {revision if changed else 0}"},
+        ))
+    return merge_ticket_sources(records)
+
+
+def report(label: str, fake: FakeNotion, before: Counter, elapsed: float, units: int, unit: str) -> None:
+    calls = fake.calls - before
+    total = sum(calls.values())
+    print(
+        f"  {label:<26} {elapsed:8.2f} s  {units / elapsed if elapsed else 0:9.1f} {unit}/s  "
+        f"호출 {total:>7,}회 ({total / units if units else 0:.2f}회/{unit})"
+    )
+    print("    " + ", ".join(f"{name} {count:,}" for name, count in calls.most_common()))
+
+
+async def run_phase(label: str, fake: FakeNotion, units: int, unit: str, action) -> object:
+    before = Counter(fake.calls)
+    started = time.perf_counter()
+    async with NotionRepository(client=fake, database_id=TICKET_DB) as repo:
+        result = await action(repo)
+    report(label, fake, before, time.perf_counter() - started, units, unit)
+    return result
+
+
+async def main(args) -> None:
+    rng = random.Random(0)
+    fake = FakeNotion(FakeFaults(
+        latency=args.latency,
+        jitter=args.latency / 2,
+        rate_limit_per_sec=args.rate_limit,
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=args.retry_after,
+        timeout_ratio=args.timeout_ratio,
+        server_error_ratio=args.server_error_ratio,
+        lost_response_ratio=args.lost_response_ratio,
+    ))
+    started = time.perf_counter()
+    actors, _, actor_pages = seed_workspace(fake, args, rng)
+    print(
+        f"기존 티켓 {args.existing:,}건, 배우 {len(actors):,}명, 작품 {args.works:,}개 준비 "
+        f"{time.perf_counter() - started:.1f} s"
+    )
+    tickets = build_tickets(args, actors)
+    total_pages = args.existing + len(tickets)
+    print(f"새 티켓 {len(tickets):,}건 (병합 후)")
+
+    await run_phase("첫 실행", fake, len(tickets), "티켓", lambda repo: repo.write_all(tickets))
+    created = sum(1 for _ in fake.pages_in(TICKET_DB)) - args.existing
+    assert created == len(tickets), f"새 티켓 {len(tickets)}건인데 페이지가 {created}개 생김"
+    await run_phase("다시 실행(변경 없음)", fake, len(tickets), "티켓", lambda repo: repo.write_all(tickets))
+    changed = build_tickets(args, actors, revision=1)
+    await run_phase("본문 한 섹션 변경", fake, len(changed), "티켓", lambda repo: repo.write_all(changed))
+
+    stats = await run_phase(
+        "relation 전체 동기화", fake, total_pages, "페이지", lambda repo: repo.sync_existing_ticket_relations()
+    )
+    print(f"    결과 {dict(stats)}")
+    for name in rng.sample(actors, args.renamed):
+        fake.edit_page(actor_pages[name], {"이름": {"title": [{"text": {"content": f"{name}{name[-1]}"}}]}})
+    stats = await run_phase(
+        f"배우 {args.renamed}명 이름 변경 후", fake, total_pages, "페이지",
+        lambda repo: repo.sync_existing_ticket_relations(only_changed=True),
+    )
+    print(f"    결과 {dict(stats)}")
+    if fake.faults:
+        print(f"넣은 오류 {dict(fake.faults)}, governor 대기 {NOTION_GOVERNOR.stats['wait_seconds']:.1f} s")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=1_000, help="새로 쓸 티켓 수(병합 전)")
+    parser.add_argument("--existing", type=int, default=100_000, help="티켓 DB에 미리 채울 페이지 수")
+    parser.add_argument("--actors", type=int, default=2_000)
+    parser.add_argument("--works", type=int, default=500)
+    parser.add_argument("--changed", type=float, default=0.2, help="3단계에서 본문이 바뀌는 티켓 비율")
+    parser.add_argument("--renamed", type=int, default=5, help="5단계에서 이름을 바꿀 배우 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="호출당 지연(초)")
+    parser.add_argument("--rate", type=float, default=0.0, help="governor 초당 호출 수(0이면 제한 없음)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="대역의 초당 허용 호출 수(넘으면 429)")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="무작위 429 비율")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--timeout-ratio", type=float, default=0.0, help="무작위 타임아웃 비율")
+    parser.add_argument("--server-error-ratio", type=float, default=0.0, help="무작위 503 비율")
+    parser.add_argument("--lost-response-ratio", type=float, default=0.0, help="처리 후 응답을 잃는 비율")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    # 티켓마다 남기는 INFO 로그는 측정에 방해가 되므로 경고 이상만 보인다.
+    logging.basicConfig(level=logging.WARNING)
+    workdir = tempfile.mkdtemp(prefix="bench-writer-")
+    settings.CACHE_DIR = os.path.join(workdir, "cache")
+    settings.GB_ICAL_DIR = os.path.join(workdir, "ical")
+    settings.NOTION_ACT_DB_ID, settings.NOTION_TITLE_DB_ID = ACTOR_DB, WORK_DB
+    NOTION_GOVERNOR.rate = arguments.rate
+    asyncio.run(main(arguments))
@@ -1,33 +1,88 @@
 import aiohttp
 import asyncio
+import codecs
 import logging
+import re
+import time
+from collections import defaultdict
+from contextvars import ContextVar
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 from abc import ABC, abstractmethod
 
-from models.ticket import TicketInfo
+from bs4 import BeautifulSoup, SoupStrainer
+
+from models.ticket import TicketRecord
 from utils.config import settings
+from utils.utils import apply_content_policy
 
 logger = logging.getLogger(__name__)
 
+# Content-Type에 charset이 없을 때 본문 앞부분에서 찾는 HTML 선언
+# (<meta charset="euc-kr"> 또는 <meta http-equiv="Content-Type" content="text/html; charset=euc-kr">)
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
+
+
+class ParseBudgetExceeded(Exception):
+    """페이지 한 건의 파싱 시간이 settings.PARSE_TIME_BUDGET을 넘었을 때 발생한다."""
+
+
+# 상세 요청은 각자 별도 task에서 돌기 때문에 마감 시각도 task마다 따로 유지된다.
+_parse_deadline: ContextVar[float | None] = ContextVar("parse_deadline", default=None)
+
+
+def start_parse_budget(seconds: float | None = None) -> None:
+    budget = settings.PARSE_TIME_BUDGET if seconds is None else seconds
+    _parse_deadline.set(time.monotonic() + budget if budget and budget > 0 else None)
+
+
+def check_parse_budget() -> None:
+    """파싱 단계 사이사이에 호출해, 예산을 넘긴 페이지의 추출을 중단시킨다.
+
+    예산은 호출한 시점에만 검사하므로 BeautifulSoup 파싱, get_text, 정규식 같은 호출 한 번이 도는 동안에는
+    멈추지 못한다. 그런 호출의 시간은 _parse_html이 입력을 PARSE_MAX_CHARS로 잘라 묶는다.
+    """
+    deadline = _parse_deadline.get()
+    if deadline is not None and time.monotonic() > deadline:
+        raise ParseBudgetExceeded("파싱 시간 예산 초과")
+
+
+def region_strainer(*classes: str, names: str | List[str] | None = None) -> SoupStrainer:
+    """주어진 class 중 하나를 가진 태그 서브트리만 남기는 SoupStrainer를 만든다.
+
+    파싱 중에는 class 값이 아직 공백으로 나뉘지 않은 문자열이라, 직접 나눠 비교한다.
+    """
+    wanted = set(classes)
+
+    def match_class(value) -> bool:
+        return bool(value) and not wanted.isdisjoint(str(value).split())
+
+    return SoupStrainer(names, class_=match_class)
+
 
 class AsyncCrawlerBase(ABC):
     headers: Dict[str, str] = {}
     timeout: aiohttp.ClientTimeout
+    # 페이지 종류("list"/"detail")별로 실제로 쓰는 영역만 파싱한다. 없으면 문서 전체를 파싱한다.
+    parse_regions: Dict[str, SoupStrainer] = {}
 
     def __init__(self, date_range: Tuple[datetime, datetime]):
         self.timeout = aiohttp.ClientTimeout(total=settings.HTTP_TIMEOUT)
         self.start, self.end = date_range
+        # 호스트별 본문 읽기 통계. 실행 요약(run.py)에서 합산해 출력한다.
+        self.read_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"responses": 0, "bytes_read": 0, "bytes_saved": 0, "early_stops": 0, "capped": 0}
+        )
 
     @abstractmethod
     async def _fetch_list(self, session: aiohttp.ClientSession) -> List[Dict]:
         pass
 
     @abstractmethod
-    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketInfo]:
+    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketRecord]:
         pass
 
-    async def crawl(self) -> List[TicketInfo]:
+    async def crawl(self) -> List[TicketRecord]:
         semaphore = asyncio.Semaphore(5)
 
         async def limited_fetch_detail(item):
@@ -49,7 +104,7 @@ class AsyncCrawlerBase(ABC):
                 return_exceptions=False  # 각 fetch_detail에서 내부 처리
             )
 
-        tickets: List[TicketInfo] = []
+        tickets: List[TicketRecord] = []
         for result in detail_results:
             if result:
                 if isinstance(result, list):
@@ -58,6 +113,105 @@ class AsyncCrawlerBase(ABC):
                     tickets.append(result)
         return tickets
 
+    async def _read_text(
+            self,
+            resp: aiohttp.ClientResponse,
+            stop_marker: str | None = None,
+            until: Callable[[str], bool] | None = None,
+            max_bytes: int | None = None,
+    ) -> str:
+        """응답 본문을 조각 단위로 읽다가 필요한 부분이 모두 모이면 멈춘다.
+
+        stop_marker가 나타난 뒤 until(지금까지 읽은 본문)이 참이면 읽기를 멈춘다. stop_marker만 주면
+        그 문자열이 나타나는 즉시, until만 주면 조각마다 검사한다. max_bytes(기본 settings.HTTP_MAX_BYTES)를
+        넘기면 거기까지만 읽고 잘라낸다.
+        """
+        max_bytes = max_bytes or settings.HTTP_MAX_BYTES
+        stats = self.read_stats[resp.url.host or "-"]
+        stats["responses"] += 1
+
+        decoder = None
+        text = ""
+        read_bytes = 0
+        marker_seen = stop_marker is None
+        tail = ""
+        stopped = False
+        async for chunk in resp.content.iter_chunked(64 * 1024):
+            if read_bytes + len(chunk) > max_bytes:
+                chunk = chunk[:max_bytes - read_bytes]
+                stats["capped"] += 1
+                logger.warning(
+                    f"[{self.__class__.__name__}] 응답 크기 상한 {max_bytes}byte 초과, 잘라서 사용: {resp.url}"
+                )
+                stopped = True
+            read_bytes += len(chunk)
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(self._body_encoding(resp, chunk))(errors="replace")
+            piece = decoder.decode(chunk)
+            # 조각마다 전체를 다시 합치지 않도록 읽은 본문을 이어 붙여 둔다.
+            text += piece
+            if stopped:
+                break
+
+            if not marker_seen:
+                # 조각 경계에 걸친 마커도 찾도록 직전 조각의 끝부분을 이어 붙여 검사한다.
+                window = tail + piece
+                marker_seen = stop_marker in window
+                tail = window[-len(stop_marker):]
+            if (stop_marker or until) and marker_seen and (until is None or until(text)):
+                stats["early_stops"] += 1
+                stopped = True
+                break
+        if decoder is not None:
+            text += decoder.decode(b"", final=True)
+
+        stats["bytes_read"] += read_bytes
+        if stopped and resp.content_length and not resp.headers.get("Content-Encoding"):
+            stats["bytes_saved"] += max(resp.content_length - read_bytes, 0)
+        return text
+
+    @staticmethod
+    def _body_encoding(resp: aiohttp.ClientResponse, head: bytes) -> str:
+        """본문 인코딩. resp.get_encoding()과 같게 정하되, 본문 전체 대신 첫 조각으로 판단한다.
+
+        Content-Type의 charset(JSON이면 utf-8) → HTML meta charset → utf-8 순이다.
+        """
+        try:
+            return resp.get_encoding()
+        except RuntimeError:
+            # charset 헤더가 없고 본문을 아직 다 읽지 않은 경우
+            pass
+        match = _META_CHARSET.search(head[:4096])
+        if match:
+            try:
+                return codecs.lookup(match.group(1).decode("ascii")).name
+            except (LookupError, UnicodeDecodeError):
+                pass
+        return "utf-8"
+
+    def _apply_content_policy(self, content: dict) -> dict:
+        """TicketRecord를 만들기 전에 settings의 content 보존 정책으로 섹션을 다듬는다."""
+        crawler_cfg = getattr(self, "cfg", None) or {}
+        policy = {**settings.CONTENT_POLICY, **crawler_cfg.get("content_policy", {})}
+        return apply_content_policy(content, policy)
+
+    def _parse_html(self, html: str, region: str | None = None) -> BeautifulSoup:
+        """응답 본문을 파싱하고, 이 페이지의 파싱 시간 예산을 새로 시작한다.
+
+        region에 해당하는 parse_regions 항목이 있으면 그 영역의 서브트리만 만든다.
+        본문이 PARSE_MAX_CHARS(크롤러별 'parse_max_chars'가 있으면 그 값)를 넘으면 잘라서 파싱한다.
+        """
+        start_parse_budget()
+        crawler_cfg = getattr(self, "cfg", None) or {}
+        max_chars = crawler_cfg.get("parse_max_chars", settings.PARSE_MAX_CHARS)
+        if max_chars and len(html) > max_chars:
+            logger.warning(
+                f"[{self.__class__.__name__}] 파싱 입력 상한 {max_chars}자 초과({len(html)}자), 잘라서 파싱"
+            )
+            html = html[:max_chars]
+        strainer = self.parse_regions.get(region) if region else None
+        return BeautifulSoup(html, "html.parser", parse_only=strainer)
+
     async def _safe_fetch_list(self, session: aiohttp.ClientSession) -> List[Dict]:
         try:
             return await self._fetch_list(session)
@@ -65,9 +219,14 @@ class AsyncCrawlerBase(ABC):
             logger.error(f"[{self.__class__.__name__}] _fetch_list 실패: {type(e).__name__} - {e}")
             return []
 
-    async def _safe_fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketInfo] | None:
+    async def _safe_fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketRecord] | None:
+        # 목록 단계에서 시작된 예산이 상세 task로 복사되지 않도록 초기화한다.
+        _parse_deadline.set(None)
         try:
             return await self._fetch_detail(session, item)
+        except ParseBudgetExceeded as e:
+            logger.warning(f"[{self.__class__.__name__}] _fetch_detail 파싱 중단: {e}")
+            return None
         except Exception as e:
             logger.error(f"[{self.__class__.__name__}] _fetch_detail 실패: {type(e).__name__} - {e}")
             return None
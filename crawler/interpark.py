@@ -4,14 +4,16 @@ import re
 import json
 
 from bs4 import BeautifulSoup
-from crawler.base import AsyncCrawlerBase
+from crawler.base import AsyncCrawlerBase, check_parse_budget
 from utils.config import settings
-from models.ticket import TicketInfo
-from utils.utils import clean_cast_text, extract_open_round, extract_open_round_period, extract_performance_period, normalize_date_string, normalize_title, resolve_region
+from models.ticket import TicketRecord
+from utils.utils import clean_cast_text, extract_open_round, extract_open_round_period, extract_performance_period, is_unsupported_region, normalize_date_string, normalize_title, resolve_region
 import logging
 
 logger = logging.getLogger(__name__)
 
+_TICKET_DATES_PATTERN = re.compile(r'"ticketDates"\s*:\s*(?=\[)')
+
 
 class InterParkCrawler(AsyncCrawlerBase):
     headers = {"User-Agent": settings.USER_AGENT}
@@ -36,7 +38,9 @@ class InterParkCrawler(AsyncCrawlerBase):
                         lambda item: (
                                 (d := item.get("openDateStr")) and
                                 (open_time := datetime.strptime(d, "%Y-%m-%d %H:%M:%S")) and
-                                (self.start <= open_time <= self.end)
+                                (self.start <= open_time <= self.end) and
+                                # 제목에 비수도권 지역명이 있으면 상세 페이지와 무관하게 제외되므로 미리 거른다.
+                                not is_unsupported_region(item.get("title", ""))
                         ),
                         data,
                     ),
@@ -156,14 +160,20 @@ class InterParkCrawler(AsyncCrawlerBase):
 
         return ""
 
-    async def _fetch_detail(self, session, item: Dict[str, Any]) -> List[TicketInfo]:
+    async def _fetch_detail(self, session, item: Dict[str, Any]) -> List[TicketRecord]:
         cfg = settings.CRAWLERS['inter_park']
         notice = item["noticeId"]
         url = f"{cfg['base_url']}{cfg['detail_endpoint']}{notice}"
         async with session.get(url) as resp:
             resp.raise_for_status()
-            html = await resp.text()
-        soup = BeautifulSoup(html, "html.parser")
+            # 상세 DOM 뒤에 오는 페이지 데이터에서 ticketDates 배열까지 읽었으면,
+            # 그 뒤의 관련/추천 공지 목록은 쓰지 않으므로 읽기를 멈춘다.
+            html = await self._read_text(
+                resp,
+                stop_marker='"relatedNotices"',
+                until=lambda text: next(self._iter_ticket_dates(text), None) is not None,
+            )
+        soup = self._parse_html(html)
 
         # 상세 URL 결정
         detail_url = (
@@ -186,6 +196,8 @@ class InterParkCrawler(AsyncCrawlerBase):
                 if block:
                     content[label] = block
 
+        check_parse_budget()
+
         # 공연 정보 파싱
         perf_info = content.get(cfg["contents"]["performance_info"], "")
         cast_info = content.get(cfg["contents"]["cast"], "")
@@ -213,6 +225,7 @@ class InterParkCrawler(AsyncCrawlerBase):
         # 일정 추출 및 필터링
         schedules = []
         for box in soup.select(cfg["selectors"]["schedule_box"]):
+            check_parse_budget()
             title_tag = box.select_one(cfg["selectors"]["schedule_title"])
             date_tag = box.select_one(cfg["selectors"]["schedule_date"])
             if not title_tag or not date_tag:
@@ -247,10 +260,11 @@ class InterParkCrawler(AsyncCrawlerBase):
             logger.debug(f"[InterParkCrawler] 지역 필터 제외: title={item.get('title')!r}, venue={venue!r}")
             return []
         
-        # 모든 유효 일정에 대해 TicketInfo 생성
-        tickets: List[TicketInfo] = []
+        # 모든 유효 일정에 대해 TicketRecord 생성
+        content = self._apply_content_policy(content)
+        tickets: List[TicketRecord] = []
         for open_type, open_dt in schedules:
-            tickets.append(TicketInfo(
+            tickets.append(TicketRecord(
                 title=normalize_title(item.get("title", "-").strip()),  # 공연 제목
                 open_datetime=open_dt,  # 오픈 일시
                 round_info=round_info,  # 오픈 회차
@@ -270,23 +284,30 @@ class InterParkCrawler(AsyncCrawlerBase):
         return tickets
 
     @staticmethod
-    def _extract_ticket_dates_from_html(html: str) -> List[tuple[str, datetime]]:
-        patterns = [
-            r'"ticketDates"\s*:\s*(\[[\s\S]*?\])\s*,\s*"relatedNotices"',
-            r'"ticketDates"\s*:\s*(\[[\s\S]*?\])\s*,\s*"recommendedNotices"',
-            r'"ticketDates"\s*:\s*(\[[\s\S]*?\])',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, html)
-            if not match:
-                continue
+    def _iter_ticket_dates(html: str):
+        """"ticketDates" 배열을 JSON 디코더로 괄호 짝을 맞춰 읽는다.
+
+        지연 와일드카드 정규식(`\\[[\\s\\S]*?\\]`)은 중첩 배열에서 첫 ']'에서 잘리고,
+        뒤따르는 키를 못 찾으면 문서 끝까지 다시 훑는다. 디코더는 배열 길이만큼만 읽는다.
+        """
+        decoder = json.JSONDecoder()
+        for match in _TICKET_DATES_PATTERN.finditer(html):
             try:
-                raw_items = json.loads(match.group(1))
+                raw_items, _ = decoder.raw_decode(html, match.end())
             except json.JSONDecodeError:
                 continue
+            if isinstance(raw_items, list):
+                yield raw_items
 
-            entries: List[tuple[str, datetime]] = []
+    @staticmethod
+    def _extract_ticket_dates_from_html(html: str) -> List[tuple[str, datetime]]:
+        entries: List[tuple[str, datetime]] = []
+        for raw_items in InterParkCrawler._iter_ticket_dates(html):
+            check_parse_budget()
+            entries = []
             for item in raw_items:
+                if not isinstance(item, dict):
+                    continue
                 open_name = (item.get("openName") or item.get("name") or "").strip()
                 open_date_str = (item.get("openDateStr") or "").strip()
                 if not open_date_str:
@@ -308,6 +329,7 @@ class InterParkCrawler(AsyncCrawlerBase):
         seen = set()
         for pattern in fallback_patterns:
             for match in re.finditer(pattern, html):
+                check_parse_budget()
                 open_name = (match.group("name") or "").strip()
                 open_date_str = (match.group("date") or "").strip()
                 if not open_name or not open_date_str:
@@ -7,8 +7,8 @@ from typing import Any, Dict, List, Tuple
 import aiohttp
 from bs4 import BeautifulSoup
 
-from crawler.base import AsyncCrawlerBase
-from models.ticket import TicketInfo
+from crawler.base import AsyncCrawlerBase, check_parse_budget, start_parse_budget
+from models.ticket import TicketRecord
 from utils.config import settings
 from utils.utils import extract_cast_from_lines, extract_open_round, extract_open_round_period, extract_performance_period, normalize_title, resolve_region
 
@@ -26,7 +26,7 @@ class LGArtCrawler(AsyncCrawlerBase):
     async def _fetch_list(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         async with session.get(self.list_url, headers=self.headers) as resp:
             resp.raise_for_status()
-            html = await resp.text()
+            html = await self._read_text(resp)
 
         data = self._extract_vue_data(html, "ArticleTitles")
         items: List[Dict[str, Any]] = []
@@ -44,17 +44,24 @@ class LGArtCrawler(AsyncCrawlerBase):
             })
         return items
 
-    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict[str, Any]) -> List[TicketInfo]:
+    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict[str, Any]) -> List[TicketRecord]:
         async with session.get(item["detail_url"], headers=self.headers) as resp:
             resp.raise_for_status()
-            html = await resp.text()
-
+            # 상세 페이지는 Vue data 객체의 Article만 쓰므로, 객체가 온전히 읽히면 나머지 본문은 읽지 않는다.
+            html = await self._read_text(
+                resp,
+                stop_marker='"Article"',
+                until=lambda text: bool(self._extract_vue_data(text, "Article")),
+            )
+
+        start_parse_budget()
         data = self._extract_vue_data(html, "Article")
         article = data.get("Article", {})
         raw_title = article.get("Title") or item["title"]
         content_html = article.get("Contents") or ""
         text = BeautifulSoup(content_html, "html.parser").get_text("\n", strip=True)
 
+        check_parse_budget()
         open_dt = self._extract_open_datetime(text)
         if not open_dt or not (self.start <= open_dt <= self.end):
             return []
@@ -72,7 +79,8 @@ class LGArtCrawler(AsyncCrawlerBase):
         cast = self._extract_cast(text)
         detail_url = item["detail_url"]
 
-        return [TicketInfo(
+        content = self._apply_content_policy({"공지": text})
+        return [TicketRecord(
             title=normalize_title(title),
             open_datetime=open_dt,
             round_info=round_info,
@@ -84,7 +92,7 @@ class LGArtCrawler(AsyncCrawlerBase):
             venue=venue,
             providers={"LG 아트센터"},
             solo_sale=False,
-            content={"공지": text},
+            content=content,
             source="LG 아트센터",
             regions=region,
         )]
@@ -92,14 +100,12 @@ class LGArtCrawler(AsyncCrawlerBase):
     @staticmethod
     def _extract_vue_data(html: str, required_key: str) -> Dict[str, Any]:
         decoder = json.JSONDecoder()
-        for match in re.finditer(r"data:\s*", html):
-            start = match.end()
-            while start < len(html) and html[start].isspace():
-                start += 1
-            if start >= len(html) or html[start] != "{":
-                continue
+        # 본문을 잘라 복사하지 않고 시작 위치만 넘겨, 후보마다 문서 끝까지 복사하는 비용을 없앤다.
+        # JSON 객체로 시작할 수 없는 후보는 디코더에 넘기기 전에 거른다.
+        for match in re.finditer(r"data:\s*(?=\{\s*[\"}])", html):
+            check_parse_budget()
             try:
-                data, _ = decoder.raw_decode(html[start:])
+                data, _ = decoder.raw_decode(html, match.end())
             except json.JSONDecodeError:
                 continue
             if required_key in data:
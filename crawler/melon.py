@@ -9,14 +9,18 @@ import aiohttp
 from bs4 import BeautifulSoup, NavigableString
 from datetime import datetime
 from typing import List, Dict, Any, Tuple
-from crawler.base import AsyncCrawlerBase
+from crawler.base import AsyncCrawlerBase, check_parse_budget, region_strainer
 from utils.config import settings
-from models.ticket import TicketInfo
+from models.ticket import TicketRecord
 from utils.utils import clean_cast_text, extract_cast_from_lines, extract_open_round, extract_performance_period, normalize_date_string, normalize_title, resolve_region
 import random
 
 
 class MelonCrawler(AsyncCrawlerBase):
+    parse_regions = {
+        "list": region_strainer("list_ticket_cont", names="ul"),
+    }
+
     def __init__(self, date_range: Tuple[datetime, datetime]):
         super().__init__(date_range)
         self.cfg = settings.CRAWLERS['melon']
@@ -50,14 +54,15 @@ class MelonCrawler(AsyncCrawlerBase):
                             await asyncio.sleep(wait)
                             continue
                         resp.raise_for_status()
-                        html = await resp.text()
+                        html = await self._read_text(resp)
                         break
                 else:
                     logger.error(f"[MelonCrawler] 423 Locked 재시도 초과: genre={genre_name}, page={page}")
                     continue
-                soup = BeautifulSoup(html, 'html.parser')
+                soup = self._parse_html(html, "list")
 
                 for li in soup.select("ul.list_ticket_cont li"):
+                    check_parse_budget()
                     title_tag = li.select_one("a.tit")
                     date_tag = li.select_one("span.date")
                     if not title_tag or not date_tag:
@@ -91,7 +96,7 @@ class MelonCrawler(AsyncCrawlerBase):
             self,
             session: aiohttp.ClientSession,
             item: Dict[str, Any]
-    ) -> List[TicketInfo]:
+    ) -> List[TicketRecord]:
         cfg = self.cfg
         # 상세 페이지 URL
         href = item['title_tag']['href'].lstrip("./")
@@ -100,8 +105,8 @@ class MelonCrawler(AsyncCrawlerBase):
         headers = self._get_headers()
         async with session.get(detail_url, headers=headers) as resp:
             resp.raise_for_status()
-            html = await resp.text()
-        soup = BeautifulSoup(html, 'html.parser')
+            html = await self._read_text(resp)
+        soup = self._parse_html(html)
 
         # 기본 정보 파싱
         title_tag = soup.select_one("p.tit_consert")
@@ -115,6 +120,7 @@ class MelonCrawler(AsyncCrawlerBase):
         round_info = extract_open_round(title, round_info) or round_info or "-"
         only_sale = bool(soup.select_one(cfg['detail_selectors']['solo_icon']))
         content = self._parse_content(soup)
+        check_parse_budget()
         if not performance_period or performance_period == "-":
             performance_period = extract_performance_period(*content.values()) or "-"
         if venue == "-":
@@ -127,13 +133,14 @@ class MelonCrawler(AsyncCrawlerBase):
 
         logger.debug(f"지역 정보 org {venue}. conversion {regions}")
         
-        tickets: List[TicketInfo] = []
+        content = self._apply_content_policy(content)
+        tickets: List[TicketRecord] = []
 
         # “오픈일정 보기”인 경우, 상세 여러 일정 파싱
         if item['pass_date_check']:
             for label, od in self._parse_open_dates(soup):
                 if self.start <= od <= self.end:
-                    tickets.append(TicketInfo(
+                    tickets.append(TicketRecord(
                         title=normalize_title(title.strip()),
                         open_datetime=od,
                         round_info=round_info,
@@ -151,7 +158,7 @@ class MelonCrawler(AsyncCrawlerBase):
                     ))
         # “티켓오픈” 한 건만
         else:
-            tickets.append(TicketInfo(
+            tickets.append(TicketRecord(
                 title=normalize_title(title.strip()),
                 open_datetime=item['open_date'],
                 round_info=round_info,
@@ -5,15 +5,23 @@ from typing import List, Dict
 import logging
 
 from utils.utils import extract_cast_from_lines, extract_open_round, normalize_date_string, normalize_performance_period, normalize_title
-from models.ticket import TicketInfo
-from crawler.base import AsyncCrawlerBase
+from models.ticket import TicketRecord
+from crawler.base import AsyncCrawlerBase, check_parse_budget, region_strainer
 from utils.config import settings
 import re
 
 logger = logging.getLogger(__name__)
 
+_MONTH_PATTERN = re.compile(r"\d{1,2}월")
+_MONTH_DAY_PATTERN = re.compile(r"\d{1,2}월\s*\d{1,2}일")
+
 
 class SacCrawler(AsyncCrawlerBase):
+    # 제목, 상단 정보 목록(cwa-top), 상세 탭(ctl-sub)만 사용한다.
+    parse_regions = {
+        "detail": region_strainer("title", "cwa-top", "ctl-sub", names=["p", "div"]),
+    }
+
     def __init__(self, date_range):
         super().__init__(date_range)
         self.cfg = settings.CRAWLERS['sac']
@@ -52,14 +60,14 @@ class SacCrawler(AsyncCrawlerBase):
                 page += 1
         return results
 
-    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketInfo]:
+    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketRecord]:
         # SN, PLACE_NAME, PRICE_INFO
         url = f"{self.base_url}{self.cfg['detail_endpoint']}{item['SN']}"
         # SN 값을 URL에 추가
         async with session.get(url) as resp:
             resp.raise_for_status()
-            html = await resp.text()
-            soup = BeautifulSoup(html, "html.parser")
+            html = await self._read_text(resp)
+            soup = self._parse_html(html, "detail")
 
             title_tag = soup.find("p", class_="title")
             top_box = soup.find("div", class_="cwa-top")
@@ -94,6 +102,7 @@ class SacCrawler(AsyncCrawlerBase):
             if not schedules:
                 logger.debug(f"[SacCrawler] 오픈 일정 없음: SN={item.get('SN')}")
                 return []
+            check_parse_budget()
             # 출연진
             p_tags = tab_box[2].find_all("p")
             lines = [p.get_text(strip=True) for p in p_tags if p.get_text(strip=True)]
@@ -107,16 +116,18 @@ class SacCrawler(AsyncCrawlerBase):
             # 공연기간: 상세페이지 정보 목록의 "기간" 항목을 그대로 사용한다.
             performance_period = normalize_performance_period(contents.get("기간")) or "-"
 
-            tickets: List[TicketInfo] = []
+            intro = contents.get("소개", "")
+            contents = self._apply_content_policy(contents)
+            tickets: List[TicketRecord] = []
             for schedule in schedules:
                 if not (self.start <= schedule["datetime"] <= self.end):
                     continue
                 normalized_round_info = (
-                    extract_open_round(schedule["type"], title, contents.get("소개", ""))
+                    extract_open_round(schedule["type"], title, intro)
                     or "-"
                 )
                 # 티켓 정보 생성
-                tickets.append(TicketInfo(
+                tickets.append(TicketRecord(
                     title=normalize_title(title),
                     open_datetime=schedule["datetime"],
                     round_info=normalized_round_info,
@@ -153,19 +164,53 @@ class SacCrawler(AsyncCrawlerBase):
         return None
 
 
+    @staticmethod
+    def _search_open_date(text: str, markers: tuple[str, ...]) -> str | None:
+        """re.search(r"(마커.*?).*?(\\d{1,2}월\\s*\\d{1,2}일.*?시)", text).group(2)를 선형 시간에 구한다.
+
+        지연 와일드카드 정규식은 날짜가 없는 마커가 긴 줄에 반복되면 마커마다 줄 끝까지 다시 훑는다.
+        날짜는 마커와 같은 줄에서 시작해야 하므로 줄마다 첫 마커만 보고, "시"가 없는 줄 끝은 기억해 다시 찾지 않는다.
+        """
+        marker_pattern = re.compile("|".join(map(re.escape, markers)))
+        pos = 0
+        no_hour_from = no_hour_until = -1
+        while True:
+            marker = marker_pattern.search(text, pos)
+            if not marker:
+                return None
+            line_end = text.find("\n", marker.end())
+            if line_end < 0:
+                line_end = len(text)
+            for month in _MONTH_PATTERN.finditer(text, marker.end(), line_end):
+                month_day = _MONTH_DAY_PATTERN.match(text, month.start())
+                if not month_day:
+                    continue
+                day_end = month_day.end()
+                if no_hour_from <= day_end < no_hour_until:
+                    continue
+                day_line_end = text.find("\n", day_end)
+                if day_line_end < 0:
+                    day_line_end = len(text)
+                hour = text.find("시", day_end, day_line_end)
+                if hour >= 0:
+                    return text[month.start():hour + 1]
+                no_hour_from, no_hour_until = day_end, day_line_end
+            pos = line_end + 1
+
     def _parse_schedule(self, html) -> List[Dict[str, str]]:
         """일정 파싱"""
         schedule = []
         text = html.get_text(separator="\n")
 
         patterns = [
-            ("선예매", re.search(r"(유료회원.*?|선예매).*?(\d{1,2}월\s*\d{1,2}일.*?시)", text)),
-            ("일반예매", re.search(r"(일반회원.*?|일반예매).*?(\d{1,2}월\s*\d{1,2}일.*?시)", text))
+            ("선예매", self._search_open_date(text, ("유료회원", "선예매"))),
+            ("일반예매", self._search_open_date(text, ("일반회원", "일반예매"))),
         ]
 
-        for label, match in patterns:
-            if match:
-                dt = self._extract_datetime_string(match.group(2))
+        for label, date_text in patterns:
+            if date_text:
+                check_parse_budget()
+                dt = self._extract_datetime_string(date_text)
                 if dt is None:
                     continue
                 schedule.append({
@@ -4,8 +4,8 @@ from typing import Dict, Any, List
 
 from bs4 import BeautifulSoup
 
-from crawler.base import AsyncCrawlerBase
-from models.ticket import TicketInfo
+from crawler.base import AsyncCrawlerBase, check_parse_budget, region_strainer
+from models.ticket import TicketRecord
 from utils import extract_cast_from_lines, extract_open_round, extract_performance_period, normalize_date_string, normalize_title
 from utils.config import settings
 from html import unescape
@@ -18,6 +18,10 @@ logger = logging.getLogger(__name__)
 
 
 class SejongPac(AsyncCrawlerBase):
+    parse_regions = {
+        "list": region_strainer("tbl_list", names="div"),
+    }
+
     def __init__(self, date_range):
         super().__init__(date_range)
         self.cfg = settings.CRAWLERS['sejong_pac']
@@ -66,8 +70,8 @@ class SejongPac(AsyncCrawlerBase):
 
             async with session.get(self.list_url, params=payload) as response:
                 response.raise_for_status()
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                html = await self._read_text(response)
+                soup = self._parse_html(html, "list")
                 rows = soup.select("div.tbl_list > table > tbody > tr")
                 for row in rows:
                     cols = row.find_all("td")
@@ -97,14 +101,14 @@ class SejongPac(AsyncCrawlerBase):
                     })
         return items
 
-    async def _fetch_detail(self, session, item: Dict[str, Any]) -> List[TicketInfo]:
-        tickets: List[TicketInfo] = []
+    async def _fetch_detail(self, session, item: Dict[str, Any]) -> List[TicketRecord]:
+        tickets: List[TicketRecord] = []
 
         content = {}
         async with session.get(item["link"]) as response:
             response.raise_for_status()
-            detail_html = await response.text()
-        soup = BeautifulSoup(detail_html, "html.parser")
+            detail_html = await self._read_text(response)
+        soup = self._parse_html(detail_html)
         category = venue = cast = performance_period = None;
         open_type = "일반예매"
         title = item["title"]
@@ -130,6 +134,7 @@ class SejongPac(AsyncCrawlerBase):
                 return []
             open_lines = self.parse_td_with_paragraphs_or_list(open_td)
             for line in open_lines:
+                check_parse_budget()
                 # 먼저 날짜 문자열을 표준 포맷(YYYY년 MM월 DD일 HH:MM)으로 정규화
                 nds = normalize_date_string(line)
                 m = re.search(
@@ -202,6 +207,7 @@ class SejongPac(AsyncCrawlerBase):
                 info_lines = self.parse_td_with_paragraphs_or_list(info_td)
 
             for line in info_lines:
+                check_parse_budget()
                 if "공연명" in line:
                     title = normalize_title(line.split("공연명")[-1].strip(": ： ·").strip())
                     if "연극" in title:
@@ -235,21 +241,24 @@ class SejongPac(AsyncCrawlerBase):
                 cast = self.extract_cast_from_td(intro_td)
 
         # (6) 티켓정보 생성
+        # 공연 기간은 다듬기 전의 전체 content에서 찾는다.
+        performance_period = (
+            performance_period
+            or extract_performance_period(*content.values())
+            or (round_raw if round_raw and not round_label_from_raw else None)
+            or "-"
+        )
+        content = self._apply_content_policy(content)
         for open_item in open_entries:
             open_dt = open_item["time"]
             if not (self.start <= open_dt <= self.end):
                 continue
 
-            tickets.append(TicketInfo(
+            tickets.append(TicketRecord(
                 title=title,  # 공연 제목
                 open_datetime=open_dt,  # 오픈 일시
                 round_info=extract_open_round(open_item["target"], title) or round_label_from_raw or round_raw or "-",  # 오픈 회차
-                performance_period=(
-                    performance_period
-                    or extract_performance_period(*content.values())
-                    or (round_raw if round_raw and not round_label_from_raw else None)
-                    or "-"
-                ),  # 공연 기간
+                performance_period=performance_period,  # 공연 기간
                 cast=cast or "-",  # 출연진
                 detail_url=item["link"],  # 상세 링크
                 category=category or "-",  # 구분
@@ -5,8 +5,8 @@ from bs4 import BeautifulSoup
 import re
 import logging
 
-from crawler.base import AsyncCrawlerBase
-from models.ticket import TicketInfo
+from crawler.base import AsyncCrawlerBase, check_parse_budget
+from models.ticket import TicketRecord
 from utils.config import settings
 from utils.utils import clean_cast_text, extract_cast_from_lines, extract_open_round, extract_open_round_period, normalize_title, resolve_region
 
@@ -64,7 +64,7 @@ class TicketLinkCrawler(AsyncCrawlerBase):
         logger.debug(f"[TicketLinkCrawler] Finished fetching list. Total items collected: {len(results)}")
         return results
 
-    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketInfo]:
+    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict) -> List[TicketRecord]:
         notice_id = item.get("noticeId")
         if not notice_id:
             return []
@@ -99,7 +99,7 @@ class TicketLinkCrawler(AsyncCrawlerBase):
             category = notice.get("noticeCategoryName") or "티켓오픈"
 
         content_html = notice.get("content") or ""
-        body_soup = BeautifulSoup(content_html, "html.parser")
+        body_soup = self._parse_html(content_html)
         body_text = body_soup.get_text("\n", strip=True)
         period = self._pick_performance_period(body_text) or "-"
         open_round = extract_open_round_period(body_text) or extract_open_round(title_text, body_text) or "-"
@@ -108,6 +108,7 @@ class TicketLinkCrawler(AsyncCrawlerBase):
         open_type = "일반예매" if reserveWebUrl  else "티켓오픈"
         logger.debug(f"[TicketLinkCrawler] 오픈 타입 reserveWebUrl={reserveWebUrl}, open_type={open_type}")
 
+        check_parse_budget()
         cast_str = self.extract_cast_from_body(body_soup)
 
         sections = self._extract_sections_from_body(body_soup)
@@ -131,7 +132,8 @@ class TicketLinkCrawler(AsyncCrawlerBase):
             logger.debug(f"[TicketLinkCrawler] ticketOpenDatetime 파싱 실패: noticeId={notice_id} - {ts!r}")
             return []
 
-        ticket = TicketInfo(
+        sections = self._apply_content_policy(sections)
+        ticket = TicketRecord(
             title=normalize_title(title_text),
             open_datetime=open_dt,
             round_info=open_round,
@@ -6,15 +6,20 @@ from typing import Any, Dict, List, Tuple
 import aiohttp
 from bs4 import BeautifulSoup
 
-from crawler.base import AsyncCrawlerBase
-from models.ticket import TicketInfo
+from crawler.base import AsyncCrawlerBase, check_parse_budget, region_strainer
+from models.ticket import TicketRecord
 from utils.config import settings
-from utils.utils import extract_cast_from_lines, extract_open_round, extract_open_round_period, extract_performance_period, normalize_title, resolve_region
+from utils.utils import extract_cast_from_lines, extract_open_round, extract_open_round_period, extract_performance_period, is_unsupported_region, normalize_title, resolve_region
 
 logger = logging.getLogger(__name__)
 
 
 class Yes24Crawler(AsyncCrawlerBase):
+    # 공지 제목(단독판매 표시), 예매 버튼, 본문 섹션만 사용한다.
+    parse_regions = {
+        "detail": region_strainer("noti-view-coment", "noti-vt-tit", "noti-vt-btns"),
+    }
+
     def __init__(self, date_range: Tuple[datetime, datetime]):
         super().__init__(date_range)
         self.cfg = settings.CRAWLERS["yes24"]
@@ -30,9 +35,9 @@ class Yes24Crawler(AsyncCrawlerBase):
             payload = {**self.cfg["params"], "page": str(page)}
             async with session.post(self.list_url, data=payload, headers=self.headers) as resp:
                 resp.raise_for_status()
-                html = await resp.text()
+                html = await self._read_text(resp)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._parse_html(html)
             rows = soup.select("div.noti-tbl table tbody tr")
             if len(rows) <= 1:
                 break
@@ -57,6 +62,9 @@ class Yes24Crawler(AsyncCrawlerBase):
                 raw_title = title_link.get_text(" ", strip=True)
                 solo_sale = "단독판매" in raw_title
                 title_for_region = raw_title.replace("단독판매", "").strip()
+                # 제목에 비수도권 지역명이 있으면 상세 페이지와 무관하게 제외되므로 상세 요청 전에 거른다.
+                if is_unsupported_region(title_for_region):
+                    continue
                 title = normalize_title(title_for_region)
 
                 for open_type, open_dt in self._extract_open_entries(cells[2]):
@@ -73,7 +81,7 @@ class Yes24Crawler(AsyncCrawlerBase):
 
         return results
 
-    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict[str, Any]) -> List[TicketInfo]:
+    async def _fetch_detail(self, session: aiohttp.ClientSession, item: Dict[str, Any]) -> List[TicketRecord]:
         payload = {
             "bId": item["notice_id"],
             "genre": "",
@@ -82,12 +90,13 @@ class Yes24Crawler(AsyncCrawlerBase):
         }
         async with session.post(self.detail_url, data=payload, headers=self.headers) as resp:
             resp.raise_for_status()
-            html = await resp.text()
+            html = await self._read_text(resp)
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse_html(html, "detail")
         content = self._extract_sections(soup)
         overview = self._pick_first_section(content, "공연 개요", "공연개요", "개요")
         page_text = soup.get_text("\n", strip=True)
+        check_parse_budget()
 
         title = self._pick_first_overview_value(overview, "공연 제목", "공연명") or item["title"]
         # "오픈 회차"/"오픈 기간"/"N차 티켓오픈 기간" 라벨은 공지 본문(공연 개요 밖)에
@@ -109,7 +118,8 @@ class Yes24Crawler(AsyncCrawlerBase):
         solo_sale = item["solo_sale"] or bool(soup.select_one(".noti-vt-tit span"))
         product_url = self._extract_product_url(soup) or item["notice_url"]
 
-        return [TicketInfo(
+        content = self._apply_content_policy(content)
+        return [TicketRecord(
             title=normalize_title(title),
             open_datetime=item["open_datetime"],
             round_info=round_info,
@@ -1,9 +1,15 @@
+import asyncio
+import sys
+
 from notion_writer.writer import NotionRepository
 
-def main():
+
+async def main():
+    # --changed: 지난 동기화 이후 추가/이름이 바뀐 배우·작품이 나오는 티켓 페이지만 다시 본다.
+    only_changed = "--changed" in sys.argv[1:]
     # NotionRepository 인스턴스 생성
-    repo = NotionRepository()
-    repo.sync_existing_ticket_relations()
+    async with NotionRepository() as repo:
+        await repo.sync_existing_ticket_relations(only_changed=only_changed)
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,4 +1,4 @@
 # merge/__init__.py
-from .merge import merge_ticket_sources
+from .merge import TicketMerger, merge_ticket_sources
 
-__all__ = ["merge_ticket_sources"]
+__all__ = ["TicketMerger", "merge_ticket_sources"]
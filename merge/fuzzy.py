@@ -0,0 +1,128 @@
+"""병합 키가 정확히 같지는 않지만 같은 공연으로 보이는 티켓 쌍을 찾는다.
+
+모든 쌍을 비교하면 O(n²)이므로 (오픈 시간 구간, 제목 글자 2-gram)을 블록 키로 삼아
+같은 블록을 공유하는 후보끼리만 점수를 매긴다.
+"""
+import math
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+
+def title_grams(merge_title: str) -> FrozenSet[str]:
+    """공백을 뺀 병합용 제목의 글자 2-gram. 띄어쓰기 차이는 점수에 영향을 주지 않는다."""
+    compact = merge_title.replace(" ", "")
+    if len(compact) < 2:
+        return frozenset((compact,)) if compact else frozenset()
+    return frozenset(compact[idx:idx + 2] for idx in range(len(compact) - 1))
+
+
+def dice(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return 2 * len(left & right) / (len(left) + len(right))
+
+
+def find_near_duplicates(
+    entries: Sequence[Tuple[str, datetime, Set[str]]],
+    threshold: float,
+    tolerance_minutes: int,
+    max_block: int,
+) -> List[Tuple[float, int, int]]:
+    """(병합 제목, 오픈 일시, 예매처) 목록에서 같은 공연으로 보이는 (점수, i, j) 쌍을 돌려준다.
+
+    - 오픈 일시 차이가 tolerance_minutes 이하이고, 예매처가 겹치지 않는 쌍만 본다.
+      같은 예매처 안에서 비슷한 제목은 회차/지역이 다른 별개 공연일 가능성이 높다.
+    - Dice 점수가 threshold 이상이려면 제목 A의 2-gram 중 최소 need(A)개가 상대와 겹쳐야 하므로,
+      A의 2-gram 중 아무거나 |A| - need(A) + 1개만 블록에서 찾아도 그런 상대는 반드시 후보에 든다.
+      그래서 max_block보다 큰 블록(흔한 글자쌍)은 작은 블록만으로 그 개수를 채울 수 있을 때만 건너뛰고,
+      모자라면 큰 블록 중 작은 것부터 더 찾는다. 어느 경우든 모든 쌍을 비교한 결과와 같다.
+    """
+    if threshold <= 0 or not entries:
+        return []
+
+    window = max(1, tolerance_minutes) * 60
+    tolerance = tolerance_minutes * 60
+    grams = [title_grams(title) for title, _, _ in entries]
+    stamps = [open_dt.timestamp() for _, open_dt, _ in entries]
+    buckets = [int(stamp // window) for stamp in stamps]
+
+    blocks: Dict[Tuple[int, str], List[int]] = defaultdict(list)
+    for idx, (bucket, item_grams) in enumerate(zip(buckets, grams)):
+        for gram in item_grams:
+            blocks[(bucket, gram)].append(idx)
+
+    pairs: List[Tuple[float, int, int]] = []
+    for idx, (bucket, item_grams) in enumerate(zip(buckets, grams)):
+        if not item_grams:
+            continue
+        size = len(item_grams)
+        # 2|A∩B| >= t(|A|+|B|)이고 |B| >= |A∩B|이면 |A∩B| >= t|A|/(2-t)이다.
+        rate = min(threshold, 1.0)
+        need = min(size, max(1, math.ceil(rate * size / (2 - rate) - 1e-9)))
+        probe_count = size - need + 1
+        probed, oversized = [], []
+        for gram in item_grams:
+            block_size = sum(len(blocks.get((near, gram), ())) for near in (bucket - 1, bucket, bucket + 1))
+            (probed if block_size <= max_block else oversized).append((block_size, gram))
+        if len(probed) < probe_count:
+            probed += sorted(oversized)[:probe_count - len(probed)]
+
+        shared: Dict[int, int] = defaultdict(int)
+        for _, gram in probed:
+            for near in (bucket - 1, bucket, bucket + 1):
+                for other in blocks.get((near, gram), ()):
+                    if other > idx:
+                        shared[other] += 1
+
+        unprobed = size - len(probed)
+        for other, count in shared.items():
+            other_size = len(grams[other])
+            # 찾지 않은 글자쌍까지 모두 공유했다고 가정해도 임계값에 못 미치면 교집합을 계산하지 않는다.
+            if 2 * min(count + unprobed, size, other_size) < threshold * (size + other_size):
+                continue
+            if abs(stamps[idx] - stamps[other]) > tolerance:
+                continue
+            if entries[idx][2] & entries[other][2]:
+                continue
+            score = dice(item_grams, grams[other])
+            if score >= threshold:
+                pairs.append((score, idx, other))
+    return pairs
+
+
+def group_near_duplicates(
+    entries: Sequence[Tuple[str, datetime, Set[str]]],
+    threshold: float,
+    tolerance_minutes: int,
+    max_block: int,
+) -> Dict[int, List[int]]:
+    """점수가 높은 쌍부터 묶어 {대표 인덱스: [흡수할 인덱스, ...]}를 돌려준다.
+
+    대표는 그룹에서 가장 먼저 들어온 항목이고, 예매처가 겹치는 그룹끼리는 합치지 않는다.
+    """
+    parent = list(range(len(entries)))
+    providers = [set(item[2]) for item in entries]
+
+    def find(idx: int) -> int:
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    pairs = find_near_duplicates(entries, threshold, tolerance_minutes, max_block)
+    pairs.sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+    for _, left, right in pairs:
+        left, right = find(left), find(right)
+        if left == right or providers[left] & providers[right]:
+            continue
+        root, child = min(left, right), max(left, right)
+        parent[child] = root
+        providers[root] |= providers[child]
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for idx in range(len(entries)):
+        root = find(idx)
+        if root != idx:
+            groups[root].append(idx)
+    return dict(groups)
@@ -1,9 +1,10 @@
-from collections import defaultdict
 from datetime import datetime
-from typing import List, OrderedDict, Tuple
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
 
-from models.ticket import TicketInfo
+from models.ticket import CONTENT_STORE, TicketRecord
+from utils.config import settings
 from utils.utils import extract_open_round, normalize_title, normalize_title_for_merge
+from .fuzzy import group_near_duplicates
 
 
 def _title_score(title: str) -> tuple[int, int, int]:
@@ -22,9 +23,142 @@ def _text_score(value: str) -> tuple[int, int]:
     return int(bool(value and value != "-")), len(value or "")
 
 
-def merge_ticket_sources(tickets: List[TicketInfo]) -> List[TicketInfo]:
-    merged: "OrderedDict[Tuple[str, datetime], TicketInfo]" = OrderedDict()
-    for tk in tickets:
+def _present_score(value: str) -> tuple[int]:
+    return (int(bool(value) and value != "-"),)
+
+
+def _round_pick_score(round_info: str) -> tuple[int, int, int]:
+    # '-'는 어떤 회차에도 진다.
+    return (int(round_info != "-"),) + _round_score(round_info)
+
+
+# 점수로 고르는 필드와 그 점수 함수. 점수가 같으면 _rank가 앞서는 티켓의 값을 남긴다.
+_SCORED_FIELDS = (
+    ("title", _title_score),
+    ("round_info", _round_pick_score),
+    ("performance_period", _text_score),
+    ("venue", _present_score),
+    ("cast", _present_score),
+    ("content_ref", _present_score),
+)
+_CAST_PICK = 1 + [name for name, _ in _SCORED_FIELDS].index("cast")
+# 나머지 필드는 _rank가 가장 앞서는 티켓 하나에서 그대로 가져온다.
+_RECORD_FIELDS = ("open_datetime", "source", "detail_url", "category", "open_type", "solo_sale", "ical_url", "regions")
+
+
+def _rank(tk: TicketRecord) -> Tuple[int, str, str]:
+    """점수가 같은 티켓 사이의 순서. 티켓이 들어온 순서와 무관하다.
+
+    MERGE_PROVIDER_PRIORITY에서 앞선 예매처가 먼저이고, 예매처가 같으면 상세 링크로 비교한다.
+    목록에 없는 예매처는 맨 뒤에 두고 이름으로 비교한다.
+    """
+    priority = settings.MERGE_PROVIDER_PRIORITY
+    position = priority.index(tk.source) if tk.source in priority else len(priority)
+    return position, tk.detail_url, tk.source
+
+
+def _record_values(tk: TicketRecord) -> tuple:
+    return (tk.open_datetime.isoformat(),) + tuple(getattr(tk, name) for name in _RECORD_FIELDS[1:])
+
+
+def _scores(tk: TicketRecord) -> list:
+    return [()] + [score(getattr(tk, name)) for name, score in _SCORED_FIELDS]
+
+
+def _picks(tk: TicketRecord, ranks: "Sequence[tuple] | None" = None) -> list:
+    """필드별 선택 키 (점수, _rank). [레코드 필드 키, _SCORED_FIELDS 순서의 키...]이다.
+
+    ranks를 주지 않으면 tk 한 건의 키이고, 주면 필드마다 그 값을 가져온 티켓의 _rank를 쓴다.
+    """
+    if ranks is None:
+        ranks = [_rank(tk)] * (1 + len(_SCORED_FIELDS))
+    return list(zip(_scores(tk), ranks))
+
+
+def _better(pick: tuple, current: tuple, value: Any, current_value: Any) -> bool:
+    """점수가 높은 쪽, 같으면 _rank가 앞서는 쪽, 그것도 같으면 값이 작은 쪽이 낫다."""
+    if pick != current:
+        return pick[0] > current[0] or (pick[0] == current[0] and pick[1] < current[1])
+    return value < current_value
+
+
+def _absorb(target: TicketRecord, picks: list, tk: TicketRecord, tk_picks: list) -> None:
+    """같은 공연으로 판단된 tk의 정보를 target에 합친다.
+
+    필드마다 선택 키(picks, tk_picks)가 나은 쪽 값을 남기고 picks를 갱신하므로,
+    여러 티켓을 어떤 순서로 합쳐도 결과가 같다.
+    """
+    target.providers |= tk.providers
+    target.detail_url_all |= tk.detail_url_all
+    target.open_type_all |= tk.open_type_all
+    if tk_picks[0] != picks[0]:
+        take_record = tk_picks[0][1] < picks[0][1]
+    else:
+        # 예매처와 상세 링크까지 같으면 값 자체로 고른다.
+        take_record = _record_values(tk) < _record_values(target)
+    if take_record:
+        for name in _RECORD_FIELDS:
+            setattr(target, name, getattr(tk, name))
+        picks[0] = tk_picks[0]
+    for idx, (name, _) in enumerate(_SCORED_FIELDS, 1):
+        value = getattr(tk, name)
+        if _better(tk_picks[idx], picks[idx], value, getattr(target, name)):
+            setattr(target, name, value)
+            picks[idx] = tk_picks[idx]
+
+
+_STATE_VERSION = 2
+_SET_FIELDS = frozenset({"open_type_all", "providers", "detail_url_all"})
+
+
+def _record_to_row(tk: TicketRecord) -> list:
+    row = []
+    for name in TicketRecord.__slots__:
+        value = getattr(tk, name)
+        if name in _SET_FIELDS:
+            value = sorted(value)
+        elif name == "open_datetime":
+            value = value.isoformat()
+        row.append(value)
+    return row
+
+
+def _record_from_row(row: Sequence[Any]) -> TicketRecord:
+    values = []
+    for name, value in zip(TicketRecord.__slots__, row):
+        if name in _SET_FIELDS:
+            value = set(value)
+        elif name == "open_datetime":
+            value = datetime.fromisoformat(value)
+        values.append(value)
+    return TicketRecord.from_rows([values])[0]
+
+
+class TicketMerger:
+    """크롤러 결과가 들어오는 대로 병합 상태를 갱신하는 증분 병합기.
+
+    키 인덱스, 키별 필드 선택 키, 병합 제목별 최고 출연진을 삽입할 때마다 갱신하므로
+    모든 크롤러를 기다렸다가 한꺼번에 병합할 필요가 없다. expected에 크롤러 이름을 주면
+    finish()로 모두 보고됐는지(ready) 확인한 뒤 snapshot()으로 결과를 내보낼 수 있다.
+    같은 값을 고를 때는 점수 다음으로 _rank(예매처 우선순위, 상세 링크 순)를 보므로, 티켓을 넣는 순서가 달라도 결과가 같다.
+
+    크롤러를 여러 프로세스/머신으로 나눠 돌릴 때는 샤드마다 병합한 뒤 to_state()로 넘기고,
+    from_state()로 되살려 combine()으로 합친다. 결합/교환 법칙이 성립해 어떤 순서와 묶음으로 합쳐도 된다.
+    """
+
+    def __init__(self, expected: Iterable[str] = ()):
+        self._merged: Dict[Tuple[str, str], TicketRecord] = {}
+        # 키별 필드 선택 키(_picks). 비교할 때마다 다시 계산하지 않는다.
+        self._picks: Dict[Tuple[str, str], list] = {}
+        # 병합 제목별 (출연진 점수, 출연진을 가져온 티켓의 _rank, 출연진). _better로 고른다.
+        self._best_cast: Dict[str, Tuple[tuple, tuple, str]] = {}
+        self._expected = set(expected)
+        self._finished: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._merged)
+
+    def add(self, tk: TicketRecord) -> None:
         # 1) source를 providers에 포함
         tk.providers.add(tk.source)
         tk.detail_url_all.add(tk.detail_url)
@@ -35,36 +169,144 @@ def merge_ticket_sources(tickets: List[TicketInfo]) -> List[TicketInfo]:
         merge_title = normalize_title_for_merge(normalized_title)
         tk.title = normalized_title
         key = (merge_title, tk.open_datetime.strftime("%Y-%m-%d %H:%M"))
+        self._fold(key, tk, _picks(tk))
 
-        if key in merged:
-            # 이미 있으면 providers만 합친다
-            if _title_score(normalized_title) > _title_score(merged[key].title):
-                merged[key].title = normalized_title
-            merged[key].providers |= tk.providers
-            merged[key].detail_url_all |= tk.detail_url_all
-            merged[key].open_type_all |= tk.open_type_all
-            if tk.round_info != "-" and _round_score(tk.round_info) > _round_score(merged[key].round_info):
-                merged[key].round_info = tk.round_info
-            if _text_score(tk.performance_period) > _text_score(merged[key].performance_period):
-                merged[key].performance_period = tk.performance_period
-            if merged[key].venue == "-" and tk.venue != "-":
-                merged[key].venue = tk.venue
-            if merged[key].cast == "-" and tk.cast != "-":
-                merged[key].cast = tk.cast
-            if not merged[key].content and tk.content:
-                merged[key].content = tk.content
-        else:
+    def _fold(self, key: Tuple[str, str], tk: TicketRecord, picks: list) -> None:
+        """키 하나의 부분 결과(티켓 한 건이어도 된다)와 그 필드 선택 키를 현재 상태에 합친다."""
+        target = self._merged.get(key)
+        if target is None:
             # 처음 보는 조합이면 복제하지 않고 그대로 저장
-            merged[key] = tk
-
-    # 같은 공연이지만 오픈 회차(오픈 일시)가 달라 별도 항목으로 남은 경우,
-    # 회차 중 한 곳에서라도 출연진 정보를 찾았다면 나머지 빈 항목에도 채워준다.
-    best_cast_by_title: dict[str, str] = {}
-    for (merge_title, _), tk in merged.items():
-        if _text_score(tk.cast) > _text_score(best_cast_by_title.get(merge_title, "-")):
-            best_cast_by_title[merge_title] = tk.cast
-    for (merge_title, _), tk in merged.items():
-        if tk.cast == "-" and best_cast_by_title.get(merge_title, "-") != "-":
-            tk.cast = best_cast_by_title[merge_title]
-
-    return list(merged.values())
+            self._merged[key] = target = tk
+            self._picks[key] = picks
+        else:
+            # 이미 있으면 providers 등 정보만 합친다
+            _absorb(target, self._picks[key], tk, picks)
+        self._offer_cast(self._best_cast, key[0], tk.cast, picks[_CAST_PICK][1])
+
+    def combine(self, other: "TicketMerger") -> "TicketMerger":
+        """other의 부분 병합 상태를 합친다.
+
+        필드마다 점수와 _rank로 값을 고르므로 샤드를 어떤 순서와 묶음으로 합쳐도
+        모든 티켓을 한 프로세스에서 add한 결과와 같다. other는 이후 쓰지 않는다.
+        """
+        for key, tk in other._merged.items():
+            self._fold(key, tk, other._picks[key])
+        for merge_title, (_, rank, cast) in other._best_cast.items():
+            self._offer_cast(self._best_cast, merge_title, cast, rank)
+        self._expected |= other._expected
+        self._finished |= other._finished
+        return self
+
+    def to_state(self) -> Dict[str, Any]:
+        """다른 프로세스로 넘길 수 있는 JSON 직렬화 가능한 부분 병합 상태. content 본문도 함께 담는다."""
+        entries = []
+        contents = {}
+        for key, tk in self._merged.items():
+            # 점수는 레코드 값에서 다시 구할 수 있으므로 필드마다 값을 가져온 티켓의 _rank만 담는다.
+            # 대개 한두 티켓 것이므로 한 번씩만 담고 번호로 가리킨다.
+            ranks: List[tuple] = []
+            picks = []
+            for _, rank in self._picks[key]:
+                if rank not in ranks:
+                    ranks.append(rank)
+                picks.append(ranks.index(rank))
+            entries.append({
+                "key": list(key),
+                "record": _record_to_row(tk),
+                "ranks": [list(rank) for rank in ranks],
+                "picks": picks,
+            })
+            if tk.content_ref and tk.content_ref not in contents:
+                contents[tk.content_ref] = CONTENT_STORE.get(tk.content_ref)
+        return {
+            "version": _STATE_VERSION,
+            "expected": sorted(self._expected),
+            "finished": sorted(self._finished),
+            "entries": entries,
+            # 키 안에서 밀린 출연진도 다른 회차를 채울 수 있으므로 따로 넘긴다.
+            "best_cast": {merge_title: [list(rank), cast] for merge_title, (_, rank, cast) in self._best_cast.items()},
+            "contents": contents,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "TicketMerger":
+        if state.get("version") != _STATE_VERSION:
+            raise ValueError(f"지원하지 않는 병합 상태 버전: {state.get('version')}")
+        for content in state["contents"].values():
+            CONTENT_STORE.put(content)
+        merger = cls(expected=state["expected"])
+        merger._finished.update(state["finished"])
+        for entry in state["entries"]:
+            ranks = [tuple(rank) for rank in entry["ranks"]]
+            tk = _record_from_row(entry["record"])
+            merger._fold(tuple(entry["key"]), tk, _picks(tk, [ranks[idx] for idx in entry["picks"]]))
+        for merge_title, (rank, cast) in state["best_cast"].items():
+            merger._offer_cast(merger._best_cast, merge_title, cast, tuple(rank))
+        return merger
+
+    @staticmethod
+    def _offer_cast(best_cast: dict, merge_title: str, cast: str, rank: tuple) -> None:
+        if cast == "-":
+            return
+        candidate = (_text_score(cast), rank, cast)
+        current = best_cast.get(merge_title)
+        if current is None or _better(candidate[:2], current[:2], cast, current[2]):
+            best_cast[merge_title] = candidate
+
+    def add_many(self, tickets: Iterable[TicketRecord]) -> "TicketMerger":
+        for tk in tickets:
+            self.add(tk)
+        return self
+
+    def finish(self, name: str) -> None:
+        """이름이 name인 크롤러가 결과를 모두 넘겼음을 기록한다."""
+        self._finished.add(name)
+
+    @property
+    def ready(self) -> bool:
+        return self._expected <= self._finished
+
+    def snapshot(self) -> List[TicketRecord]:
+        """현재까지의 병합 결과를 오픈 일시, 병합 제목 순으로 돌려준다. 병합기 상태는 바꾸지 않으므로 이후에도 계속 add할 수 있다.
+
+        정확한 키로 합쳐지지 않은 예매처 간 중복을 후보 블록 안에서만 비교해 합치고,
+        같은 공연의 다른 회차에서 찾은 출연진을 빈 항목에 채운다.
+        """
+        keys = sorted(self._merged, key=lambda key: (key[1], key[0]))
+        records = [self._merged[key] for key in keys]
+        groups = group_near_duplicates(
+            [(key[0], tk.open_datetime, tk.providers) for key, tk in zip(keys, records)],
+            threshold=settings.MERGE_FUZZY_THRESHOLD,
+            tolerance_minutes=settings.MERGE_FUZZY_TIME_TOLERANCE_MINUTES,
+            max_block=settings.MERGE_FUZZY_MAX_BLOCK,
+        )
+        absorbed = {idx for members in groups.values() for idx in members}
+        best_cast = dict(self._best_cast)
+        out: List[Tuple[str, TicketRecord]] = []
+        for idx, (key, tk) in enumerate(zip(keys, records)):
+            if idx in absorbed:
+                continue
+            members = groups.get(idx)
+            if members:
+                # 대표 항목은 복제해서 합치므로 병합기 내부 레코드는 그대로 남는다.
+                tk = tk.copy(
+                    providers=set(tk.providers),
+                    detail_url_all=set(tk.detail_url_all),
+                    open_type_all=set(tk.open_type_all),
+                )
+                picks = list(self._picks[key])
+                for member in members:
+                    _absorb(tk, picks, records[member], self._picks[keys[member]])
+                self._offer_cast(best_cast, key[0], tk.cast, picks[_CAST_PICK][1])
+            out.append((key[0], tk))
+
+        # 같은 공연이지만 오픈 회차(오픈 일시)가 달라 별도 항목으로 남은 경우,
+        # 회차 중 한 곳에서라도 출연진 정보를 찾았다면 나머지 빈 항목에도 채워준다.
+        return [
+            tk.copy(cast=best_cast[merge_title][2]) if tk.cast == "-" and merge_title in best_cast else tk
+            for merge_title, tk in out
+        ]
+
+
+def merge_ticket_sources(tickets: List[TicketRecord]) -> List[TicketRecord]:
+    return TicketMerger().add_many(tickets).snapshot()
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import mmap
+import tempfile
+from typing import Dict, Optional, Tuple
+
+
+class ContentStore:
+    """TicketRecord.content 섹션을 내용 해시로 한 번만 저장하는 저장소.
+
+    한 상세 페이지에서 나온 티켓들은 같은 content를 공유하므로, 티켓은 해시(ref)만 들고
+    본문은 Notion 블록을 만들 때 get()으로 꺼낸다. 본문은 직렬화한 bytes로 저장하고 get()마다 새 dict로
+    풀어 주므로, 넣은 dict나 꺼낸 dict를 고쳐도 저장된 본문(과 해시)은 바뀌지 않는다.
+    메모리 사용량이 max_memory_bytes를 넘으면 이후 본문은 임시 파일에 써 두고 mmap으로 읽는다.
+    """
+
+    def __init__(self, max_memory_bytes: Optional[int] = None):
+        self.max_memory_bytes = max_memory_bytes
+        self.memory_bytes = 0
+        self._blobs: Dict[str, bytes] = {}
+        self._spilled: Dict[str, Tuple[int, int]] = {}
+        self._spill_file = None
+        self._spill_size = 0
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return len(self._blobs) + len(self._spilled)
+
+    def __contains__(self, ref: str) -> bool:
+        return ref in self._blobs or ref in self._spilled
+
+    @staticmethod
+    def _encode(content: dict) -> bytes:
+        # 섹션 순서도 페이지 본문 순서이므로 정렬하지 않고 (키, 값) 순서 그대로 직렬화한다.
+        return json.dumps(list(content.items()), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def content_hash(encoded: bytes) -> str:
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def put(self, content: dict) -> str:
+        if not content:
+            return ""
+        encoded = self._encode(content)
+        ref = self.content_hash(encoded)
+        if ref not in self:
+            if self.max_memory_bytes is not None and self.memory_bytes + len(encoded) > self.max_memory_bytes:
+                self._spill(ref, encoded)
+            else:
+                self._blobs[ref] = encoded
+                self.memory_bytes += len(encoded)
+        return ref
+
+    def get(self, ref: str) -> dict:
+        if not ref:
+            return {}
+        encoded = self._blobs.get(ref)
+        if encoded is None:
+            offset, length = self._spilled[ref]
+            if self._mmap is None or len(self._mmap) < offset + length:
+                self._remap()
+            encoded = self._mmap[offset:offset + length]
+        return dict(json.loads(encoded.decode("utf-8")))
+
+    def _spill(self, ref: str, encoded: bytes) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="ticket_content_")
+        self._spill_file.seek(self._spill_size)
+        self._spill_file.write(encoded)
+        self._spilled[ref] = (self._spill_size, len(encoded))
+        self._spill_size += len(encoded)
+
+    def _remap(self) -> None:
+        self._spill_file.flush()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._spill_file.fileno(), self._spill_size, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
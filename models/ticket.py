@@ -1,6 +1,16 @@
-from pydantic import BaseModel, Field, ConfigDict
+import logging
+
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationError
 from datetime import datetime
-from typing import Set
+from typing import Any, Dict, Iterable, List, Sequence, Set
+
+from models.content_store import ContentStore
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 크롤링 중 모인 content 본문은 여기 한 번씩만 저장되고, 티켓은 해시 참조만 가진다.
+CONTENT_STORE = ContentStore(max_memory_bytes=settings.CONTENT_STORE_MAX_MEMORY_MB * 1024 * 1024)
 
 
 class TicketInfo(BaseModel):
@@ -20,7 +30,135 @@ class TicketInfo(BaseModel):
     providers: Set[str] = Field(default_factory=set, alias="예매처")
     solo_sale: bool = Field(False, alias="단독 판매")
     content: dict = Field(default_factory=dict, alias="내용")
+    # content 본문의 CONTENT_STORE 해시. content가 비어 있으면 블록을 만들 때 이 값으로 본문을 꺼낸다.
+    content_ref: str = Field("", alias="내용 해시")
     source: str = Field(..., alias="예매처 구분(원본)")
     detail_url_all: Set[str] = Field(default_factory=set, alias="상세 링크")
     ical_url: str = Field("", alias="등록 링크")
     regions: str = Field("", alias="지역")
+
+
+class TicketRecord:
+    """크롤링 → 병합 구간에서 쓰는 가벼운 티켓 레코드.
+
+    TicketInfo와 필드 이름/기본값이 같지만 검증과 별칭 처리를 하지 않는다.
+    Notion writer에 들어갈 때 validate_tickets()로 한 번만 TicketInfo로 검증한다.
+    content는 CONTENT_STORE에 넣고 해시(content_ref)만 보관하며, 읽을 때 저장소에서 꺼낸다.
+    """
+
+    __slots__ = (
+        "title", "open_datetime", "round_info", "performance_period", "cast", "detail_url", "category",
+        "open_type", "open_type_all", "venue", "providers", "solo_sale", "content_ref", "source",
+        "detail_url_all", "ical_url", "regions",
+    )
+
+    def __init__(
+            self,
+            *,
+            title: str,
+            open_datetime: datetime,
+            source: str,
+            round_info: str = "-",
+            performance_period: str = "-",
+            cast: str = "-",
+            detail_url: str = "-",
+            category: str = "-",
+            open_type: str = "-",
+            open_type_all: Set[str] | None = None,
+            venue: str = "-",
+            providers: Set[str] | None = None,
+            solo_sale: bool = False,
+            content: dict | None = None,
+            detail_url_all: Set[str] | None = None,
+            ical_url: str = "",
+            regions: str = "",
+    ):
+        self.title = title
+        self.open_datetime = open_datetime
+        self.round_info = round_info
+        self.performance_period = performance_period
+        self.cast = cast
+        self.detail_url = detail_url
+        self.category = category
+        self.open_type = open_type
+        self.open_type_all = set() if open_type_all is None else open_type_all
+        self.venue = venue
+        self.providers = set() if providers is None else providers
+        self.solo_sale = solo_sale
+        self.content_ref = CONTENT_STORE.put(content) if content else ""
+        self.source = source
+        self.detail_url_all = set() if detail_url_all is None else detail_url_all
+        self.ical_url = ical_url
+        self.regions = regions
+
+    @property
+    def content(self) -> dict:
+        return CONTENT_STORE.get(self.content_ref)
+
+    @content.setter
+    def content(self, value: dict) -> None:
+        self.content_ref = CONTENT_STORE.put(value) if value else ""
+
+    def __repr__(self) -> str:
+        return f"TicketRecord(title={self.title!r}, open_datetime={self.open_datetime!r}, source={self.source!r})"
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> List["TicketRecord"]:
+        """__slots__ 순서의 튜플 목록으로 레코드를 한꺼번에 만든다. 키워드 처리와 기본값 분기를 건너뛴다."""
+        new = object.__new__
+        records = []
+        append = records.append
+        for (title, open_datetime, round_info, performance_period, cast, detail_url, category, open_type,
+             open_type_all, venue, providers, solo_sale, content_ref, source, detail_url_all, ical_url, regions) in rows:
+            record = new(cls)
+            record.title = title
+            record.open_datetime = open_datetime
+            record.round_info = round_info
+            record.performance_period = performance_period
+            record.cast = cast
+            record.detail_url = detail_url
+            record.category = category
+            record.open_type = open_type
+            record.open_type_all = open_type_all
+            record.venue = venue
+            record.providers = providers
+            record.solo_sale = solo_sale
+            record.content_ref = content_ref
+            record.source = source
+            record.detail_url_all = detail_url_all
+            record.ical_url = ical_url
+            record.regions = regions
+            append(record)
+        return records
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def copy(self, **changes: Any) -> "TicketRecord":
+        record = object.__new__(type(self))
+        for name in self.__slots__:
+            setattr(record, name, changes[name] if name in changes else getattr(self, name))
+        return record
+
+
+_TICKET_LIST_ADAPTER = TypeAdapter(List[TicketInfo])
+
+
+def validate_tickets(tickets: Iterable["TicketRecord | TicketInfo"]) -> List[TicketInfo]:
+    """병합된 레코드를 writer 경계에서 TicketInfo로 검증한다.
+
+    보통은 목록 전체를 한 번에 검증하고, 잘못된 레코드가 섞여 있으면 레코드마다 다시 검증해
+    그 레코드만 로그를 남기고 뺀다(예전에 상세 수집 단계에서 한 건씩 버리던 것과 같다).
+    """
+    rows = [ticket if isinstance(ticket, TicketInfo) else ticket.to_dict() for ticket in tickets]
+    try:
+        return _TICKET_LIST_ADAPTER.validate_python(rows)
+    except ValidationError:
+        pass
+    valid = []
+    for row in rows:
+        try:
+            valid.append(row if isinstance(row, TicketInfo) else TicketInfo.model_validate(row))
+        except ValidationError as ex:
+            logger.error(f"❌ 티켓 검증 실패로 제외: {row.get('title')!r} ({row.get('source')}) - {ex}")
+    return valid
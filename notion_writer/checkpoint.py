@@ -0,0 +1,82 @@
+import json
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SyncCheckpoint:
+    """오래 걸리는 동기화에서 끝낸 페이지 ID를 파일에 남겨, 중간에 죽어도 이어서 하게 한다.
+
+    signature는 동기화 결과를 좌우하는 입력(이름 맵 등)의 요약이다. 저장된 값과 다르면
+    이전 진행분은 버리고 처음부터 한다. save_every건마다 저장하고, 끝까지 마치면 clear()로 지운다.
+    파일은 JSON Lines로, 첫 줄({"signature", "done"}) 뒤에 저장할 때마다 새로 끝낸 ID 목록을 한 줄씩 덧붙인다.
+    """
+
+    def __init__(self, path: Optional[str], signature: str, save_every: int = 200):
+        self.path = path
+        self.signature = signature
+        self.save_every = save_every
+        self.done: set[str] = set()
+        # 마지막 저장 이후 끝낸 ID
+        self._unsaved: list[str] = []
+        # 이번 실행에서 첫 줄을 새로 썼는지. 쓰기 전에는 이어 붙이지 않고 파일 전체를 다시 쓴다.
+        self._started = False
+
+    def load(self) -> int:
+        """이전 진행분을 읽고, 이어받은 페이지 수를 돌려준다."""
+        if not self.path:
+            return 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return 0
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # 쓰다가 끊긴 마지막 줄
+                continue
+        if not records or not isinstance(records[0], dict):
+            return 0
+        if records[0].get("signature") != self.signature:
+            logger.info("동기화 입력이 바뀌어 이전 체크포인트를 버립니다.")
+            return 0
+        self.done = set(records[0].get("done", []))
+        for batch in records[1:]:
+            self.done.update(batch)
+        return len(self.done)
+
+    def mark(self, page_id: str) -> None:
+        self.done.add(page_id)
+        self._unsaved.append(page_id)
+        if len(self._unsaved) >= self.save_every:
+            self.save()
+
+    def save(self) -> None:
+        if not self.path or not self._unsaved:
+            return
+        if self._started:
+            # 저장마다 전체를 다시 쓰면 페이지 수의 제곱으로 느려지므로 새로 끝낸 ID만 덧붙인다.
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(self._unsaved) + "\n")
+        else:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"signature": self.signature, "done": sorted(self.done)}) + "\n")
+            os.replace(tmp_path, self.path)
+            self._started = True
+        self._unsaved = []
+
+    def clear(self) -> None:
+        self.done.clear()
+        self._unsaved = []
+        self._started = False
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
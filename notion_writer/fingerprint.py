@@ -0,0 +1,108 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+# 페이지 속성 한 칸에 저장되므로 Notion rich_text 한도(2000자)를 넘지 않게 한다.
+MAX_FINGERPRINT_CHARS = 2000
+_VERSION = "v1"
+
+
+def short_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass(frozen=True)
+class PageFingerprint:
+    """Notion 페이지에 기록해 두는 속성/본문 지문.
+
+    props는 지문 속성을 뺀 페이지 속성 전체의 해시, sections는 본문 섹션별 (해시, 블록 수)이다.
+    블록 수를 함께 적어 두면 기존 블록 목록을 섹션 단위로 나눠 바뀐 섹션만 교체할 수 있다.
+    body는 sections 전체의 해시, blocks는 본문 블록 수로, sections에서 계산한다.
+    섹션이 너무 많아 sections를 기록하지 못한 지문은 sections가 None이고 body/blocks만 남는다.
+    layout은 본문 배치 방식('flat' 또는 'container'), container는 본문을 담은 컨테이너 블록 ID다.
+    op는 페이지를 만든 쓰기 작업의 저널 ID로, 응답을 받지 못한 생성이 반영됐는지 찾을 때 쓴다.
+    같은 내용인지는 props, body, layout으로 비교한다.
+    """
+
+    props: str
+    sections: Optional[Tuple[Tuple[str, int], ...]] = field(compare=False)
+    layout: str = "flat"
+    container: str = field(default="", compare=False)
+    body: str = ""
+    blocks: int = field(default=0, compare=False)
+    op: str = field(default="", compare=False)
+
+    def __post_init__(self):
+        if self.sections is not None:
+            object.__setattr__(self, "body", short_hash(_sections_text(self.sections)))
+            object.__setattr__(self, "blocks", sum(count for _, count in self.sections))
+
+    @classmethod
+    def build(
+            cls,
+            properties: dict,
+            sections: Sequence[Tuple[str, List[dict]]],
+            layout: str = "flat",
+    ) -> "PageFingerprint":
+        props = short_hash(json.dumps(properties, sort_keys=True, ensure_ascii=False, default=str))
+        return cls(
+            props=props,
+            sections=tuple(
+                (short_hash(json.dumps([key, blocks], sort_keys=True, ensure_ascii=False)), len(blocks))
+                for key, blocks in sections
+            ),
+            layout=layout,
+        )
+
+    @property
+    def block_count(self) -> int:
+        return self.blocks
+
+    def dump(self) -> str:
+        tail = f"|l={self.layout}|c={self.container}" if self.layout != "flat" else ""
+        if self.op:
+            tail += f"|o={self.op}"
+        text = f"{_VERSION}|p={self.props}|s=" + _sections_text(self.sections or ()) + tail
+        if self.sections is None or len(text) > MAX_FINGERPRINT_CHARS:
+            # 섹션이 너무 많으면 섹션별 정보 대신 본문 전체 해시와 블록 수만 기록한다.
+            # 본문이 그대로면 여전히 건너뛰고, 바뀌면 섹션 단위가 아니라 본문 전체를 교체한다.
+            return f"{_VERSION}|p={self.props}|s=*{self.body}:{self.blocks}{tail}"
+        return text
+
+    @classmethod
+    def parse(cls, text: str) -> Optional["PageFingerprint"]:
+        try:
+            version, props, sections, *extra = text.split("|")
+            if version != _VERSION or not props.startswith("p=") or not sections.startswith("s="):
+                return None
+            body = sections[2:]
+            fields = dict(item.split("=", 1) for item in extra)
+            if body.startswith("*"):
+                digest, count = body[1:].split(":")
+                return cls(
+                    props=props[2:],
+                    sections=None,
+                    layout=fields.get("l", "flat"),
+                    container=fields.get("c", ""),
+                    body=digest,
+                    blocks=int(count),
+                    op=fields.get("o", ""),
+                )
+            parsed = tuple(
+                (digest, int(count))
+                for digest, count in (item.split(":") for item in body.split(",") if item)
+            )
+        except ValueError:
+            return None
+        return cls(
+            props=props[2:],
+            sections=parsed,
+            layout=fields.get("l", "flat"),
+            container=fields.get("c", ""),
+            op=fields.get("o", ""),
+        )
+
+
+def _sections_text(sections: Sequence[Tuple[str, int]]) -> str:
+    return ",".join(f"{digest}:{count}" for digest, count in sections)
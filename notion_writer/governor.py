@@ -0,0 +1,119 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 숫자가 작을수록 먼저 보낸다. 페이지 생성/수정이 대량 relation 동기화보다 앞선다.
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_BULK = 2
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 바꾼다. 없거나 잘못되면 None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateGovernor:
+    """모든 Notion 호출이 거치는 전역 토큰 버킷.
+
+    초당 rate개의 토큰이 burst개까지 쌓이고, 호출마다 하나씩 쓴다. 토큰을 기다리는 호출은
+    우선순위 → 도착 순서대로 깨운다. 429를 받으면 pause()로 Retry-After 동안 모든 호출을 멈춘다.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int = 1,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.stats: Counter = Counter()
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _delay(self, now: float) -> float:
+        """지금 토큰 하나를 쓰려면 더 기다려야 하는 시간(초)."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate <= 0 or self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self, priority: int = PRIORITY_READ) -> None:
+        now = self._clock()
+        self._refill(now)
+        self.stats["calls"] += 1
+        if not self._waiters and self._delay(now) == 0:
+            self._tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        self.stats["waits"] += 1
+        await future
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            now = self._clock()
+            self._refill(now)
+            delay = self._delay(now)
+            if delay > 0:
+                self.stats["wait_seconds"] += delay
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # 기다리다 취소된 호출은 토큰을 쓰지 않는다.
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+            # 깨운 호출이 먼저 실행되도록 한 번 양보한다.
+            await asyncio.sleep(0)
+
+    def pause(self, seconds: float) -> None:
+        """429 응답을 받았을 때 모든 호출을 seconds 동안 멈추고, 이후 토큰도 비운 상태로 시작한다."""
+        self.stats["rate_limited"] += 1
+        until = self._clock() + seconds
+        if until > self._paused_until:
+            logger.warning(f"Notion API 레이트리밋 - 전체 호출을 {seconds:.1f}초 멈춤")
+            self._paused_until = until
+        self._tokens = min(self._tokens, 0.0)
+
+
+# 프로세스 전체가 공유하는 governor. 저장소 인스턴스가 여러 개여도 한 버킷을 쓴다.
+NOTION_GOVERNOR = RateGovernor(settings.NOTION_RATE_PER_SEC, settings.NOTION_RATE_BURST)
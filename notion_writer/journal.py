@@ -0,0 +1,177 @@
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JournalKey = Tuple[str, str]
+
+
+class WriteJournal:
+    """write_all이 보낼 Notion 쓰기를 먼저 적어 두는 로그(JSON Lines, 선행 기록).
+
+    티켓 하나의 기록은 (제목, 오픈 일시) 키로 묶인 부분 갱신 줄들이며, 읽을 때 키별로 합친다.
+    - begin: 쓰기 전에 지문/대상 페이지/티켓 내용을 적는다(status=pending).
+    - set_create: 페이지 생성을 보내기 직전에 생성 작업 ID(op)를 적고 바로 디스크에 내린다.
+    - set_page: 새 페이지를 만들었으면 바로 페이지 ID를 적는다.
+    - finish: 모든 호출이 끝나면 status=done.
+    fsync는 sync_every줄마다 모아서 한다. 마지막 묶음이 사라져도 재시도가 같은 결과를 내도록 writer가
+    끝나지 않은 키의 페이지는 지문을 믿지 않고 다시 쓰므로, 기록이 조금 늦게 남는 것은 괜찮다.
+
+    begin은 시도 횟수(attempts)를 하나 늘리고 처음 적은 시각(first_seen)을 남긴다. load()는 max_attempts번
+    시도하고도 끝나지 않았거나 max_age_hours보다 오래된 작업을 더 잇지 않고 `{path}.parked`로 옮긴다(0이면 제한 없음).
+    park()로 반영 여부를 확인할 수 없는 작업을 바로 옮길 수도 있다.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            database_id: str,
+            sync_every: int = 20,
+            max_attempts: int = 0,
+            max_age_hours: float = 0.0,
+            clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.database_id = database_id
+        self.sync_every = max(1, sync_every)
+        self.max_attempts = max_attempts
+        self.max_age_seconds = max_age_hours * 3600
+        self._clock = clock
+        self.entries: Dict[JournalKey, dict] = {}
+        self._file = None
+        self._unsynced = 0
+
+    def load(self) -> Dict[JournalKey, dict]:
+        """이전 실행이 남긴 기록을 읽어 끝나지 않은 작업(키 → 합친 기록)을 돌려준다."""
+        self.entries = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return {}
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 쓰다가 끊긴 마지막 줄
+                continue
+            if "database_id" in record:
+                if record["database_id"] != self.database_id:
+                    # 다른 DB에 쓰던 기록은 이어 쓸 수 없다.
+                    self.entries = {}
+                    break
+                continue
+            key = tuple(record.pop("key"))
+            self.entries.setdefault(key, {}).update(record)
+        self._park_stale()
+        # 끊긴 줄 뒤에 이어 쓰지 않도록 끝나지 않은 작업만 남겨 새로 쓴다.
+        self._rewrite()
+        return self.unfinished()
+
+    def _park_stale(self) -> None:
+        """시도 횟수나 기간 제한을 넘긴 끝나지 않은 작업을 parked 파일로 옮기고 entries에서 뺀다."""
+        now = self._clock()
+        parked = []
+        for key, entry in self.unfinished().items():
+            attempts = entry.get("attempts", 0)
+            age = now - entry.get("first_seen", now)
+            if self.max_attempts > 0 and attempts >= self.max_attempts:
+                reason = f"{attempts}번 시도"
+            elif self.max_age_seconds > 0 and age > self.max_age_seconds:
+                reason = f"{age / 3600:.1f}시간 경과"
+            else:
+                continue
+            parked.append((key, reason))
+        for key, reason in parked:
+            self.park(key, reason)
+
+    def park(self, key: JournalKey, reason: str) -> None:
+        """작업을 더 잇지 않도록 parked 파일로 옮기고 entries에서 뺀다."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        logger.warning(f"📒 끝나지 않은 쓰기를 더 잇지 않고 보류합니다({reason}): {key[0]} ({key[1]})")
+        record = {"key": list(key), **entry, "parked_at": self._clock(), "reason": reason}
+        with open(f"{self.path}.parked", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def unfinished(self) -> Dict[JournalKey, dict]:
+        return {key: entry for key, entry in self.entries.items() if entry.get("status") != "done"}
+
+    def page_id(self, key: JournalKey) -> Optional[str]:
+        return self.entries.get(key, {}).get("page")
+
+    def create_op(self, key: JournalKey) -> Optional[str]:
+        """이전 시도가 보냈을 수 있는 페이지 생성의 작업 ID. 페이지 ID를 받았으면 None이다."""
+        entry = self.entries.get(key, {})
+        return None if entry.get("page") else entry.get("op")
+
+    def begin(self, key: JournalKey, fingerprint: str, page_id: Optional[str], ticket: dict) -> None:
+        previous = self.entries.get(key, {})
+        if previous.get("status") == "done":
+            previous = {}
+        self._append(key, {
+            "status": "pending", "fingerprint": fingerprint, "page": page_id, "ticket": ticket,
+            "attempts": previous.get("attempts", 0) + 1, "first_seen": previous.get("first_seen", self._clock()),
+            "op": previous.get("op"),
+        })
+
+    def set_create(self, key: JournalKey, op: str) -> None:
+        # 생성이 반영됐는데 이 줄이 사라지면 다음 실행이 같은 페이지를 또 만들 수 있으므로 바로 내린다.
+        self._append(key, {"op": op})
+        self.sync()
+
+    def set_page(self, key: JournalKey, page_id: Optional[str]) -> None:
+        self._append(key, {"page": page_id})
+
+    def finish(self, key: JournalKey) -> None:
+        # 끝난 작업은 티켓 내용을 다시 읽을 일이 없으므로 메모리에서도 뺀다.
+        self._append(key, {"status": "done", "ticket": None})
+
+    def _append(self, key: JournalKey, record: dict) -> None:
+        self.entries.setdefault(key, {}).update(record)
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            if self._file.tell() == 0:
+                self._file.write(json.dumps({"database_id": self.database_id}) + "\n")
+        self._file.write(json.dumps({"key": list(key), **record}, ensure_ascii=False) + "\n")
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        if self._file is None or not self._unsynced:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """남은 줄을 디스크에 내리고, 끝나지 않은 작업만 남도록 로그를 다시 쓴다(모두 끝났으면 지운다)."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._rewrite()
+
+    def _rewrite(self) -> None:
+        pending = self.unfinished()
+        if not pending:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"database_id": self.database_id}) + "\n")
+            for key, entry in pending.items():
+                f.write(json.dumps({"key": list(key), **entry}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.entries = dict(pending)
@@ -0,0 +1,120 @@
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+def sync_point(now: float) -> str:
+    """지금 시작하는 조회의 동기화 시각(UTC). 조회 전에 잡아야 조회 중 수정분을 놓치지 않는다.
+
+    Notion의 last_edited_time은 분 단위로 내림되므로 동기화 시각도 분 단위로 내린다.
+    """
+    moment = datetime.fromtimestamp(now, timezone.utc)
+    return (moment - timedelta(seconds=moment.second, microseconds=moment.microsecond)).isoformat()
+
+
+def last_edited_filter(synced_at: str) -> dict:
+    """synced_at 이후(같은 분 포함) 수정된 페이지만 고르는 query filter."""
+    return {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": synced_at}}
+
+
+class NotionMetadataCache:
+    """실행 간에 유지하는 Notion 메타데이터 캐시.
+
+    DB ID → data source ID와, 배우/작품 DB의 페이지 ID → 이름을 JSON 파일 하나에 담는다.
+    이름 맵은 마지막 동기화 시각을 함께 기록해 다음 실행에서는 그 이후 수정된 페이지만 읽는다.
+    삭제(휴지통으로 이동)된 페이지는 변경 조회에 나오지 않으므로 ttl_hours가 지나면 캐시 전체를 버리고 다시 읽는다.
+    path가 None이면 파일 없이 한 실행 안에서만 쓴다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[str], ttl_hours: float, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self._clock = clock
+        self._data = self._empty()
+        self._dirty = False
+
+    def _empty(self) -> dict:
+        return {"version": self.VERSION, "created_at": self._clock(), "data_sources": {}, "name_maps": {}}
+
+    def load(self) -> None:
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.VERSION:
+            return
+        age = self._clock() - float(data.get("created_at", 0))
+        if age > self.ttl_seconds:
+            logger.info(f"Notion 메타데이터 캐시 만료({age / 3600:.1f}시간 경과) - 전체를 다시 읽습니다.")
+            return
+        self._data = data
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def data_source_id(self, database_id: str) -> Optional[str]:
+        return self._data["data_sources"].get(database_id)
+
+    def set_data_source_id(self, database_id: str, data_source_id: str) -> None:
+        if self._data["data_sources"].get(database_id) != data_source_id:
+            self._data["data_sources"][database_id] = data_source_id
+            self._dirty = True
+
+    def sync_point(self) -> str:
+        return sync_point(self._clock())
+
+    @staticmethod
+    def _name_key(database_id: str, name_property: str) -> str:
+        return f"{database_id}:{name_property}"
+
+    def name_synced_at(self, database_id: str, name_property: str) -> Optional[str]:
+        """이름 맵의 마지막 동기화 시각. 캐시에 없으면 None(전체 조회 필요)."""
+        entry = self._data["name_maps"].get(self._name_key(database_id, name_property))
+        return entry["synced_at"] if entry else None
+
+    def apply_name_pages(
+            self, database_id: str, name_property: str, pages: Iterable[dict], synced_at: str, full: bool = False
+    ) -> int:
+        """조회한 페이지를 이름 맵에 반영하고 반영한 페이지 수를 돌려준다. full이면 기존 내용을 버린다."""
+        key = self._name_key(database_id, name_property)
+        entry = self._data["name_maps"].get(key)
+        if full or entry is None:
+            entry = {"synced_at": synced_at, "pages": {}}
+            self._data["name_maps"][key] = entry
+        names = entry["pages"]
+        count = 0
+        for page in pages:
+            count += 1
+            # 이름이 바뀐 페이지가 뒤쪽 우선순위를 갖도록 지우고 다시 넣는다.
+            names.pop(page["id"], None)
+            if page.get("in_trash") or page.get("archived"):
+                continue
+            title = page.get("properties", {}).get(name_property, {}).get("title") or []
+            if title:
+                names[page["id"]] = title[0]["plain_text"]
+        entry["synced_at"] = synced_at
+        self._dirty = True
+        return count
+
+    def name_map(self, database_id: str, name_property: str) -> dict:
+        """이름 → 페이지 ID. 같은 이름이 여럿이면 나중에 반영된 페이지가 남는다."""
+        entry = self._data["name_maps"].get(self._name_key(database_id, name_property)) or {"pages": {}}
+        return {name: page_id for page_id, name in entry["pages"].items()}
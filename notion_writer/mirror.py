@@ -0,0 +1,200 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from notion_writer.metadata_cache import sync_point
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 미러에 담는 티켓 DB 속성. 지문 속성 이름은 설정값이라 따로 받는다.
+MIRROR_PROPERTIES = ("공연 제목", "오픈 일시", "출연진", "출연 배우", "관련 작품")
+
+
+def local_open_iso(start: str) -> str:
+    """Notion date.start를 기본 시간대의 초 단위 ISO 문자열로 바꾼다. 미러와 페이지 색인의 키로 쓴다."""
+    dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=settings.DEFAULT_TIMEZONE)
+    return dt.astimezone(settings.DEFAULT_TIMEZONE).isoformat(timespec="seconds")
+
+
+def _plain_text(prop: dict, kind: str) -> str:
+    return "".join(part.get("plain_text", "") for part in (prop or {}).get(kind) or [])
+
+
+def _rich_text(text: str) -> list:
+    return [{"type": "text", "text": {"content": text}, "plain_text": text}] if text else []
+
+
+class TicketMirror:
+    """티켓 DB에서 writer/follow 동기화가 읽는 속성만 담아 두는 로컬 SQLite 미러.
+
+    apply()에 넘기는 페이지는 Notion 조회 결과 그대로이며, 처음과 full_sync_hours가 지난 뒤에는
+    전체 조회 결과로 미러를 새로 만들고, 그 사이에는 last_edited_time 변경분만 덮어쓴다.
+    휴지통으로 옮긴 페이지는 변경 조회에 나오지 않으므로 다음 전체 조회 때 빠진다.
+    읽을 때는 Notion 조회 결과와 같은 모양의 페이지 dict로 돌려주어 기존 코드가 그대로 쓸 수 있다.
+    """
+
+    SCHEMA_VERSION = "1"
+
+    def __init__(
+            self,
+            path: str,
+            database_id: str,
+            fingerprint_property: Optional[str],
+            full_sync_hours: float,
+            clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.database_id = database_id
+        self.fingerprint_property = fingerprint_property
+        self.full_sync_seconds = full_sync_hours * 3600
+        self._clock = clock
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS pages (
+                    page_id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    open_at TEXT,
+                    cast_text TEXT NOT NULL,
+                    actor_ids TEXT NOT NULL,
+                    work_ids TEXT NOT NULL,
+                    relations_complete INTEGER NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    last_edited_time TEXT
+                );
+                CREATE INDEX IF NOT EXISTS pages_open_at ON pages (open_at);
+                """
+            )
+            # 다른 DB나 이전 형식의 미러면 비우고 전체 조회부터 다시 한다.
+            if (self._meta("database_id"), self._meta("schema")) != (self.database_id, self.SCHEMA_VERSION):
+                with self._conn:
+                    self._conn.execute("DELETE FROM pages")
+                    self._conn.execute("DELETE FROM meta")
+                    self._set_meta("database_id", self.database_id)
+                    self._set_meta("schema", self.SCHEMA_VERSION)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def synced_at(self) -> Optional[str]:
+        """변경분 조회의 기준 시각. 미러가 없거나 전체 조회 주기가 지났으면 None."""
+        full_synced = float(self._meta("full_synced") or 0)
+        if self._clock() - full_synced > self.full_sync_seconds:
+            return None
+        return self._meta("synced_at")
+
+    def sync_point(self) -> str:
+        return sync_point(self._clock())
+
+    def apply(self, pages: Iterable[dict], synced_at: str, full: bool = False) -> int:
+        """조회한 페이지를 미러에 반영하고 반영한 페이지 수를 돌려준다. full이면 기존 내용을 버린다."""
+        rows, trashed = [], []
+        for page in pages:
+            if page.get("in_trash") or page.get("archived"):
+                trashed.append((page["id"],))
+            else:
+                rows.append(self._row(page))
+        conn = self.conn
+        with conn:
+            if full:
+                conn.execute("DELETE FROM pages")
+                self._set_meta("full_synced", repr(self._clock()))
+            conn.executemany("DELETE FROM pages WHERE page_id = ?", trashed)
+            conn.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._set_meta("synced_at", synced_at)
+        return len(rows) + len(trashed)
+
+    def _row(self, page: dict) -> tuple:
+        props = page.get("properties", {})
+        start = (props.get("오픈 일시", {}).get("date") or {}).get("start")
+        actors = props.get("출연 배우") or {}
+        works = props.get("관련 작품") or {}
+        return (
+            page["id"],
+            _plain_text(props.get("공연 제목"), "title"),
+            local_open_iso(start) if start else None,
+            _plain_text(props.get("출연진"), "rich_text"),
+            json.dumps([rel["id"] for rel in actors.get("relation") or []]),
+            json.dumps([rel["id"] for rel in works.get("relation") or []]),
+            # relation이 25개를 넘으면 조회 결과가 잘리므로(has_more) 비교에 쓰지 않도록 표시한다.
+            int(not actors.get("has_more") and not works.get("has_more")),
+            _plain_text(props.get(self.fingerprint_property), "rich_text") if self.fingerprint_property else "",
+            page.get("last_edited_time"),
+        )
+
+    def _page(self, row: tuple) -> dict:
+        page_id, title, open_at, cast_text, actor_ids, work_ids, complete, fingerprint, edited = row
+        properties = {
+            "공연 제목": {"title": _rich_text(title)},
+            "오픈 일시": {"date": {"start": open_at} if open_at else None},
+            "출연진": {"rich_text": _rich_text(cast_text)},
+            "출연 배우": {"relation": [{"id": rel} for rel in json.loads(actor_ids)], "has_more": not complete},
+            "관련 작품": {"relation": [{"id": rel} for rel in json.loads(work_ids)], "has_more": not complete},
+        }
+        if self.fingerprint_property:
+            properties[self.fingerprint_property] = {"rich_text": _rich_text(fingerprint)}
+        return {"id": page_id, "last_edited_time": edited, "properties": properties}
+
+    def pages(self) -> Iterator[dict]:
+        for row in self.conn.execute("SELECT * FROM pages ORDER BY rowid"):
+            yield self._page(row)
+
+    def pages_between(self, start: str, end: str) -> list[dict]:
+        """오픈 일시가 [start, end]인 페이지. 두 값 모두 local_open_iso 형식이어야 한다."""
+        rows = self.conn.execute(
+            "SELECT * FROM pages WHERE open_at BETWEEN ? AND ? ORDER BY rowid", (start, end)
+        )
+        return [self._page(row) for row in rows]
+
+    def find(self, title: str, open_at: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT * FROM pages WHERE title = ? AND open_at = ? ORDER BY rowid LIMIT 1", (title, open_at)
+        ).fetchone()
+        return self._page(row) if row else None
+
+    def set_relations(self, updates: Iterable[Tuple[str, Optional[list], Optional[list]]]) -> None:
+        """이 저장소가 relation을 바꾼 뒤 미러도 맞춘다. updates는 (페이지 ID, 배우 ID 목록, 작품 ID 목록)이며
+        None인 쪽은 그대로 둔다. 한 트랜잭션으로 반영한다."""
+        updates = list(updates)
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE pages SET actor_ids = ? WHERE page_id = ?",
+                [(json.dumps(actor_ids), page_id) for page_id, actor_ids, _ in updates if actor_ids is not None],
+            )
+            self.conn.executemany(
+                "UPDATE pages SET work_ids = ? WHERE page_id = ?",
+                [(json.dumps(work_ids), page_id) for page_id, _, work_ids in updates if work_ids is not None],
+            )
+
+    def forget(self, page_id: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM pages WHERE page_id = ?", (page_id,))
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
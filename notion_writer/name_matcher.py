@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from typing import Iterable, List
+
+from utils.matcher import KeywordAutomaton
+
+
+def _is_word_char(ch: str) -> bool:
+    # 정규식 \w와 같은 기준(유니코드 문자/숫자와 밑줄)
+    return ch.isalnum() or ch == "_"
+
+
+class NameMatcher:
+    """배우/작품 이름 목록을 한 번만 자동자로 만들어 두고 본문에서 찾는다.
+
+    word_boundary=True면 `(?<!\\w)이름(?!\\w)` 정규식과 같이 이름 앞뒤가 단어 문자가 아닐 때만 매칭하고,
+    False면 단순 부분 문자열 포함 여부로 판단한다. 같은 본문은 여러 번 조회되므로 결과를 LRU로 기억한다.
+    """
+
+    def __init__(self, names: Iterable[str], word_boundary: bool = True, cache_size: int = 4096):
+        self.word_boundary = word_boundary
+        self._automaton = KeywordAutomaton(names)
+        self._cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def find(self, text: str) -> List[str]:
+        """text에 나오는 이름을 처음 나온 순서대로 중복 없이 돌려준다."""
+        if not text:
+            return []
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return list(cached)
+
+        found: "OrderedDict[str, None]" = OrderedDict()
+        for start, name in self._automaton.iter_matches(text):
+            if name in found:
+                continue
+            if self.word_boundary:
+                end = start + len(name)
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]):
+                    continue
+            found[name] = None
+
+        names = list(found)
+        self._cache[text] = names
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return list(names)
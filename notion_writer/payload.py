@@ -0,0 +1,51 @@
+import re
+from bisect import bisect_left
+from typing import Iterator, List, Sequence
+
+# Notion 요청 한 번의 children 배열에 넣을 수 있는 최대 블록 수
+MAX_BLOCKS_PER_REQUEST = 100
+# rich_text 한 칸의 최대 길이(UTF-16 코드 단위)
+MAX_TEXT_UNITS = 2000
+
+# BMP 밖 문자(이모지 등)는 UTF-16에서 2 단위를 차지한다.
+_ASTRAL_PATTERN = re.compile("[\U00010000-\U0010FFFF]")
+
+
+def utf16_len(text: str) -> int:
+    return len(text) + sum(1 for _ in _ASTRAL_PATTERN.finditer(text))
+
+
+def chunk_text(text: str, limit: int = MAX_TEXT_UNITS) -> List[str]:
+    """text를 UTF-16 기준 limit 단위 이하 조각으로 나눈다.
+
+    글자마다 길이를 세지 않고, BMP 밖 문자 위치만 모아 두고 슬라이스 위치를 계산한다.
+    조각 뒤쪽 절반 안에 줄바꿈이 있으면 그 줄바꿈까지 잘라 문단이 중간에 끊기지 않게 한다.
+    """
+    if not text:
+        return [""]
+    astral = [match.start() for match in _ASTRAL_PATTERN.finditer(text)]
+    size = len(text)
+    chunks = []
+    start = 0
+    while start < size:
+        end = min(size, start + limit)
+        if astral:
+            # 글자 k개를 빼면 k~2k 단위가 줄어드므로, 초과분의 절반씩 줄여 한도에 최대 1단위 차이로 맞춘다.
+            first = bisect_left(astral, start)
+            while end > start + 1:
+                excess = (end - start) + (bisect_left(astral, end) - first) - limit
+                if excess <= 0:
+                    break
+                end -= (excess + 1) // 2
+        if end < size:
+            newline = text.rfind("\n", start + (end - start) // 2, end)
+            if newline != -1:
+                end = newline + 1
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+
+def batched(blocks: Sequence[dict], size: int = MAX_BLOCKS_PER_REQUEST) -> Iterator[Sequence[dict]]:
+    for start in range(0, len(blocks), size):
+        yield blocks[start:start + size]
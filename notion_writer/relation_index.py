@@ -0,0 +1,98 @@
+"""티켓 페이지의 출연진/제목을 배우·작품 이름으로 거꾸로 찾는 색인.
+
+배우나 작품이 새로 생기거나 이름이 바뀌었을 때 전체 티켓을 다시 매칭하지 않고,
+그 이름이 나올 수 있는 페이지만 골라 relation을 다시 계산하는 데 쓴다.
+색인은 후보를 넓게 잡을 뿐이므로 최종 판정은 NameMatcher로 다시 한다.
+"""
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# NameMatcher의 단어 경계(유니코드 문자/숫자와 밑줄)와 같은 기준으로 자른 토큰
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _plain_text(prop: dict, kind: str) -> str:
+    return "".join(part.get("plain_text", "") for part in (prop or {}).get(kind) or [])
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[idx:idx + 2] for idx in range(len(text) - 1)}
+
+
+class RelationIndex:
+    """배우 이름은 출연진+제목의 토큰으로, 작품 이름은 제목의 글자 2-gram으로 페이지 ID를 찾는다.
+
+    배우 이름은 단어 경계에서만 매칭되므로 이름의 첫 토큰이 본문 토큰에 반드시 있고,
+    작품 이름은 제목의 부분 문자열이므로 이름의 2-gram이 모두 제목에 있다.
+    토큰이나 2-gram을 만들 수 없는 짧은/기호뿐인 이름은 모든 페이지를 후보로 돌려준다.
+    """
+
+    def __init__(self):
+        self._tokens: Dict[str, Set[str]] = defaultdict(set)
+        self._grams: Dict[str, Set[str]] = defaultdict(set)
+        self._titles: Dict[str, str] = {}
+
+    @classmethod
+    def build(cls, pages: Iterable[dict]) -> "RelationIndex":
+        index = cls()
+        for page in pages:
+            props = page.get("properties", {})
+            index.add(page["id"], _plain_text(props.get("공연 제목"), "title"), _plain_text(props.get("출연진"), "rich_text"))
+        return index
+
+    def add(self, page_id: str, title: str, cast: str) -> None:
+        self._titles[page_id] = title
+        for token in _TOKEN_PATTERN.findall(f"{cast}\n{title}"):
+            self._tokens[token].add(page_id)
+        for gram in _grams(title):
+            self._grams[gram].add(page_id)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def actor_candidates(self, name: str) -> Set[str]:
+        tokens = _TOKEN_PATTERN.findall(name)
+        if not tokens:
+            return set(self._titles)
+        return set(self._tokens.get(tokens[0], ()))
+
+    def work_candidates(self, name: str) -> Set[str]:
+        if len(name) < 2:
+            return {page_id for page_id, title in self._titles.items() if name in title}
+        postings = sorted((self._grams.get(gram, set()) for gram in _grams(name)), key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+
+def changed_names(previous: Dict[str, str], current: Dict[str, str]) -> Set[str]:
+    """새로 생기거나, 사라지거나, 다른 페이지를 가리키게 된 이름. 이름이 바뀌면 옛 이름과 새 이름이 모두 들어간다."""
+    return {name for name in previous.keys() | current.keys() if previous.get(name) != current.get(name)}
+
+
+def load_name_snapshot(path: str, database_id: str) -> Optional[Tuple[dict, dict]]:
+    """마지막으로 relation 동기화를 마친 시점의 (배우 이름 맵, 작품 이름 맵). 없거나 다른 DB면 None."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("database_id") != database_id:
+        return None
+    return data.get("actors", {}), data.get("works", {})
+
+
+def save_name_snapshot(path: str, database_id: str, actors: dict, works: dict) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"database_id": database_id, "actors": actors, "works": works}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
@@ -0,0 +1,99 @@
+"""relation 갱신을 티켓 쪽과 배우/작품 쪽 중 호출 수가 적은 쪽에서 쓰도록 계획한다.
+
+티켓 DB의 출연 배우/관련 작품은 배우/작품 DB와 양방향(dual) relation이라, 티켓 페이지마다 고치는 대신
+배우/작품 페이지의 반대쪽 속성에 연결된 티켓 목록 전체를 한 번에 써도 같은 결과가 된다.
+몇 명의 배우가 많은 티켓에 새로 걸리는 follow 동기화에서는 이쪽이 훨씬 적은 호출로 끝난다.
+"""
+from itertools import combinations
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# 페이지 속성 갱신 한 번에 넣을 수 있는 relation 수
+MAX_RELATIONS_PER_UPDATE = 100
+
+
+class RelationWrite(NamedTuple):
+    page_id: str
+    properties: dict
+    # 이 호출로 relation이 맞춰지는 티켓 페이지 ID
+    tickets: Tuple[str, ...]
+    # "ticket"이면 티켓 페이지, 아니면 그 티켓 속성(출연 배우/관련 작품)의 반대쪽 페이지에 쓴다.
+    side: str
+
+
+def _relation_value(ids: Iterable[str]) -> dict:
+    return {"relation": [{"id": rel} for rel in ids]}
+
+
+def _source_lists(
+        prop: str,
+        changes: Dict[str, Dict[str, List[str]]],
+        current: Dict[str, Set[str]],
+) -> Dict[str, Tuple[Set[str], Set[str]]]:
+    """prop을 바꿔야 하는 티켓에 걸린 배우/작품 페이지마다 (바뀐 뒤 연결될 티켓 전체, 연결이 바뀌는 티켓)."""
+    touched = {ticket for ticket, props in changes.items() if prop in props}
+    linked: Dict[str, Set[str]] = {}
+    for ticket, sources in current.items():
+        for source in sources:
+            linked.setdefault(source, set()).add(ticket)
+    affected: Dict[str, Set[str]] = {}
+    relinked: Dict[str, Set[str]] = {}
+    for ticket in touched:
+        before, after = current.get(ticket, set()), set(changes[ticket][prop])
+        for source in before ^ after:
+            affected.setdefault(source, set()).add(ticket)
+        for source in after:
+            relinked.setdefault(source, set()).add(ticket)
+    result = {}
+    for source, moved in affected.items():
+        tickets = {ticket for ticket in linked.get(source, ()) if ticket not in touched}
+        tickets |= relinked.get(source, set())
+        result[source] = (tickets, moved)
+    return result
+
+
+def plan_relation_writes(
+        changes: Dict[str, Dict[str, List[str]]],
+        current: Dict[str, Dict[str, Set[str]]],
+        dual_properties: Dict[str, Optional[str]],
+        max_relations: int = MAX_RELATIONS_PER_UPDATE,
+) -> List[RelationWrite]:
+    """호출 수가 가장 적은 relation 갱신 목록을 만든다.
+
+    changes: 티켓 ID → {속성 이름: 새 relation ID 목록}(값이 바뀌는 속성만)
+    current: 속성 이름 → {티켓 ID: 지금 relation ID 집합}. 반대쪽에서 쓰려면 티켓 DB 전체가 들어 있어야 하며,
+             값이 잘린(has_more) 티켓이 있으면 그 속성은 current에서 빼서 티켓 쪽으로만 쓰게 한다.
+    dual_properties: 속성 이름 → 반대쪽 DB의 속성 이름(단방향이면 None)
+
+    속성마다 티켓 쪽/반대쪽 중 하나를 고르며, 티켓 쪽으로 쓰는 속성들은 티켓 한 번의 갱신에 같이 담는다.
+    반대쪽 페이지 하나에 연결될 티켓이 max_relations를 넘으면 한 번에 쓸 수 없으므로 그 속성은 티켓 쪽으로 쓴다.
+    """
+    props = sorted({prop for change in changes.values() for prop in change})
+    source_plans = {}
+    for prop in props:
+        if not dual_properties.get(prop) or prop not in current:
+            continue
+        plan = _source_lists(prop, changes, current[prop])
+        if all(len(tickets) <= max_relations for tickets, _ in plan.values()):
+            source_plans[prop] = plan
+
+    def ticket_side_cost(source_side) -> int:
+        return sum(1 for change in changes.values() if any(prop not in source_side for prop in change))
+
+    best: Tuple[str, ...] = ()
+    best_cost = ticket_side_cost(best)
+    for size in range(1, len(source_plans) + 1):
+        for source_side in combinations(sorted(source_plans), size):
+            cost = ticket_side_cost(source_side) + sum(len(source_plans[prop]) for prop in source_side)
+            if cost < best_cost:
+                best, best_cost = source_side, cost
+
+    writes = []
+    for ticket, change in changes.items():
+        properties = {prop: _relation_value(ids) for prop, ids in change.items() if prop not in best}
+        if properties:
+            writes.append(RelationWrite(ticket, properties, (ticket,), "ticket"))
+    for prop in best:
+        for source, (tickets, moved) in sorted(source_plans[prop].items()):
+            properties = {dual_properties[prop]: _relation_value(sorted(tickets))}
+            writes.append(RelationWrite(source, properties, tuple(sorted(moved)), prop))
+    return writes
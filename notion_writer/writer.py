@@ -1,16 +1,35 @@
 # notion_db_writer.py
 import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
+import math
 import time
-from typing import Optional, List
+import uuid
+from collections import Counter
+from typing import Awaitable, Callable, Optional, List
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
 from ics.grammar.parse import ContentLine
-from notion_client import Client
-from notion_client.errors import RequestTimeoutError
+from notion_client import AsyncClient
+from notion_client.client import ClientOptions
+from notion_client.errors import APIErrorCode, APIResponseError, RequestTimeoutError
 from utils.config import settings
-from models.ticket import TicketInfo
+from models.ticket import CONTENT_STORE, TicketInfo, TicketRecord, validate_tickets
+from notion_writer.checkpoint import SyncCheckpoint
+from notion_writer.fingerprint import PageFingerprint
+from notion_writer.journal import WriteJournal
+from notion_writer.metadata_cache import NotionMetadataCache, last_edited_filter
+from notion_writer.mirror import MIRROR_PROPERTIES, TicketMirror, local_open_iso
+from notion_writer.governor import NOTION_GOVERNOR, PRIORITY_BULK, PRIORITY_READ, PRIORITY_WRITE, parse_retry_after
+from notion_writer.name_matcher import NameMatcher
+from notion_writer.relation_plan import RelationWrite, plan_relation_writes
+from notion_writer.relation_index import RelationIndex, changed_names, load_name_snapshot, save_name_snapshot
+from notion_writer.payload import MAX_BLOCKS_PER_REQUEST, batched, chunk_text
 from ics import Calendar, Event
 import re
 import os
@@ -19,47 +38,198 @@ import glob
 from urllib.parse import quote
 
 
-def _notion_call(fn, *args, retries: int = 3, **kwargs):
-    """RequestTimeoutError 발생 시 지수 백오프로 재시도"""
-    for attempt in range(retries):
+# 일시적인 서버 오류로 보고 다시 시도하는 응답 코드. notion-client의 자체 재시도는 꺼 두었다(_pooled_client).
+_SERVER_ERROR_CODES = (APIErrorCode.InternalServerError, APIErrorCode.ServiceUnavailable, "gateway_timeout")
+
+
+class UnconfirmedWriteError(Exception):
+    """응답을 받지 못한 쓰기가 Notion에 반영됐는지 끝내 확인하지 못했을 때 발생한다. 다시 보내면 중복될 수 있다."""
+
+
+async def _notion_call(fn, *args, retries: int = 3, priority: int = PRIORITY_READ, governor=None, **kwargs):
+    """모든 Notion 호출은 전역 governor에서 토큰을 받은 뒤 보낸다.
+
+    RequestTimeoutError나 5xx(internal_server_error/service_unavailable/gateway_timeout) 발생 시
+    지수 백오프로 재시도하고(합쳐서 retries번까지 시도), 429(rate_limited)를 받으면
+    Retry-After만큼 governor 전체를 멈춘 뒤 다시 시도한다. 대기 중에도 취소될 수 있도록 asyncio.sleep을 쓴다.
+    """
+    governor = governor or NOTION_GOVERNOR
+    failures = rate_limits = 0
+    while True:
+        await governor.acquire(priority)
         try:
-            return fn(*args, **kwargs)
+            return await fn(*args, **kwargs)
         except RequestTimeoutError:
-            if attempt == retries - 1:
+            failures += 1
+            if failures >= retries:
+                raise
+            wait = 2 ** (failures - 1)
+            logger.warning(f"Notion API 타임아웃 - {wait}초 후 재시도 ({failures}/{retries})")
+            await asyncio.sleep(wait)
+        except APIResponseError as ex:
+            if ex.code in _SERVER_ERROR_CODES:
+                failures += 1
+                if failures >= retries:
+                    raise
+                wait = 2 ** (failures - 1)
+                logger.warning(f"Notion API 서버 오류({ex.status}) - {wait}초 후 재시도 ({failures}/{retries})")
+                await asyncio.sleep(wait)
+                continue
+            if ex.code != APIErrorCode.RateLimited:
                 raise
-            wait = 2 ** attempt
-            logger.warning(f"Notion API 타임아웃 - {wait}초 후 재시도 ({attempt + 1}/{retries})")
-            time.sleep(wait)
+            rate_limits += 1
+            if rate_limits > settings.NOTION_RATE_LIMIT_RETRIES:
+                raise
+            wait = parse_retry_after(ex.headers.get("retry-after"))
+            governor.pause(wait if wait is not None else 2 ** rate_limits)
+
+
+async def _gather_or_cancel(coros) -> list:
+    """coros를 동시에 실행한다. 하나라도 실패하거나 바깥에서 취소되면 남은 작업을 모두 취소한다."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _block_text(block: dict) -> tuple[str, str]:
+    """보낸 블록과 조회한 블록을 견주기 위한 (블록 종류, 글자)."""
+    kind = block.get("type", "")
+    parts = (block.get(kind) or {}).get("rich_text") or []
+    return kind, "".join(part.get("plain_text") or (part.get("text") or {}).get("content", "") for part in parts)
+
+
+PAGE_LAYOUT_CONTAINER = "container"
+# container 배치에서 본문 전체를 담는 토글 블록의 제목
+CONTAINER_TITLE = "공연 상세"
+
+
+def _pooled_client() -> AsyncClient:
+    """저장소 전체가 공유하는 비동기 Notion 클라이언트. HTTP 연결은 하나의 풀에서 재사용한다."""
+    http = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.NOTION_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.NOTION_MAX_CONNECTIONS,
+        ),
+    )
+    # notion-client가 넘겨받은 httpx 클라이언트의 timeout을 timeout_ms로 덮어쓰므로 여기서 정한다.
+    options = {"auth": settings.NOTION_TOKEN, "timeout_ms": settings.HTTP_TIMEOUT * 1000}
+    if "retry" in {field.name for field in dataclasses.fields(ClientOptions)}:
+        # 429는 governor가 전역으로, 5xx와 타임아웃은 _notion_call이 백오프로 다시 시도한다.
+        options["retry"] = False
+    return AsyncClient(options, client=http)
+
+
+def _default_metadata_cache() -> NotionMetadataCache:
+    ttl = settings.NOTION_METADATA_CACHE_TTL_HOURS
+    path = os.path.join(settings.CACHE_DIR, "notion_metadata.json") if ttl > 0 else None
+    return NotionMetadataCache(path, ttl)
+
+
+def _default_mirror(database_id: str, fingerprint_property: Optional[str]) -> Optional[TicketMirror]:
+    hours = settings.NOTION_MIRROR_FULL_SYNC_HOURS
+    if hours <= 0:
+        return None
+    path = os.path.join(settings.CACHE_DIR, "notion_ticket_mirror.sqlite3")
+    return TicketMirror(path, database_id, fingerprint_property, hours)
 
 
 class NotionRepository:
     """
     Notion API를 통한 데이터베이스 CRUD를 담당합니다.
+
+    비동기 Notion 클라이언트 하나(연결 풀 공유)로 동작하며, 배우/작품 이름 맵은
+    write_all()/sync_existing_ticket_relations()가 처음 불릴 때 load()로 읽는다.
+    이름 맵과 data source ID는 metadata_cache에 남겨 다음 실행에서는 변경분만 조회한다.
+    티켓 DB는 로컬 미러(mirror)에서 읽고, 미러는 실행마다 한 번 변경분 조회로 맞춘다.
+    다 쓰면 aclose()로 연결 풀을 닫는다(async with 사용 가능).
     """
 
     def __init__(
             self,
-            client: Optional[Client] = None,
-            database_id: Optional[str] = None
+            client: Optional[AsyncClient] = None,
+            database_id: Optional[str] = None,
+            metadata_cache: Optional[NotionMetadataCache] = None,
+            mirror: Optional[TicketMirror] = None,
     ):
-        self.client = client or Client(auth=settings.NOTION_TOKEN)  # log_level=logging.DEBUG
+        self._owns_client = client is None
+        self.client = client or _pooled_client()  # log_level=logging.DEBUG
         self.database_id = database_id or settings.NOTION_DB_ID
         self.actor_db_id = settings.NOTION_ACT_DB_ID
         self.title_db_id = settings.NOTION_TITLE_DB_ID
-        self.actor_name_map = self._load_actor_name_map()
-        self.title_name_map = self._load_title_name_map()
+        self.actor_name_map: dict = {}
+        self.title_name_map: dict = {}
+        self.metadata_cache = metadata_cache or _default_metadata_cache()
+        self.actor_matcher = NameMatcher(())
+        self.title_matcher = NameMatcher((), word_boundary=False)
+        self._loaded = False
+        # (제목, 로컬 ISO 오픈 일시) → 기존 페이지. write_all()이 크롤링 기간 안의 페이지를 한 번에 읽어 채운다.
+        self._page_index: Optional[dict] = None
+        # 페이지마다 속성/본문 지문을 기록하는 rich_text 속성. 비어 있거나 DB에 만들 수 없으면 쓰지 않는다.
+        self.fingerprint_property: Optional[str] = settings.NOTION_FINGERPRINT_PROPERTY or None
+        # 본문 배치: 'flat'(섹션 블록을 페이지에 바로) 또는 'container'(토글 블록 하나 아래에 모두)
+        self.page_layout = settings.NOTION_PAGE_LAYOUT
+        self.mirror = mirror or _default_mirror(self.database_id, self.fingerprint_property)
+        # write_all의 쓰기 선행 기록. 끝나지 않은 작업은 다음 write_all이 이어서 쓴다.
+        self.journal = WriteJournal(
+            os.path.join(settings.CACHE_DIR, "notion_write_journal.jsonl"),
+            self.database_id,
+            settings.NOTION_WRITE_JOURNAL_SYNC_EVERY,
+            settings.NOTION_WRITE_JOURNAL_MAX_ATTEMPTS,
+            settings.NOTION_WRITE_JOURNAL_MAX_AGE_HOURS,
+        )
+        self._mirror_synced = False
+        self._schemas: dict = {}
+        # 지문으로 건너뛰거나 줄인 API 호출 수 등 실행 통계
+        self.write_stats: Counter = Counter()
         self.output_dir = settings.GB_ICAL_DIR
         self.ical_url = settings.GB_ICAL_URL
 
         os.makedirs(self.output_dir, exist_ok=True)
 
-    def _find_page(self, ticket: TicketInfo) -> Optional[dict]:
+    async def __aenter__(self) -> "NotionRepository":
+        await self.load()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        # 실행 중에 찾은 data source ID도 다음 실행에서 쓰도록 남긴다.
+        self.metadata_cache.save()
+        if self.mirror is not None:
+            self.mirror.close()
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def load(self) -> None:
+        """배우/작품 이름 맵을 읽고 이름 매칭 자동자를 만든다. 여러 번 불려도 한 번만 읽는다."""
+        if self._loaded:
+            return
+        self.metadata_cache.load()
+        self.actor_name_map, self.title_name_map = await asyncio.gather(
+            self._load_actor_name_map(), self._load_title_name_map()
+        )
+        self.metadata_cache.save()
+        # 이름마다 정규식을 돌리지 않도록 배우/작품 이름을 한 번씩만 자동자로 만들어 둔다.
+        self.actor_matcher = NameMatcher(self.actor_name_map, word_boundary=True)
+        self.title_matcher = NameMatcher(self.title_name_map, word_boundary=False)
+        self._loaded = True
+
+    async def _find_page(self, ticket: TicketInfo, fresh: bool = False) -> Optional[dict]:
         """
         동일 제목 및 오픈일시의 페이지가 이미 존재하는지 조회합니다.
+        미러를 한 번이라도 맞췄으면 Notion 대신 미러에서 찾는다. fresh면 미러를 거치지 않고 Notion에 묻는다.
         """
         local_dt = self._local_open_datetime(ticket)
         iso_date = local_dt.isoformat(timespec="seconds")
-        response = self._query_collection(
+        if self._mirror_synced and not fresh:
+            return self.mirror.find(ticket.title, iso_date)
+        response = await self._query_collection(
             self.database_id,
             filter={
                 "and": [
@@ -75,12 +245,140 @@ class NotionRepository:
         #     print(f"✅ 페이지 존재: {ticket.title} (page_id={results[0]['id']})")
         return results[0] if results else None
 
+    async def sync_mirror(self) -> None:
+        """티켓 DB 미러를 last_edited_time 변경분으로 맞춘다(처음이거나 전체 조회 주기가 지났으면 전체 조회).
+
+        동기화 시각은 조회 전에 잡으므로, 그 뒤에 이 저장소가 쓴 페이지도 다음 변경분 조회에 들어온다.
+        """
+        if self.mirror is None:
+            return
+        synced_at = self.mirror.synced_at()
+        sync_point = self.mirror.sync_point()
+        query = {
+            "filter_properties": await self._property_ids(
+                self.database_id, MIRROR_PROPERTIES + ((self.fingerprint_property,) if self.fingerprint_property else ())
+            ),
+        }
+        if synced_at is not None:
+            query["filter"] = last_edited_filter(synced_at)
+        pages = await self._get_all_pages(self.database_id, **query)
+        changed = self.mirror.apply(pages, sync_point, full=synced_at is None)
+        self._mirror_synced = True
+        mode = "전체 조회" if synced_at is None else f"{synced_at} 이후 변경분"
+        logger.info(f"티켓 DB 미러: {self.mirror.count()}건 ({mode} {changed}건 반영)")
+
+    # 기존 페이지 색인을 만들 때 받아 오는 속성(지문 속성은 따로 붙인다). 나머지 속성은 응답에서 뺀다.
+    INDEX_PROPERTIES = ("공연 제목", "오픈 일시")
+
+    async def _load_page_index(self, tickets: List[TicketInfo]) -> None:
+        """티켓들의 오픈 일시 범위에 드는 페이지를 한 번의 (페이지네이션) 조회로 읽어 색인한다.
+
+        티켓마다 _find_page로 제목+일시 조회를 하던 왕복을 없앤다. 미러가 있으면 미러를 맞춘 뒤 미러에서 읽는다.
+        """
+        if not tickets:
+            self._page_index = {}
+            return
+        local_dts = [self._local_open_datetime(ticket) for ticket in tickets]
+        if self.mirror is not None:
+            await self.sync_mirror()
+            pages = self.mirror.pages_between(
+                min(local_dts).isoformat(timespec="seconds"), max(local_dts).isoformat(timespec="seconds")
+            )
+        else:
+            pages = await self._get_all_pages(
+                self.database_id,
+                filter={
+                    "and": [
+                        {"property": "오픈 일시", "date": {"on_or_after": min(local_dts).isoformat(timespec="seconds")}},
+                        {"property": "오픈 일시", "date": {"on_or_before": max(local_dts).isoformat(timespec="seconds")}},
+                    ]
+                },
+                filter_properties=await self._property_ids(
+                    self.database_id, self.INDEX_PROPERTIES + ((self.fingerprint_property,) if self.fingerprint_property else ())
+                ),
+            )
+        index: dict = {}
+        for page in pages:
+            key = self._page_key(page)
+            if key is not None:
+                index.setdefault(key, page)
+        self._page_index = index
+        logger.info(f"기존 페이지 색인: {len(index)}건 (조회 기간 {min(local_dts)} ~ {max(local_dts)})")
+
+    def _ticket_key(self, ticket: TicketInfo) -> tuple:
+        return ticket.title, self._local_open_datetime(ticket).isoformat(timespec="seconds")
+
+    @staticmethod
+    def _page_key(page: dict) -> Optional[tuple]:
+        props = page.get("properties", {})
+        title = "".join(part.get("plain_text", "") for part in props.get("공연 제목", {}).get("title", []))
+        start = (props.get("오픈 일시", {}).get("date") or {}).get("start")
+        if not title or not start:
+            return None
+        return title, local_open_iso(start)
+
+    async def _existing_page(self, ticket: TicketInfo) -> Optional[dict]:
+        if self._page_index is None:
+            return await self._find_page(ticket)
+        return self._page_index.get(self._ticket_key(ticket))
+
+    async def _schema(self, database_id: str) -> dict:
+        """DB(데이터 소스)의 속성 스키마. 실행 중에는 한 번만 조회한다."""
+        if database_id not in self._schemas:
+            if hasattr(self.client, "data_sources"):
+                ds_id = await self._resolve_data_source_id(database_id)
+                schema = await _notion_call(self.client.data_sources.retrieve, data_source_id=ds_id)
+            else:
+                schema = await _notion_call(self.client.databases.retrieve, database_id=database_id)
+            self._schemas[database_id] = schema.get("properties", {})
+        return self._schemas[database_id]
+
+    async def _property_ids(self, database_id: str, names) -> list[str]:
+        """속성 이름을 filter_properties에 넘길 속성 ID로 바꾼다. 스키마에 없으면 이름을 그대로 쓴다."""
+        props = await self._schema(database_id)
+        return [props.get(name, {}).get("id", name) for name in names]
+
+    async def _ensure_fingerprint_property(self) -> None:
+        """티켓 DB에 지문 속성이 없으면 변경 감지 없이 동작한다.
+
+        NOTION_FINGERPRINT_CREATE_PROPERTY가 켜져 있을 때만 rich_text 속성으로 추가하고, 실패하면 지문 없이 동작한다.
+        """
+        name = self.fingerprint_property
+        if not name or name in await self._schema(self.database_id):
+            return
+        if not settings.NOTION_FINGERPRINT_CREATE_PROPERTY:
+            logger.info(f"티켓 DB에 지문 속성({name})이 없어 변경 감지 없이 씁니다. "
+                        f"rich_text 속성으로 직접 추가하거나 NOTION_FINGERPRINT_CREATE_PROPERTY를 켜세요.")
+            self.fingerprint_property = None
+            return
+        try:
+            if hasattr(self.client, "data_sources"):
+                ds_id = await self._resolve_data_source_id(self.database_id)
+                await _notion_call(self.client.data_sources.update,
+                    data_source_id=ds_id, properties={name: {"rich_text": {}}})
+            else:
+                await _notion_call(self.client.databases.update,
+                    database_id=self.database_id, properties={name: {"rich_text": {}}})
+            self._schemas.pop(self.database_id, None)
+            logger.info(f"티켓 DB에 지문 속성 추가: {name}")
+        except Exception as ex:
+            logger.warning(f"지문 속성({name})을 추가하지 못해 변경 감지 없이 씁니다: {ex}")
+            self.fingerprint_property = None
+
+    def _page_fingerprint(self, page: dict) -> Optional[PageFingerprint]:
+        if not self.fingerprint_property:
+            return None
+        prop = page.get("properties", {}).get(self.fingerprint_property, {})
+        text = "".join(part.get("plain_text", "") for part in prop.get("rich_text", []))
+        return PageFingerprint.parse(text) if text else None
+
     def _build_properties(self, ticket: TicketInfo) -> dict:
         """
         TicketInfo 모델을 Notion 페이지 속성(JSON)으로 변환합니다.
         """
         local_dt = self._local_open_datetime(ticket)
         iso_date = local_dt.isoformat(timespec="seconds")
+        actor_ids, work_ids = self._relation_ids(ticket.title, ticket.cast)
 
         props = {
             "공연 제목": {
@@ -111,25 +409,8 @@ class NotionRepository:
                 "multi_select": [{"name": name} for name in sorted(ticket.providers)]
             },
             "단독 판매": {"checkbox": ticket.solo_sale},
-            "출연 배우": {
-                "relation": [
-                    {"id": self.actor_name_map[name]}
-                    for name in set(
-                        self._extract_names_from_cast(ticket.cast) +
-                        self._extract_names_from_cast(ticket.title)
-                    )
-                    if name in self.actor_name_map
-                ]
-            },
-            "관련 작품": {
-                "relation": [
-                    {"id": self.title_name_map[name]}
-                    for name in set(
-                        self._extract_names_from_title(ticket.title)
-                    )
-                    if name in self.title_name_map
-                ]
-            },
+            "출연 배우": {"relation": [{"id": rel} for rel in actor_ids]},
+            "관련 작품": {"relation": [{"id": rel} for rel in work_ids]},
             "등록 링크": {"url": ticket.ical_url},
             "지역": {
                 "select": {"name": ticket.regions}
@@ -146,30 +427,19 @@ class NotionRepository:
     def _build_contents(self, content: dict, ical_url: str) -> list[dict]:
         """
         TicketInfo.content 딕셔너리를 Notion 블록 리스트로 변환합니다.
-        긴 텍스트(value)는 2000자씩 잘라 여러 paragraph 블록으로 분할 삽입합니다.
+        긴 텍스트(value)는 UTF-16 2000단위 이하로 잘라 여러 paragraph 블록으로 분할 삽입합니다.
         """
+        return [block for _, blocks in self._build_sections(content) for block in blocks]
 
-        def utf16_len(s: str) -> int:
-            return sum(2 if ord(c) > 0xFFFF else 1 for c in s)
-
-        def chunk_text(text: str, limit: int = 2000) -> list[str]:
-            chunks, current, current_len = [], [], 0
-            for ch in text:
-                ch_len = 2 if ord(ch) > 0xFFFF else 1
-                if current_len + ch_len > limit:
-                    chunks.append("".join(current))
-                    current, current_len = [], 0
-                current.append(ch)
-                current_len += ch_len
-            if current:
-                chunks.append("".join(current))
-            return chunks or [""]
+    def _build_sections(self, content: dict) -> list[tuple[str, list[dict]]]:
+        """content의 섹션별 (이름, 블록 목록). 섹션은 heading_2 하나와 본문 paragraph들로 이루어진다."""
 
         if not isinstance(content, dict):
             content = {"내용": str(content)} if content else {}
 
-        children: list[dict] = []
+        sections: list[tuple[str, list[dict]]] = []
         for key, value in content.items():
+            children: list[dict] = []
             # 섹션 헤딩
             children.append({
                 "object": "block",
@@ -178,7 +448,7 @@ class NotionRepository:
                     "rich_text": [{"type": "text", "text": {"content": key}}]
                 }
             })
-            # 본문(2000자 단위로 분할)
+            # 본문(UTF-16 2000단위 이하로, 가능하면 줄 경계에서 분할)
             for chunk in chunk_text(str(value)):
                 children.append({
                     "object": "block",
@@ -188,56 +458,343 @@ class NotionRepository:
                         "color": "default"
                     }
                 })
-        return children
+            sections.append((key, children))
+        return sections
 
-    def upsert_ticket(self, ticket: TicketInfo) -> None:
+    async def upsert_ticket(self, ticket: TicketInfo) -> None:
+        existing = None
+        key = self._ticket_key(ticket)
         try:
-            existing = self._find_page(ticket)
+            existing = await self._existing_page(ticket)
+            op = self.journal.create_op(key)
+            if op:
+                # 이전 실행이 생성을 보낸 뒤 페이지 ID를 받지 못하고 끊겼다. 반영된 페이지를 찾아
+                # 지문 없이 전체를 다시 쓰고, 찾지 못하면 새로 만들지 않고 보류한다.
+                found = existing or await self._confirm_landed(lambda: self._find_created(ticket, op))
+                if found is None:
+                    self.journal.park(key, "이전 생성 반영 여부 확인 불가")
+                    raise UnconfirmedWriteError(f"이전 실행의 생성 여부를 확인하지 못했습니다: {ticket.title} (op={op})")
+                existing = {"id": found["id"], "properties": {}}
 
             ical_url = self._generate_ics_and_push(ticket)
             ticket.ical_url = ical_url
             props = self._build_properties(ticket)
-            contents = self._build_contents(ticket.content, ticket.ical_url)
+            sections = self._build_sections(self._ticket_content(ticket))
+            contents = [block for _, blocks in sections for block in blocks]
+            fingerprint = PageFingerprint.build(props, sections, layout=self.page_layout)
+            self._set_fingerprint(props, fingerprint)
 
+            page_id = existing["id"] if existing else None
+            previous = self._page_fingerprint(existing) if existing else None
+            if previous is not None and previous == fingerprint:
+                # 속성도 본문도 그대로면 아무 호출도 하지 않는다.
+                self.write_stats["unchanged"] += 1
+                self.write_stats["saved_calls"] += 1 + self._replace_cost(previous.block_count, len(contents))
+                logger.debug(f"⏭️ 변경 없음: {ticket.title} (page_id={page_id})")
+                return
+
+            # 첫 호출 전에 할 일을 저널에 남긴다. 중간에 죽으면 다음 실행이 이 티켓을 이어서 다시 쓴다.
+            self.journal.begin(key, fingerprint.dump(), page_id, self._journal_ticket(ticket))
             if existing:
-                page_id = existing["id"]
-                # 1) 속성 업데이트
-                _notion_call(self.client.pages.update, page_id=page_id, properties=props)
-
-                # 2) 기존 블록 전부 삭제
-                cursor = None
-                while True:
-                    if cursor:
-                        resp = _notion_call(self.client.blocks.children.list,
-                            block_id=page_id, start_cursor=cursor, page_size=100)
-                    else:
-                        resp = _notion_call(self.client.blocks.children.list,
-                            block_id=page_id, page_size=100)
+                same_layout = previous is not None and previous.layout == fingerprint.layout
+                if same_layout and previous.body == fingerprint.body:
+                    # 본문은 그대로이므로 컨테이너 블록 ID도 그대로 이어받는다.
+                    fingerprint = dataclasses.replace(fingerprint, container=previous.container)
+                    self._set_fingerprint(props, fingerprint)
+                    await _notion_call(self.client.pages.update, page_id=page_id, properties=props,
+                        priority=PRIORITY_WRITE)
+                    self.write_stats["saved_calls"] += self._replace_cost(previous.block_count, len(contents))
+                    logger.info(f"🔁 속성만 업데이트: {ticket.title} (page_id={page_id})")
 
-                    for block in resp.get("results", []):
-                        _notion_call(self.client.blocks.delete, block_id=block["id"])
-                    if not resp.get("has_more"):
-                        break
-                    cursor = resp.get("next_cursor")
+                elif self.page_layout == PAGE_LAYOUT_CONTAINER:
+                    # 본문을 담은 컨테이너 블록 하나만 지우고 새로 붙인다. 옛 flat 페이지는 이때 한 번 전환된다.
+                    container_id = await self._replace_container(page_id, previous if same_layout else None, contents)
+                    fingerprint = dataclasses.replace(fingerprint, container=container_id)
+                    self._set_fingerprint(props, fingerprint)
+                    await _notion_call(self.client.pages.update, page_id=page_id, properties=props,
+                        priority=PRIORITY_WRITE)
+                    logger.info(f"🔁 업데이트 및 본문 컨테이너 교체 완료: {ticket.title} (page_id={page_id})")
 
-                # 3) 새 블록 추가
-                _notion_call(self.client.blocks.children.append,
-                    block_id=page_id, children=contents)
-                logger.info(f"🔁 업데이트 및 블록 교체 완료: {ticket.title} (page_id={page_id})")
+                else:
+                    # 1) 속성 업데이트(지문도 함께 갱신)
+                    await _notion_call(self.client.pages.update, page_id=page_id, properties=props,
+                        priority=PRIORITY_WRITE)
+
+                    if (same_layout and previous.sections is not None
+                            and len(previous.sections) == len(fingerprint.sections)):
+                        # 2') 바뀐 섹션의 블록만 교체
+                        await self._patch_sections(page_id, previous, fingerprint, sections)
+                        logger.info(f"🔁 업데이트 및 바뀐 섹션만 교체 완료: {ticket.title} (page_id={page_id})")
+                    else:
+                        # 2) 기존 블록 전부 삭제
+                        await self._delete_children(page_id)
+
+                        # 3) 새 블록 추가
+                        await self._append_blocks(page_id, contents)
+                        logger.info(f"🔁 업데이트 및 블록 교체 완료: {ticket.title} (page_id={page_id})")
 
             else:
-                # 생성 시 children 옵션으로 한 번에 삽입
-                created = _notion_call(self.client.pages.create,
-                    parent=self._page_parent(self.database_id),
-                    properties=props,
-                    children=contents
-                )
+                # 생성 시 children 옵션으로 첫 100블록까지 넣고, 나머지는 이어 붙인다.
+                head, rest = contents[:MAX_BLOCKS_PER_REQUEST], contents[MAX_BLOCKS_PER_REQUEST:]
+                # 지문에 생성 작업 ID를 넣고 보내기 전에 저널에 적어 두면, 응답을 못 받거나 중간에 죽어도
+                # 같은 페이지를 다시 만들지 않고 찾아낼 수 있다.
+                op = uuid.uuid4().hex[:16]
+                fingerprint = dataclasses.replace(fingerprint, op=op)
+                self._set_fingerprint(props, fingerprint)
+                self.journal.set_create(key, op)
+                try:
+                    created = await self._create_page(ticket, props, self._wrap_contents(head), op)
+                except UnconfirmedWriteError:
+                    self.journal.park(key, "생성 반영 여부 확인 불가")
+                    raise
                 page_id = created["id"]
+                # 나머지 블록을 붙이다 죽어도 다음 실행이 새로 만들지 않고 이 페이지를 다시 쓰게 한다.
+                self.journal.set_page(key, page_id)
+                if rest:
+                    if self.page_layout == PAGE_LAYOUT_CONTAINER:
+                        container = (await self._list_children(page_id))[0]
+                        await self._append_blocks(container["id"], rest)
+                    else:
+                        await self._append_blocks(page_id, rest)
+                if self._page_index is not None:
+                    self._page_index[key] = created
                 logger.info(f"🆕 생성 및 블록 삽입 완료: {ticket.title} (page_id={page_id})")
+            self.journal.finish(key)
 
+        except APIResponseError as ex:
+            if existing and (ex.code == APIErrorCode.ObjectNotFound or "archived" in str(ex)):
+                # 미러/저널에는 남아 있지만 Notion에서 지워진(휴지통) 페이지. 빼 두면 다음 실행에서 새로 만든다.
+                if self.mirror is not None:
+                    self.mirror.forget(existing["id"])
+                if self.journal.page_id(key) == existing["id"]:
+                    self.journal.set_page(key, None)
+            logger.error(f"❌ Notion 처리 실패: {ticket.title}", exc_info=ex)
         except Exception as ex:
             logger.error(f"❌ Notion 처리 실패: {ticket.title}", exc_info=ex)
 
+    # 응답을 받지 못한 쓰기가 반영됐는지 Notion에 묻는 최대 횟수(1, 2, 4초 간격)
+    CONFIRM_ATTEMPTS = 3
+
+    async def _confirm_landed(self, lookup: Callable[[], Awaitable]):
+        """응답을 받지 못한 쓰기가 반영됐는지 백오프하며 lookup으로 찾는다. 조회는 바로 반영되지 않을 수 있다."""
+        for attempt in range(self.CONFIRM_ATTEMPTS):
+            await asyncio.sleep(2 ** attempt)
+            found = await lookup()
+            if found is not None:
+                return found
+        return None
+
+    async def _create_page(self, ticket: TicketInfo, props: dict, children: list[dict], op: str) -> dict:
+        """티켓 페이지를 만든다. props의 지문에는 생성 작업 ID(op)가 들어 있어야 한다.
+
+        타임아웃/5xx로 응답을 받지 못한 생성은 Notion에 이미 반영됐을 수 있으므로 다시 보내지 않고,
+        op가 적힌 페이지가 생겼는지 찾는다. 끝내 찾지 못하면 UnconfirmedWriteError를 낸다.
+        """
+        parent = await self._page_parent(self.database_id)
+        try:
+            return await _notion_call(self.client.pages.create, parent=parent, properties=props,
+                children=children, retries=1, priority=PRIORITY_WRITE)
+        except (RequestTimeoutError, APIResponseError) as ex:
+            if isinstance(ex, APIResponseError) and ex.code not in _SERVER_ERROR_CODES:
+                raise
+            logger.warning(f"페이지 생성 응답 없음({type(ex).__name__}) - 생성 여부 확인: {ticket.title}")
+        found = await self._confirm_landed(lambda: self._find_created(ticket, op))
+        if found is None:
+            raise UnconfirmedWriteError(f"페이지 생성 여부를 확인하지 못했습니다: {ticket.title} (op={op})")
+        logger.info(f"응답을 받지 못한 생성이 반영되어 있어 그 페이지를 씁니다: {ticket.title} (page_id={found['id']})")
+        return found
+
+    async def _find_created(self, ticket: TicketInfo, op: str) -> Optional[dict]:
+        """생성 작업 ID가 지문에 적힌 페이지. 지문 속성이 없으면 제목+오픈 일시로 찾는다."""
+        if not self.fingerprint_property:
+            return await self._find_page(ticket, fresh=True)
+        response = await self._query_collection(
+            self.database_id,
+            filter={"property": self.fingerprint_property, "rich_text": {"contains": f"|o={op}"}},
+        )
+        results = response.get("results", [])
+        return results[0] if results else None
+
+    def _journal_ticket(self, ticket: TicketInfo) -> dict:
+        """다음 실행이 크롤링 없이 다시 쓸 수 있도록 본문까지 풀어 둔 티켓."""
+        return dict(ticket.model_dump(mode="json"), content=self._ticket_content(ticket), content_ref="")
+
+    def _set_fingerprint(self, props: dict, fingerprint: PageFingerprint) -> None:
+        if self.fingerprint_property:
+            props[self.fingerprint_property] = {
+                "rich_text": [{"type": "text", "text": {"content": fingerprint.dump()}}]
+            }
+
+    def _wrap_contents(self, contents: list[dict]) -> list[dict]:
+        """container 배치면 본문 블록 전체를 토글 블록 하나의 자식으로 넣는다."""
+        if self.page_layout != PAGE_LAYOUT_CONTAINER or not contents:
+            return contents
+        return [{
+            "object": "block",
+            "type": "toggle",
+            "toggle": {
+                "rich_text": [{"type": "text", "text": {"content": CONTAINER_TITLE}}],
+                "children": contents,
+            },
+        }]
+
+    async def _replace_container(
+            self,
+            page_id: str,
+            previous: Optional[PageFingerprint],
+            contents: list[dict],
+    ) -> str:
+        """본문 컨테이너를 교체하고 새 컨테이너 블록 ID를 돌려준다.
+
+        지문에 컨테이너 ID가 있으면 그 블록 하나만 지운다(자식 블록도 함께 지워진다).
+        ID를 모르거나 이미 지워졌거나, 옛 flat 배치 페이지면 페이지의 자식 블록을 모두 지운다.
+        """
+        calls = 0
+        if previous is not None and previous.container:
+            try:
+                await _notion_call(self.client.blocks.delete, block_id=previous.container, priority=PRIORITY_WRITE)
+                calls += 1
+            except APIResponseError as ex:
+                if ex.code not in (APIErrorCode.ObjectNotFound, APIErrorCode.ValidationError):
+                    raise
+                await self._delete_children(page_id)
+                calls = -1
+        else:
+            await self._delete_children(page_id)
+            calls = -1
+            if previous is None:
+                self.write_stats["migrated"] += 1
+
+        container_id = ""
+        if contents:
+            head, rest = contents[:MAX_BLOCKS_PER_REQUEST], contents[MAX_BLOCKS_PER_REQUEST:]
+            created = await self._append_blocks(page_id, self._wrap_contents(head))
+            container_id = created[0]["id"] if created else ""
+            calls += 1
+            if rest:
+                if not container_id:
+                    container_id = (await self._list_children(page_id))[0]["id"]
+                await self._append_blocks(container_id, rest)
+                calls += -(-len(rest) // MAX_BLOCKS_PER_REQUEST)
+        if previous is not None and calls > 0:
+            self.write_stats["saved_calls"] += max(0, self._replace_cost(previous.block_count, len(contents)) - calls)
+        return container_id
+
+    @staticmethod
+    def _replace_cost(old_blocks: int, new_blocks: int) -> int:
+        """본문 전체 교체에 드는 호출 수: 목록 조회 + 블록별 삭제 + 100블록 단위 추가."""
+        return (
+            max(1, math.ceil(old_blocks / MAX_BLOCKS_PER_REQUEST)) + old_blocks
+            + math.ceil(new_blocks / MAX_BLOCKS_PER_REQUEST)
+        )
+
+    async def _append_blocks(self, parent_id: str, blocks: list[dict], after: Optional[str] = None) -> list[dict]:
+        """blocks를 100개 이하 묶음으로 나눠 순서대로 붙이고, 만들어진 블록 목록을 돌려준다.
+
+        묶음마다 순서가 지켜져야 하므로 앞 묶음 응답을 받은 뒤 다음 묶음을 보낸다.
+        after가 있으면 그 블록 뒤에 넣고, 다음 묶음은 직전 묶음의 마지막 블록 뒤에 잇는다.
+        타임아웃/5xx로 응답을 받지 못한 묶음은 다시 보내지 않고 자식 블록 목록에서 찾는다. 끝내 찾지 못하면
+        UnconfirmedWriteError를 내며, 저널에 남은 작업은 다음 실행이 본문 전체를 다시 쓴다.
+        """
+        created: list[dict] = []
+        for batch in batched(blocks):
+            batch = list(batch)
+            params = {"after": after} if after else {}
+            try:
+                resp = await _notion_call(self.client.blocks.children.append,
+                    block_id=parent_id, children=batch, retries=1, priority=PRIORITY_WRITE, **params)
+                results = (resp or {}).get("results") or []
+            except (RequestTimeoutError, APIResponseError) as ex:
+                if isinstance(ex, APIResponseError) and ex.code not in _SERVER_ERROR_CODES:
+                    raise
+                logger.warning(f"블록 추가 응답 없음({type(ex).__name__}) - 반영 여부 확인: {parent_id}")
+                results = await self._confirm_landed(lambda: self._find_appended(parent_id, batch, after))
+                if results is None:
+                    raise UnconfirmedWriteError(f"블록 추가 여부를 확인하지 못했습니다: {parent_id}")
+            created.extend(results)
+            if after and results:
+                after = results[-1]["id"]
+        return created
+
+    async def _find_appended(self, parent_id: str, batch: list[dict], after: Optional[str]) -> Optional[list[dict]]:
+        """batch가 after 뒤(없으면 맨 끝)에 붙어 있으면 만들어진 블록 목록을, 아니면 None을 돌려준다."""
+        children = await self._list_children(parent_id)
+        if after:
+            ids = [block["id"] for block in children]
+            if after not in ids:
+                return None
+            start = ids.index(after) + 1
+            landed = children[start:start + len(batch)]
+        else:
+            landed = children[-len(batch):]
+        if [_block_text(block) for block in landed] != [_block_text(block) for block in batch]:
+            return None
+        return landed
+
+    async def _list_children(self, block_id: str) -> list[dict]:
+        blocks = []
+        cursor = None
+        while True:
+            if cursor:
+                resp = await _notion_call(self.client.blocks.children.list,
+                    block_id=block_id, start_cursor=cursor, page_size=100, priority=PRIORITY_WRITE)
+            else:
+                resp = await _notion_call(self.client.blocks.children.list,
+                    block_id=block_id, page_size=100, priority=PRIORITY_WRITE)
+            blocks.extend(resp.get("results", []))
+            if not resp.get("has_more"):
+                return blocks
+            cursor = resp.get("next_cursor")
+
+    async def _delete_blocks(self, blocks: list[dict]) -> None:
+        await _gather_or_cancel(self._delete_block(block["id"]) for block in blocks)
+
+    async def _delete_block(self, block_id: str) -> None:
+        try:
+            await _notion_call(self.client.blocks.delete, block_id=block_id, priority=PRIORITY_WRITE)
+        except APIResponseError as ex:
+            # 응답을 받지 못해 다시 보낸 삭제는 이미 지워진(archived) 블록이라 실패한다. 지워졌으면 된다.
+            if ex.code != APIErrorCode.ValidationError or "archived" not in str(ex):
+                raise
+
+    async def _delete_children(self, block_id: str) -> None:
+        """block_id의 자식 블록을 모두 지운다. 블록 삭제는 동시에 보낸다."""
+        await self._delete_blocks(await self._list_children(block_id))
+
+    async def _patch_sections(
+            self,
+            page_id: str,
+            previous: PageFingerprint,
+            fingerprint: PageFingerprint,
+            sections: list[tuple[str, list[dict]]],
+    ) -> None:
+        """지문의 섹션별 블록 수로 기존 블록을 나눠, 해시가 바뀐 섹션만 새 블록으로 바꾼다.
+
+        새 블록을 옛 섹션의 마지막 블록 뒤에 먼저 넣고 옛 블록을 지우므로 섹션 순서가 유지된다.
+        기존 블록 수가 지문과 다르면(페이지를 손으로 고친 경우 등) 전체를 교체한다.
+        """
+        blocks = await self._list_children(page_id)
+        contents = [block for _, section_blocks in sections for block in section_blocks]
+        if len(blocks) != previous.block_count:
+            await self._delete_blocks(blocks)
+            await self._append_blocks(page_id, contents)
+            return
+
+        calls = math.ceil(len(blocks) / 100) if blocks else 1
+        start = 0
+        for (old_hash, count), (new_hash, _), (_, new_blocks) in zip(previous.sections, fingerprint.sections, sections):
+            old_blocks = blocks[start:start + count]
+            start += count
+            if old_hash == new_hash:
+                continue
+            if new_blocks:
+                await self._append_blocks(page_id, new_blocks, after=old_blocks[-1]["id"] if old_blocks else None)
+                calls += math.ceil(len(new_blocks) / MAX_BLOCKS_PER_REQUEST)
+            await self._delete_blocks(old_blocks)
+            calls += len(old_blocks)
+        self.write_stats["patched"] += 1
+        self.write_stats["saved_calls"] += max(0, self._replace_cost(previous.block_count, len(contents)) - calls)
+
     # def write_all(self, tickets: List[TicketInfo]) -> None:
     #     """
     #     다수의 티켓 정보를 순차적으로 처리합니다.
@@ -245,116 +802,324 @@ class NotionRepository:
     #     for ticket in tickets:
     #         self.upsert_ticket(ticket)
 
-    def _load_actor_name_map(self) -> dict:
-        results = self._get_all_pages(self.actor_db_id)
-        return {
-            p["properties"]["이름"]["title"][0]["plain_text"]: p["id"]
-            for p in results
-            if p["properties"]["이름"]["title"]
-        }
+    async def _load_actor_name_map(self) -> dict:
+        return await self._load_name_map(self.actor_db_id, "이름")
 
-    def _load_title_name_map(self) -> dict:
-        results = self._get_all_pages(self.title_db_id)
-        return {
-            p["properties"]["공연명"]["title"][0]["plain_text"]: p["id"]
-            for p in results
-            if p["properties"]["공연명"]["title"]
-        }
+    async def _load_title_name_map(self) -> dict:
+        return await self._load_name_map(self.title_db_id, "공연명")
 
-    def _extract_names_from_cast(self, cast_text: str) -> list[str]:
-        matched_names = []
-        for name in self.actor_name_map.keys():
-            # 경계 처리: 이름 앞뒤가 (시작/끝/공백/쉼표/개행/구두점) 중 하나일 때만 매칭
-            pattern = rf'(?<!\w){re.escape(name)}(?!\w)'
-            if re.search(pattern, cast_text):
-                matched_names.append(name)
+    async def _load_name_map(self, database_id: str, name_property: str) -> dict:
+        """이름 → 페이지 ID. 캐시가 있으면 마지막 동기화 이후 수정된 페이지만 읽어 반영한다."""
+        cache = self.metadata_cache
+        synced_at = cache.name_synced_at(database_id, name_property)
+        sync_point = cache.sync_point()
+        if synced_at is None:
+            results = await self._get_all_pages(database_id)
+        else:
+            results = await self._get_all_pages(database_id, filter=last_edited_filter(synced_at))
+        changed = cache.apply_name_pages(database_id, name_property, results, sync_point, full=synced_at is None)
+        name_map = cache.name_map(database_id, name_property)
+        mode = "전체 조회" if synced_at is None else f"{synced_at} 이후 변경분"
+        logger.info(f"{name_property} 맵 {len(name_map)}건 ({mode} {changed}건 반영)")
+        return name_map
 
-        return matched_names
+    def _extract_names_from_cast(self, cast_text: str) -> list[str]:
+        # 경계 처리: 이름 앞뒤가 (시작/끝/공백/쉼표/개행/구두점) 중 하나일 때만 매칭
+        return self.actor_matcher.find(cast_text)
 
     def _extract_names_from_title(self, title_text: str) -> list[str]:
-        matched_names = []
-        for name in self.title_name_map.keys():
-            if name in title_text:
-                matched_names.append(name)
+        return self.title_matcher.find(title_text)
+
+    def _relation_ids(self, title: str, cast: str) -> tuple[list[str], list[str]]:
+        """출연진/제목에서 찾은 (배우 페이지 ID, 작품 페이지 ID). 지문이 실행마다 같도록 이름 순으로 정렬한다."""
+        actor_names = sorted(set(self._extract_names_from_cast(cast) + self._extract_names_from_cast(title)))
+        work_names = sorted(set(self._extract_names_from_title(title)))
+        return (
+            [self.actor_name_map[name] for name in actor_names if name in self.actor_name_map],
+            [self.title_name_map[name] for name in work_names if name in self.title_name_map],
+        )
 
-        return matched_names
+    async def write_all(self, tickets: List[TicketRecord | TicketInfo]) -> None:
+        """티켓들을 Notion에 쓴다. 이전 실행이 저널에 남긴 끝나지 않은 작업도 함께 이어서 쓴다.
 
-    async def write_all(self, tickets: List[TicketInfo]) -> None:
+        write_all([])을 부르면 저널에 남은 작업만 다시 쓴다.
+        """
+        # 크롤링/병합 구간의 가벼운 레코드는 여기서 한 번만 TicketInfo로 검증한다.
+        tickets = validate_tickets(tickets)
+        unfinished = self.journal.load()
+        tickets += self._unfinished_tickets(tickets, unfinished)
+        await self.load()
+        await self._ensure_fingerprint_property()
+        await self._load_page_index(tickets)
+        for key, entry in unfinished.items():
+            page = self._page_index.get(key)
+            page_id = entry.get("page") or (page or {}).get("id")
+            if page_id:
+                # 쓰다 만 페이지는 지문과 실제 내용이 다를 수 있으므로 지문 없이 전체를 다시 쓴다.
+                self._page_index[key] = {"id": page_id, "properties": {}}
         # Notion API 레이트리밋 방지를 위해 동시 처리 개수를 제한한다.
         semaphore = asyncio.Semaphore(3)
 
         async def limited_upsert(ticket: TicketInfo):
             async with semaphore:
-                return await asyncio.to_thread(self.upsert_ticket, ticket)
+                return await self.upsert_ticket(ticket)
 
         task = [limited_upsert(ticket) for ticket in tickets]
 
-        results = await asyncio.gather(*task, return_exceptions=True)
+        try:
+            results = await asyncio.gather(*task, return_exceptions=True)
+        finally:
+            self.journal.close()
         for ticket, result in zip(tickets, results):
             if isinstance(result, Exception):
                 logging.error(f"❌ 티켓 처리 실패: {ticket.title}", exc_info=result)
 
         ics_files = glob.glob(f"{self.output_dir}/*.ics")
         logger.info(f"📁 {self.output_dir} 내 .ics 파일 수: {len(ics_files)}개")
+        logger.info(
+            f"변경 없음 {self.write_stats['unchanged']}건, 섹션만 교체 {self.write_stats['patched']}건, "
+            f"컨테이너 배치로 전환 {self.write_stats['migrated']}건, 절약한 API 호출 {self.write_stats['saved_calls']}회"
+        )
+        self._log_governor_stats()
+
+    def _unfinished_tickets(self, tickets: List[TicketInfo], unfinished: dict) -> List[TicketInfo]:
+        """저널에만 남은(이번 크롤링에 없는) 끝나지 않은 티켓. 이번 크롤링에 있으면 새 내용으로 쓴다."""
+        if not unfinished:
+            return []
+        keys = {self._ticket_key(ticket) for ticket in tickets}
+        resumed = [
+            TicketInfo.model_validate(entry["ticket"])
+            for key, entry in unfinished.items()
+            if key not in keys and entry.get("ticket")
+        ]
+        logger.info(f"📒 이전 실행에서 끝나지 않은 쓰기 {len(unfinished)}건 이어서 처리 (저널에서 복원 {len(resumed)}건)")
+        return resumed
+
+    @staticmethod
+    def _log_governor_stats() -> None:
+        stats = NOTION_GOVERNOR.stats
+        logger.info(
+            f"Notion 호출 {stats['calls']}회: 대기 {stats['waits']}회({stats['wait_seconds']:.1f}초), "
+            f"429 {stats['rate_limited']}회"
+        )
+
+    async def sync_existing_ticket_relations(self, concurrency: Optional[int] = None, only_changed: bool = False) -> Counter:
+        """티켓 페이지마다 출연진/제목에서 출연 배우·관련 작품 relation을 다시 계산해, 지금 값과 다른 페이지만 갱신한다.
+
+        바뀐 relation은 티켓 페이지마다 쓰거나, 배우/작품 페이지의 반대쪽 속성에 모아 쓰는 것 중 호출이 적은 쪽으로 쓴다
+        (relation_plan 참고). 갱신 호출은 concurrency개의 작업자가 나눠 보내고(호출 속도는 governor가 맞춘다),
+        끝낸 페이지는 체크포인트에 남겨 중간에 죽으면 다음 실행에서 남은 페이지부터 이어 간다. 결과별 페이지 수를 돌려준다.
+        only_changed면 지난 동기화 이후 추가/삭제/이름이 바뀐 배우·작품이 나올 수 있는 페이지만 본다.
+        """
+        await self.load()
+        if self.mirror is not None:
+            await self.sync_mirror()
+            pages = list(self.mirror.pages())
+        else:
+            pages = await self._get_all_pages(self.database_id, priority=PRIORITY_BULK)
+        # 배우/작품 쪽에서 쓰려면 그 페이지에 연결된 티켓 전체를 알아야 하므로 거르기 전 목록을 둔다.
+        all_pages = pages
+        snapshot_path = os.path.join(settings.CACHE_DIR, "relation_sync_names.json")
+        if only_changed:
+            previous = load_name_snapshot(snapshot_path, self.database_id)
+            if previous is None:
+                logger.info("이전 relation 동기화 기록이 없어 전체 페이지를 봅니다.")
+            else:
+                pages = self._pages_mentioning_changes(pages, *previous)
+        checkpoint = SyncCheckpoint(
+            os.path.join(settings.CACHE_DIR, "relation_sync_checkpoint.json"), self._name_map_signature()
+        )
+        resumed = checkpoint.load()
+        logger.info(
+            f"🔄 기존 티켓 DB에서 출연진 필드 기반으로 출연 배우 Relation 갱신 시작: {len(pages)}건 (이어받음 {resumed}건)"
+        )
+        stats: Counter = Counter()
+        started = time.perf_counter()
 
-    def sync_existing_ticket_relations(self):
-        pages = self._get_all_pages(self.database_id)
-        logger.info(f"🔄 기존 티켓 DB에서 출연진 필드 기반으로 출연 배우 Relation 갱신 시작: {len(pages)}건")
+        changes: dict = {}
+        titles: dict = {}
         for page in pages:
-            page_id = page["id"]
-            title = page["properties"].get("공연 제목", {}).get("title", [])
-            title_str = title[0]["plain_text"] if title else "(제목 없음)"
-            cast_field = page["properties"].get("출연진", {}).get("rich_text", [])
-            cast_text = cast_field[0]["plain_text"] if cast_field else ""
-
-            if not cast_text.strip():
-                logger.debug(f"⚠️ 출연진 없음: {title_str}")
+            if page["id"] in checkpoint.done:
                 continue
-            names = set(
-                self._extract_names_from_cast(cast_text) +
-                self._extract_names_from_cast(title_str)
+            outcome, change, titles[page["id"]] = self._relation_change(page)
+            if change:
+                changes[page["id"]] = change
+            else:
+                stats[outcome] += 1
+                checkpoint.mark(page["id"])
+
+        if settings.NOTION_RELATION_WRITE_SIDE == "ticket":
+            writes = plan_relation_writes(changes, {}, {})
+        else:
+            writes = plan_relation_writes(changes, self._current_relations(all_pages), await self._dual_properties())
+        remaining = Counter(ticket for write in writes for ticket in write.tickets)
+        failed: set = set()
+        # 미러는 끝에 한 트랜잭션으로 맞춘다. 중간에 죽어 빠져도 다음 변경분 조회가 채운다.
+        mirror_updates: list = []
+        pending = iter(writes)
+
+        async def worker():
+            # 작업자들이 같은 이터레이터에서 다음 갱신을 꺼내 간다.
+            for write in pending:
+                ok = await self._write_relations(write, titles)
+                stats[f"writes_{write.side}"] += 1
+                for ticket in write.tickets:
+                    if not ok:
+                        failed.add(ticket)
+                    remaining[ticket] -= 1
+                    if remaining[ticket]:
+                        continue
+                    # 티켓에 걸린 갱신이 모두 끝났을 때 결과를 센다.
+                    if ticket in failed:
+                        stats["failed"] += 1
+                        continue
+                    stats["updated"] += 1
+                    checkpoint.mark(ticket)
+                    mirror_updates.append((ticket, changes[ticket].get("출연 배우"), changes[ticket].get("관련 작품")))
+                written = sum(count for key, count in stats.items() if key.startswith("writes_"))
+                if written % 500 == 0:
+                    logger.info(f"… 갱신 호출 {written}/{len(writes)}회 ({written / (time.perf_counter() - started):.1f}회/초)")
+
+        logger.info(
+            f"relation이 바뀌는 페이지 {len(changes)}건 → 갱신 호출 {len(writes)}회 "
+            f"(티켓 쪽 {sum(1 for write in writes if write.side == 'ticket')}회)"
+        )
+        try:
+            await _gather_or_cancel(
+                worker() for _ in range(max(1, concurrency or settings.NOTION_RELATION_SYNC_CONCURRENCY))
             )
-            title_names = set(self._extract_names_from_title(title_str))
-            matched_actor_ids = [
-                {"id": self.actor_name_map[name]}
-                for name in names
-                if name in self.actor_name_map
-            ]
-            matched_title_ids = [
-                {"id": self.title_name_map[name]}
-                for name in title_names
-                if name in self.title_name_map
-            ]
-
-            if not matched_actor_ids and not matched_title_ids:
-                logger.debug(f"⚠️ 매칭 배우 및 작품 없음: {title_str}")
-                continue
+        finally:
+            checkpoint.save()
+            if self.mirror is not None:
+                self.mirror.set_relations(mirror_updates)
+        if not stats["failed"]:
+            checkpoint.clear()
+            # 다음 only_changed 동기화는 이 시점의 이름 맵과 비교한다.
+            save_name_snapshot(snapshot_path, self.database_id, self.actor_name_map, self.title_name_map)
 
-            properties = {}
-            if matched_actor_ids:
-                properties["출연 배우"] = {"relation": matched_actor_ids}
-            if matched_title_ids:
-                properties["관련 작품"] = {"relation": matched_title_ids}
+        elapsed = time.perf_counter() - started
+        processed = sum(count for key, count in stats.items() if not key.startswith("writes_"))
+        logger.info(
+            f"Relation 갱신 완료: {processed}건 {elapsed:.1f}초 ({processed / elapsed if elapsed else 0:.1f}건/초) - "
+            f"갱신 {stats['updated']}, 변경 없음 {stats['unchanged']}, 매칭 없음 {stats['no_match']}, "
+            f"출연진 없음 {stats['no_cast']}, 실패 {stats['failed']}"
+        )
+        self._log_governor_stats()
+        return stats
 
-            try:
-                self.client.pages.update(
-                    page_id=page_id,
-                    properties=properties
-                )
-                logger.info(f"✅ 갱신 완료: {title_str}")
-            except Exception as ex:
-                logger.error(f"❌ 갱신 실패: {title_str}", exc_info=ex)
-
-    def _get_all_pages(self, database_id: str) -> list:
+    def _pages_mentioning_changes(self, pages: list, previous_actors: dict, previous_works: dict) -> list:
+        """지난 동기화 이후 바뀐 배우/작품 이름이 나올 수 있는 페이지만 역색인으로 고른다."""
+        actors = changed_names(previous_actors, self.actor_name_map)
+        works = changed_names(previous_works, self.title_name_map)
+        if not actors and not works:
+            logger.info("지난 동기화 이후 바뀐 배우/작품이 없습니다.")
+            return []
+        index = RelationIndex.build(pages)
+        candidates: set = set()
+        for name in actors:
+            candidates |= index.actor_candidates(name)
+        for name in works:
+            candidates |= index.work_candidates(name)
+        logger.info(
+            f"바뀐 배우 {len(actors)}명, 작품 {len(works)}건 → 다시 볼 페이지 {len(candidates)}/{len(index)}건"
+        )
+        return [page for page in pages if page["id"] in candidates]
+
+    def _relation_change(self, page: dict) -> tuple[str, dict, str]:
+        """페이지 하나의 (결과, 바꿀 relation, 제목). 결과는 changed/unchanged/no_match/no_cast이고,
+        바꿀 relation은 {속성 이름: 새 relation ID 목록}으로 지금 값과 다른 속성만 담는다."""
+        title = page["properties"].get("공연 제목", {}).get("title", [])
+        title_str = title[0]["plain_text"] if title else "(제목 없음)"
+        cast_field = page["properties"].get("출연진", {}).get("rich_text", [])
+        cast_text = cast_field[0]["plain_text"] if cast_field else ""
+
+        if not cast_text.strip():
+            logger.debug(f"⚠️ 출연진 없음: {title_str}")
+            return "no_cast", {}, title_str
+        actor_ids, work_ids = self._relation_ids(title_str, cast_text)
+        if not actor_ids and not work_ids:
+            logger.debug(f"⚠️ 매칭 배우 및 작품 없음: {title_str}")
+            return "no_match", {}, title_str
+
+        change = {}
+        if actor_ids and not self._same_relation(page["properties"].get("출연 배우"), actor_ids):
+            change["출연 배우"] = actor_ids
+        if work_ids and not self._same_relation(page["properties"].get("관련 작품"), work_ids):
+            change["관련 작품"] = work_ids
+        return ("changed" if change else "unchanged"), change, title_str
+
+    async def _write_relations(self, write: RelationWrite, titles: dict) -> bool:
+        try:
+            await _notion_call(
+                self.client.pages.update,
+                page_id=write.page_id,
+                properties=write.properties,
+                priority=PRIORITY_BULK,
+            )
+        except Exception as ex:
+            target = titles.get(write.page_id) if write.side == "ticket" else f"{write.side} {write.page_id}"
+            logger.error(f"❌ 갱신 실패: {target}", exc_info=ex)
+            return False
+        if write.side == "ticket":
+            logger.info(f"✅ 갱신 완료: {titles.get(write.page_id)}")
+        else:
+            logger.info(f"✅ {write.side} 쪽에서 갱신 완료: {write.page_id} (티켓 {len(write.tickets)}건)")
+        return True
+
+    @staticmethod
+    def _current_relations(pages: list) -> dict:
+        """속성 이름 → {티켓 ID: 지금 relation ID 집합}. 값이 잘린(has_more) 페이지가 있는 속성은 뺀다."""
+        current = {}
+        for prop in ("출연 배우", "관련 작품"):
+            values = {}
+            for page in pages:
+                value = page["properties"].get(prop) or {}
+                if value.get("has_more"):
+                    break
+                values[page["id"]] = {rel["id"] for rel in value.get("relation") or []}
+            else:
+                current[prop] = values
+        return current
+
+    async def _dual_properties(self) -> dict:
+        """티켓 DB relation 속성 → 배우/작품 DB 쪽 속성 이름. 단방향이거나 스키마를 읽지 못하면 빠진다."""
+        try:
+            schema = await self._schema(self.database_id)
+        except Exception as ex:
+            logger.warning(f"티켓 DB 스키마를 읽지 못해 relation을 티켓 쪽에서만 씁니다: {ex}")
+            return {}
+        duals = {}
+        for prop in ("출연 배우", "관련 작품"):
+            relation = (schema.get(prop) or {}).get("relation") or {}
+            name = (relation.get("dual_property") or {}).get("synced_property_name")
+            if name:
+                duals[prop] = name
+        return duals
+
+    @staticmethod
+    def _same_relation(prop: Optional[dict], ids: list[str]) -> bool:
+        """페이지의 relation 값이 ids와 같은지. 잘린 값(has_more)은 비교할 수 없으므로 다르다고 본다."""
+        if not prop or prop.get("has_more"):
+            return False
+        return {rel["id"] for rel in prop.get("relation", [])} == set(ids)
+
+    def _name_map_signature(self) -> str:
+        """relation 계산 결과를 좌우하는 배우/작품 이름 맵의 요약."""
+        digest = hashlib.blake2b(digest_size=16)
+        for name_map in (self.actor_name_map, self.title_name_map):
+            digest.update(json.dumps(sorted(name_map.items()), ensure_ascii=False).encode("utf-8"))
+        return digest.hexdigest()
+
+    async def _get_all_pages(self, database_id: str, priority: int = PRIORITY_READ, **query) -> list:
         results = []
         start_cursor = None
 
         while True:
-            params = {}
+            params = dict(query, page_size=100)
             if start_cursor:
                 params["start_cursor"] = start_cursor
 
-            response = self._query_collection(database_id, **params)
+            response = await self._query_collection(database_id, priority=priority, **params)
             results.extend(response.get("results", []))
 
             if response.get("has_more"):
@@ -364,15 +1129,17 @@ class NotionRepository:
 
         return results
 
-    def _query_collection(self, database_id: str, **kwargs) -> dict:
+    async def _query_collection(self, database_id: str, priority: int = PRIORITY_READ, **kwargs) -> dict:
         if hasattr(self.client, "data_sources"):
-            ds_id = self._resolve_data_source_id(database_id)
-            return self.client.data_sources.query(data_source_id=ds_id, **kwargs)
-        return self.client.databases.query(database_id=database_id, **kwargs)
+            ds_id = await self._resolve_data_source_id(database_id)
+            return await _notion_call(
+                self.client.data_sources.query, data_source_id=ds_id, priority=priority, **kwargs
+            )
+        return await _notion_call(self.client.databases.query, database_id=database_id, priority=priority, **kwargs)
 
-    def _page_parent(self, database_id: str) -> dict:
+    async def _page_parent(self, database_id: str) -> dict:
         if hasattr(self.client, "data_sources"):
-            return {"data_source_id": self._resolve_data_source_id(database_id)}
+            return {"data_source_id": await self._resolve_data_source_id(database_id)}
         return {"database_id": database_id}
 
     def _generate_ics_and_push(self, ticket: TicketInfo) -> str:
@@ -420,6 +1187,11 @@ class NotionRepository:
         output_dir = self.output_dir.replace("\\", "/").strip("/")
         return f"{base_url}/{output_dir}/{quote(file_name)}"
 
+    @staticmethod
+    def _ticket_content(ticket: TicketInfo) -> dict:
+        """본문은 CONTENT_STORE에 한 번만 저장돼 있으므로 블록을 만들 때 해시로 꺼낸다."""
+        return ticket.content or CONTENT_STORE.get(ticket.content_ref)
+
     @staticmethod
     def _ordered_detail_urls(ticket: TicketInfo) -> list[str]:
         urls = list(ticket.detail_url_all)
@@ -434,19 +1206,25 @@ class NotionRepository:
             return dt.replace(tzinfo=settings.DEFAULT_TIMEZONE)
         return dt.astimezone(settings.DEFAULT_TIMEZONE)
 
-    def _resolve_data_source_id(self, database_or_data_source_id: str) -> str:
+    async def _resolve_data_source_id(self, database_or_data_source_id: str) -> str:
         """
         DB ID를 받으면 그 아래 단일 data source의 ID를 찾아 반환.
         이미 data_source_id를 준 경우에도 그대로 동작하도록 시도-예외 방식 사용.
+        찾은 ID는 metadata_cache에 남겨 조회/생성마다 retrieve를 다시 보내지 않는다.
         """
+        cached = self.metadata_cache.data_source_id(database_or_data_source_id)
+        if cached:
+            return cached
         try:
             # 이미 data source일 가능성
-            self.client.data_sources.retrieve(data_source_id=database_or_data_source_id)
-            return database_or_data_source_id
+            await _notion_call(self.client.data_sources.retrieve, data_source_id=database_or_data_source_id)
+            data_source_id = database_or_data_source_id
         except Exception:
-            db = self.client.databases.retrieve(database_id=database_or_data_source_id)
+            db = await _notion_call(self.client.databases.retrieve, database_id=database_or_data_source_id)
             # 단일 소스 가정: 첫 번째 data_source를 사용
             data_sources = db.get("data_sources", [])
             if not data_sources:
                 raise RuntimeError("Database has no data_sources; share/permissions or structure issue.")
-            return data_sources[0]["id"]
+            data_source_id = data_sources[0]["id"]
+        self.metadata_cache.set_data_source_id(database_or_data_source_id, data_source_id)
+        return data_source_id
@@ -6,6 +6,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='ignor
 import asyncio
 import logging
 import logging.config
+import os
 import yaml
 from typing import Tuple
 
@@ -16,8 +17,10 @@ from crawler.sac import SacCrawler
 from crawler.sejongpac import SejongPac
 from crawler.ticketlink import TicketLinkCrawler
 from crawler.yes24 import Yes24Crawler
-from merge.merge import merge_ticket_sources
+from merge.merge import TicketMerger
 from notion_writer.writer import NotionRepository
+from utils.config import settings
+from utils.utils import REGION_GAZETTEER
 from datetime import datetime, timedelta
 from collections import Counter
 
@@ -39,28 +42,51 @@ def calc_date_range() -> Tuple[datetime, datetime]:
     return start, end
 
 
+def log_read_stats(crawlers) -> None:
+    totals: dict[str, Counter] = {}
+    for crawler in crawlers:
+        for host, stats in crawler.read_stats.items():
+            totals.setdefault(host, Counter()).update(stats)
+    for host, stats in sorted(totals.items()):
+        logger.info(
+            f"host {host}: 응답 {stats['responses']}건, 읽음 {stats['bytes_read']:,}byte, "
+            f"조기 종료 {stats['early_stops']}건(절약 {stats['bytes_saved']:,}byte), 상한 초과 {stats['capped']}건"
+        )
+
+
 async def main():
     dr = calc_date_range()
     logger.info(f"크롤링 기간: {dr[0]} ~ {dr[1]}")
+    region_cache_path = os.path.join(settings.CACHE_DIR, "region_cache.json")
+    REGION_GAZETTEER.load(region_cache_path)
     crawlers = [
         InterParkCrawler(dr), MelonCrawler(dr), SejongPac(dr), SacCrawler(dr), TicketLinkCrawler(dr), Yes24Crawler(dr),
         LGArtCrawler(dr)
     ]
 
-    # ✅ 예외가 발생해도 전체 실행 유지
-    tasks = [crawler.crawl() for crawler in crawlers]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # 크롤러가 끝나는 대로 병합해 두어, 느린 크롤러를 기다리는 동안 병합이 함께 진행되게 한다.
+    # 병합 결과는 넣는 순서와 무관하므로 끝난 순서대로 넣어도 실행마다 같다.
+    merger = TicketMerger(expected=(type(crawler).__name__ for crawler in crawlers))
+
+    async def crawl_and_merge(crawler) -> int:
+        # ✅ 예외가 발생해도 전체 실행 유지
+        try:
+            tickets = await crawler.crawl()
+        except Exception as e:
+            logger.error(f"[CRAWLER ERROR] {type(e).__name__}: {e}")
+            tickets = []
+        merger.add_many(tickets)
+        merger.finish(type(crawler).__name__)
+        return len(tickets)
 
-    all_tickets = []
-    for result in results:
-        if isinstance(result, Exception):
-            logger.error(f"[CRAWLER ERROR] {type(result).__name__}: {result}")
-            continue
-        all_tickets.extend(result)
+    counts = await asyncio.gather(*(crawl_and_merge(crawler) for crawler in crawlers))
 
-    logger.info(f"총 티켓 수: {len(all_tickets)}")
+    logger.info(f"총 티켓 수: {sum(counts)}")
+    log_read_stats(crawlers)
+    logger.info(f"지역 판정 캐시: hit={REGION_GAZETTEER.hits}, miss={REGION_GAZETTEER.misses}")
+    REGION_GAZETTEER.save(region_cache_path)
 
-    merged = merge_ticket_sources(all_tickets)
+    merged = merger.snapshot()
 
     provider_list = [provider for ticket in merged for provider in ticket.providers]
     counter = Counter(provider_list)
@@ -68,8 +94,8 @@ async def main():
     for provider, count in counter.items():
         logger.info(f"site {provider}: {count}")
 
-    repo = NotionRepository()
-    await repo.write_all(merged)
+    async with NotionRepository() as repo:
+        await repo.write_all(merged)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+import bench  # noqa: F401  (더미 설정값 주입)
+
+import pytest
+
+from bench.fake_notion import FakeNotion, ticket_workspace
+from notion_writer.governor import NOTION_GOVERNOR
+from utils.config import settings
+
+TICKET_DB, ACTOR_DB, WORK_DB = "tickets", "actors", "works"
+
+
+@pytest.fixture
+def fake(tmp_path, monkeypatch) -> FakeNotion:
+    """티켓/배우/작품 DB가 준비된 Notion 대역. 캐시/ICS 파일은 테스트마다 임시 디렉토리에 쓴다."""
+    monkeypatch.setattr(settings, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "GB_ICAL_DIR", str(tmp_path / "ical"))
+    monkeypatch.setattr(settings, "NOTION_ACT_DB_ID", ACTOR_DB)
+    monkeypatch.setattr(settings, "NOTION_TITLE_DB_ID", WORK_DB)
+    monkeypatch.setattr(NOTION_GOVERNOR, "rate", 0)
+    client = FakeNotion()
+    ticket_workspace(client, TICKET_DB, ACTOR_DB, WORK_DB)
+    return client
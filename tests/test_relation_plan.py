@@ -0,0 +1,82 @@
+import asyncio
+
+from notion_writer.relation_plan import plan_relation_writes
+from tests.conftest import ACTOR_DB, TICKET_DB
+
+DUAL = {"출연 배우": "출연 공연", "관련 작품": None}
+
+
+def relation(ids) -> dict:
+    return {"relation": [{"id": rel} for rel in ids]}
+
+
+def test_source_side_write_keeps_unchanged_tickets():
+    # t0, t1은 이미 배우 a에 걸려 있고, t1은 a에서 빠지며 t2~t11이 새로 a에 걸린다.
+    current = {"출연 배우": {"t0": {"a"}, "t1": {"a"}, **{f"t{idx}": set() for idx in range(2, 12)}}}
+    changes = {"t1": {"출연 배우": []}, **{f"t{idx}": {"출연 배우": ["a"]} for idx in range(2, 12)}}
+
+    writes = plan_relation_writes(changes, current, DUAL)
+
+    assert len(writes) == 1
+    write = writes[0]
+    assert (write.page_id, write.side) == ("a", "출연 배우")
+    # 반대쪽 목록 전체를 덮어쓰므로 바뀌지 않은 t0도 목록에 남아 있어야 한다.
+    assert write.properties == {"출연 공연": relation(sorted({"t0"} | {f"t{idx}" for idx in range(2, 12)}))}
+    assert set(write.tickets) == set(changes)
+
+
+def test_ticket_side_when_cheaper_or_over_limit():
+    current = {"출연 배우": {"t0": set(), "t1": {"b"}}}
+    changes = {"t0": {"출연 배우": ["a", "b"]}}
+    # 티켓 한 번이면 되는 변경은 배우 두 명에게 쓰지 않는다.
+    assert [(w.page_id, w.side) for w in plan_relation_writes(changes, current, DUAL)] == [("t0", "ticket")]
+
+    current = {"출연 배우": {f"t{idx}": set() for idx in range(10)}}
+    changes = {f"t{idx}": {"출연 배우": ["a"]} for idx in range(10)}
+    writes = plan_relation_writes(changes, current, DUAL, max_relations=5)
+    assert {w.side for w in writes} == {"ticket"} and len(writes) == 10
+
+
+def test_unidirectional_or_truncated_properties_stay_on_ticket_side():
+    changes = {f"t{idx}": {"관련 작품": ["w"], "출연 배우": ["a"]} for idx in range(5)}
+    # 출연 배우는 current에 없으므로(값이 잘린 경우) 반대쪽으로 쓸 수 없다.
+    writes = plan_relation_writes(changes, {"관련 작품": {}}, DUAL)
+    assert len(writes) == 5
+    assert all(w.side == "ticket" and set(w.properties) == {"관련 작품", "출연 배우"} for w in writes)
+
+
+def test_planned_writes_reach_the_same_state_as_ticket_side_writes(fake):
+    actors = [fake.add_page(ACTOR_DB, {"이름": {"title": [{"text": {"content": name}}]}}) for name in "abc"]
+    tickets = []
+    for idx in range(12):
+        linked = [actors[0]] if idx < 3 else [actors[1]] if idx < 5 else []
+        tickets.append(fake.add_page(TICKET_DB, {
+            "공연 제목": {"title": [{"text": {"content": f"공연{idx}"}}]},
+            "출연 배우": relation(linked),
+        }))
+    pages = {page["id"]: page for page in fake.pages_in(TICKET_DB)}
+    current = {"출연 배우": {
+        page_id: {rel["id"] for rel in page["properties"]["출연 배우"]["relation"]} for page_id, page in pages.items()
+    }}
+    # 배우 c가 여러 공연에 새로 걸리고, 한 공연은 a에서 b로 바뀐다.
+    wanted = {page_id: set(ids) for page_id, ids in current["출연 배우"].items()}
+    for page_id in tickets[3:]:
+        wanted[page_id] = wanted[page_id] | {actors[2]}
+    wanted[tickets[0]] = {actors[1]}
+    changes = {
+        page_id: {"출연 배우": sorted(ids)} for page_id, ids in wanted.items() if ids != current["출연 배우"][page_id]
+    }
+
+    writes = plan_relation_writes(changes, current, DUAL)
+    assert any(write.side != "ticket" for write in writes)
+    assert len(writes) < len(changes)
+
+    async def apply():
+        for write in writes:
+            await fake.pages.update(page_id=write.page_id, properties=write.properties)
+
+    asyncio.run(apply())
+    result = {
+        page["id"]: {rel["id"] for rel in page["properties"]["출연 배우"]["relation"]} for page in fake.pages_in(TICKET_DB)
+    }
+    assert result == wanted
@@ -0,0 +1,252 @@
+import asyncio
+import os
+from datetime import datetime
+
+from notion_client.errors import RequestTimeoutError
+
+from bench.fake_notion import FakeNotion, ticket_workspace
+from models.ticket import TicketRecord
+from notion_writer import fingerprint
+from notion_writer.journal import WriteJournal
+from notion_writer.writer import NotionRepository
+from tests.conftest import ACTOR_DB, TICKET_DB, WORK_DB
+from utils.config import settings
+
+WRITE_ENDPOINTS = ("pages.create", "pages.update", "blocks.delete", "blocks.children.append")
+
+
+def make_ticket(title: str = "뮤지컬 〈테스트〉", discount: str = "없음", notice_lines: int = 30) -> TicketRecord:
+    notice = "\n".join(f"{idx}번째 공지 " + "가" * 80 for idx in range(notice_lines))
+    return TicketRecord(
+        title=title, open_datetime=datetime(2026, 3, 1, 14), source="놀티켓", cast="김배우",
+        content={"공연 소개": notice, "출연진": "김배우", "할인 정보": discount},
+    )
+
+
+def write(fake: FakeNotion, tickets) -> NotionRepository:
+    async def run():
+        async with NotionRepository(client=fake, database_id=TICKET_DB) as repo:
+            await repo.write_all(tickets)
+        return repo
+
+    return asyncio.run(run())
+
+
+def ticket_pages(fake: FakeNotion) -> list:
+    return list(fake.pages_in(TICKET_DB))
+
+
+def page_blocks(fake: FakeNotion, page_id: str) -> list:
+    """페이지 본문을 (블록 종류, 글자) 목록으로 읽는다."""
+    async def read():
+        blocks, cursor = [], None
+        while True:
+            params = {"start_cursor": cursor} if cursor else {}
+            response = await fake.blocks.children.list(block_id=page_id, page_size=100, **params)
+            blocks += response["results"]
+            if not response["has_more"]:
+                return blocks
+            cursor = response["next_cursor"]
+
+    return [
+        (block["type"], "".join(part["plain_text"] for part in block[block["type"]]["rich_text"]))
+        for block in asyncio.run(read())
+    ]
+
+
+def fresh_blocks(tmp_path, monkeypatch, ticket: TicketRecord) -> list:
+    """같은 티켓을 빈 작업 공간에 처음 썼을 때의 본문."""
+    monkeypatch.setattr(settings, "CACHE_DIR", str(tmp_path / "fresh-cache"))
+    other = FakeNotion()
+    ticket_workspace(other, TICKET_DB, ACTOR_DB, WORK_DB)
+    write(other, [ticket])
+    return page_blocks(other, ticket_pages(other)[0]["id"])
+
+
+def write_calls(fake: FakeNotion) -> dict:
+    return {name: fake.calls[name] for name in WRITE_ENDPOINTS if fake.calls[name]}
+
+
+def test_unchanged_ticket_makes_no_writes(fake):
+    write(fake, [make_ticket()])
+    fake.calls.clear()
+
+    repo = write(fake, [make_ticket()])
+
+    assert write_calls(fake) == {}
+    assert repo.write_stats["unchanged"] == 1
+
+
+def test_changed_section_is_patched_in_place(fake, tmp_path, monkeypatch):
+    write(fake, [make_ticket()])
+    page_id = ticket_pages(fake)[0]["id"]
+    total_blocks = fake.block_count(page_id)
+    fake.calls.clear()
+
+    changed = make_ticket(discount="조기 예매 10%")
+    repo = write(fake, [changed])
+
+    assert repo.write_stats["patched"] == 1
+    assert fake.calls["pages.create"] == 0
+    # 바뀐 섹션의 블록만 지운다.
+    assert 0 < fake.calls["blocks.delete"] < total_blocks
+    assert [page["id"] for page in ticket_pages(fake)] == [page_id]
+    assert page_blocks(fake, page_id) == fresh_blocks(tmp_path, monkeypatch, changed)
+
+
+def test_interrupted_write_is_resumed_from_journal(fake, tmp_path, monkeypatch):
+    # 본문이 100블록을 넘어 생성 뒤 이어 붙이는 호출이 필요한 티켓
+    ticket = make_ticket(notice_lines=3_000)
+    append = fake.blocks.children.append
+
+    async def crash(**kwargs):
+        raise RuntimeError("프로세스가 죽었다고 치고 더 쓰지 않는다")
+
+    fake.blocks.children.append = crash
+    write(fake, [ticket])
+    journal_path = os.path.join(settings.CACHE_DIR, "notion_write_journal.jsonl")
+    assert os.path.exists(journal_path)
+    page_id = ticket_pages(fake)[0]["id"]
+    assert fake.block_count(page_id) == 100
+
+    # 크롤링 결과 없이도 저널에 남은 티켓을 끝까지 다시 쓴다.
+    fake.blocks.children.append = append
+    write(fake, [])
+
+    assert not os.path.exists(journal_path)
+    assert [page["id"] for page in ticket_pages(fake)] == [page_id]
+    expected = fresh_blocks(tmp_path, monkeypatch, ticket)
+    assert len(expected) > 100
+    assert page_blocks(fake, page_id) == expected
+
+
+def test_lost_create_response_does_not_duplicate_page(fake):
+    create = fake.pages.create
+
+    async def create_then_time_out(**kwargs):
+        # 생성은 반영됐지만 응답을 받지 못한 경우
+        fake.pages.create = create
+        await create(**kwargs)
+        raise RequestTimeoutError()
+
+    fake.pages.create = create_then_time_out
+    write(fake, [make_ticket()])
+
+    assert fake.calls["pages.create"] == 1
+    assert len(ticket_pages(fake)) == 1
+    assert not os.path.exists(os.path.join(settings.CACHE_DIR, "notion_write_journal.jsonl"))
+
+
+def test_unconfirmed_create_is_parked_not_resent(fake, monkeypatch):
+    monkeypatch.setattr(NotionRepository, "CONFIRM_ATTEMPTS", 1)
+
+    async def time_out(**kwargs):
+        # 생성이 반영됐는지 알 수 없는 경우(실제로는 반영되지 않았다)
+        fake.calls["pages.create"] += 1
+        raise RequestTimeoutError()
+
+    fake.pages.create = time_out
+    write(fake, [make_ticket()])
+
+    assert fake.calls["pages.create"] == 1
+    assert ticket_pages(fake) == []
+    journal_path = os.path.join(settings.CACHE_DIR, "notion_write_journal.jsonl")
+    assert not os.path.exists(journal_path)
+    assert os.path.exists(f"{journal_path}.parked")
+
+
+def test_create_sent_before_crash_is_found_by_operation_id(fake):
+    create = fake.pages.create
+
+    async def create_then_die(**kwargs):
+        # 생성은 반영됐지만 페이지 ID를 저널에 적기 전에 죽은 경우
+        fake.pages.create = create
+        await create(**kwargs)
+        raise RuntimeError("프로세스가 죽었다고 치고 더 쓰지 않는다")
+
+    fake.pages.create = create_then_die
+    write(fake, [make_ticket()])
+    page_id = ticket_pages(fake)[0]["id"]
+
+    write(fake, [])
+
+    assert fake.calls["pages.create"] == 1
+    assert [page["id"] for page in ticket_pages(fake)] == [page_id]
+    assert not os.path.exists(os.path.join(settings.CACHE_DIR, "notion_write_journal.jsonl"))
+
+
+def test_lost_append_response_does_not_duplicate_blocks(fake, tmp_path, monkeypatch):
+    write(fake, [make_ticket()])
+    page_id = ticket_pages(fake)[0]["id"]
+    append = fake.blocks.children.append
+
+    async def append_then_time_out(**kwargs):
+        fake.blocks.children.append = append
+        await append(**kwargs)
+        raise RequestTimeoutError()
+
+    fake.blocks.children.append = append_then_time_out
+    changed = make_ticket(discount="조기 예매 10%")
+    repo = write(fake, [changed])
+
+    assert repo.write_stats["patched"] == 1
+    assert page_blocks(fake, page_id) == fresh_blocks(tmp_path, monkeypatch, changed)
+
+
+def test_journal_parks_entries_past_limits(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    now = [1_000.0]
+
+    def journal() -> WriteJournal:
+        return WriteJournal(path, TICKET_DB, max_attempts=2, max_age_hours=1, clock=lambda: now[0])
+
+    for _ in range(2):
+        first = journal()
+        first.load()
+        first.begin(("재시도", "2026-03-01T14:00:00+09:00"), "fp", None, {})
+        first.close()
+    second = journal()
+    second.load()
+    second.begin(("오래됨", "2026-03-01T14:00:00+09:00"), "fp", None, {})
+    second.close()
+
+    assert set(journal().load()) == {("오래됨", "2026-03-01T14:00:00+09:00")}
+    now[0] += 2 * 3600
+    assert journal().load() == {}
+    with open(f"{path}.parked", encoding="utf-8") as f:
+        assert f.read().count("\n") == 2
+
+
+def test_missing_fingerprint_property_leaves_schema_alone(fake, monkeypatch):
+    # 티켓 DB에 없는 이름의 지문 속성
+    monkeypatch.setattr(settings, "NOTION_FINGERPRINT_PROPERTY", "새 지문")
+
+    repo = write(fake, [make_ticket()])
+
+    assert fake.calls["data_sources.update"] == fake.calls["databases.update"] == 0
+    assert repo.fingerprint_property is None
+    assert len(ticket_pages(fake)) == 1
+
+    monkeypatch.setattr(settings, "NOTION_FINGERPRINT_CREATE_PROPERTY", True)
+    write(fake, [make_ticket()])
+    assert fake.calls["data_sources.update"] == 1
+    fake.calls.clear()
+    repo = write(fake, [make_ticket()])
+    assert write_calls(fake) == {}
+    assert repo.write_stats["unchanged"] == 1
+
+
+def test_summarized_fingerprint_still_skips_unchanged_page(fake, monkeypatch):
+    monkeypatch.setattr(fingerprint, "MAX_FINGERPRINT_CHARS", 0)
+    write(fake, [make_ticket()])
+    stored = ticket_pages(fake)[0]["properties"][settings.NOTION_FINGERPRINT_PROPERTY]
+    assert "s=*" in "".join(part["plain_text"] for part in stored["rich_text"])
+    fake.calls.clear()
+
+    repo = write(fake, [make_ticket()])
+    assert write_calls(fake) == {}
+    assert repo.write_stats["unchanged"] == 1
+
+    repo = write(fake, [make_ticket(discount="조기 예매 10%")])
+    assert repo.write_stats["unchanged"] == 0
+    assert fake.calls["pages.create"] == 0
@@ -5,9 +5,12 @@ from .utils import normalize_title_for_merge
 from .utils import clean_cast_text
 from .utils import extract_cast_from_lines
 from .utils import resolve_region
+from .utils import is_unsupported_region
+from .utils import REGION_GAZETTEER
 from .utils import extract_open_round
 from .utils import extract_open_round_period
 from .utils import extract_performance_period
+from .utils import apply_content_policy
 
 __all__ = [
     "normalize_date_string",
@@ -16,7 +19,10 @@ __all__ = [
     "clean_cast_text",
     "extract_cast_from_lines",
     "resolve_region",
+    "is_unsupported_region",
+    "REGION_GAZETTEER",
     "extract_open_round",
     "extract_open_round_period",
     "extract_performance_period",
+    "apply_content_policy",
 ]
@@ -12,14 +12,73 @@ class Settings(BaseSettings):
     NOTION_PAGE_ID: str
     USER_AGENT: str = "Mozilla/5.0"
     HTTP_TIMEOUT: int = 10
+    # 응답 본문 한 건에서 읽을 최대 바이트 수. 넘으면 잘라서 사용한다.
+    HTTP_MAX_BYTES: int = 5 * 1024 * 1024
+    # 페이지 한 건의 파싱(정규식 추출 포함)에 허용하는 최대 시간(초). 0이면 제한하지 않는다.
+    PARSE_TIME_BUDGET: float = 5.0
+    # BeautifulSoup에 넘기는 본문 한 건의 최대 글자 수. 넘으면 잘라서 파싱한다(0이면 제한하지 않는다).
+    # 시간 예산은 단계 사이에서만 검사하므로, 호출 한 번이 오래 걸리지 않도록 입력 크기를 묶어 둔다.
+    # 크롤러별 'parse_max_chars'가 있으면 덮어쓴다.
+    PARSE_MAX_CHARS: int = 1_000_000
     GB_ICAL_DIR: str = "ical_exports"
     GB_ICAL_URL: str
     GB_BRANCH: str = "main"
+    # Notion API 호출에 쓰는 HTTP 연결 풀 크기(비동기 클라이언트 하나가 공유)
+    NOTION_MAX_CONNECTIONS: int = 10
+    # 모든 Notion 호출이 거치는 전역 토큰 버킷. 공식 한도(평균 초당 3회)에 맞춘다.
+    NOTION_RATE_PER_SEC: float = 3.0
+    NOTION_RATE_BURST: int = 3
+    # 티켓 페이지마다 속성/본문 지문을 기록하는 rich_text 속성 이름. 비우면 변경 감지 없이 매번 전체를 다시 쓴다.
+    NOTION_FINGERPRINT_PROPERTY: str = "동기화 지문"
+    # 티켓 DB에 지문 속성이 없을 때 writer가 DB 스키마에 추가할지 여부. 끄면 스키마는 건드리지 않고 변경 감지 없이 쓴다.
+    NOTION_FINGERPRINT_CREATE_PROPERTY: bool = False
+    # 티켓 페이지 본문 배치. 'flat'은 섹션 블록을 페이지에 바로 두고, 'container'는 토글 블록 하나 아래에 모아
+    # 본문이 바뀌면 블록 수와 상관없이 삭제 1회 + 추가 1회로 교체한다. 기존 flat 페이지는 처음 갱신될 때 전환된다.
+    NOTION_PAGE_LAYOUT: str = "flat"
+    # 429(rate_limited)를 받았을 때 같은 호출을 다시 시도하는 최대 횟수
+    NOTION_RATE_LIMIT_RETRIES: int = 5
+    # 실행 간에 유지하는 로컬 캐시(지역 판정 등) 저장 디렉토리
+    CACHE_DIR: str = ".cache"
+    # Notion 메타데이터(data source ID, 배우/작품 이름 맵) 캐시 유지 시간. 지나면 전체를 다시 읽고, 0이면 파일에 남기지 않는다.
+    # 유지 시간 안에서는 마지막 동기화 이후 수정된 페이지만 조회한다(삭제된 페이지는 유지 시간이 지나야 빠진다).
+    NOTION_METADATA_CACHE_TTL_HOURS: float = 24.0
+    # 티켓 DB 로컬 미러(SQLite)를 전체 조회로 다시 만드는 주기. 그 사이에는 변경분만 조회하고, 0이면 미러를 쓰지 않는다.
+    NOTION_MIRROR_FULL_SYNC_HOURS: float = 168.0
+    # follow_run의 relation 동기화에서 동시에 처리하는 페이지 수(호출 속도 자체는 전역 governor가 맞춘다)
+    NOTION_RELATION_SYNC_CONCURRENCY: int = 6
+    # relation을 쓰는 쪽. 'auto'는 티켓 페이지마다 쓰는 것과 배우/작품 페이지에 모아 쓰는 것 중 호출이 적은 쪽을 고르고,
+    # 'ticket'은 항상 티켓 페이지에 쓴다.
+    NOTION_RELATION_WRITE_SIDE: str = "auto"
+    # write_all 쓰기 저널(선행 기록)을 디스크에 내리는(fsync) 줄 수 단위
+    NOTION_WRITE_JOURNAL_SYNC_EVERY: int = 20
+    # 쓰기 저널의 끝나지 않은 작업을 이만큼 시도했거나 이 시간(시간 단위)이 지나면 더 잇지 않고 보류한다(0이면 제한 없음)
+    NOTION_WRITE_JOURNAL_MAX_ATTEMPTS: int = 5
+    NOTION_WRITE_JOURNAL_MAX_AGE_HOURS: float = 72.0
 
     # .env에 값이 없으면 기본 9시간으로 설정
     TIMEZONE_OFFSET_HOURS: int = 9
     DEFAULT_TIMEZONE: ZoneInfo = ZoneInfo("Asia/Seoul")
 
+    # 병합 키가 조금 다른 티켓(띄어쓰기·오탈자, 몇 분 차이 나는 오픈 일시)을 묶는 퍼지 병합 설정.
+    # threshold: 제목 2-gram Dice 유사도 하한(0이면 끈다), max_block: 이보다 큰 후보 블록은 흔한 글자쌍으로 보고 되도록 건너뛴다(결과는 같다).
+    MERGE_FUZZY_THRESHOLD: float = 0.8
+    MERGE_FUZZY_TIME_TOLERANCE_MINUTES: int = 10
+    MERGE_FUZZY_MAX_BLOCK: int = 200
+    # 같은 공연을 여러 예매처가 팔 때 점수가 같은 필드(대표 상세 링크, 구분, 오픈 타입, 장소 등)를 가져올 예매처 순서.
+    # 앞에 있을수록 우선하며, 목록에 없는 예매처는 맨 뒤다. 기본값은 run.py의 크롤러 순서다.
+    MERGE_PROVIDER_PRIORITY: list[str] = ["놀티켓", "멜론티켓", "세종문화회관", "예술의전당", "티켓링크", "YES24", "LG 아트센터"]
+
+    # 티켓 content 본문 저장소가 메모리에 둘 최대 크기(MB). 넘으면 임시 파일(mmap)로 내린다.
+    CONTENT_STORE_MAX_MEMORY_MB: int = 256
+
+    # TicketInfo.content 섹션 보존 정책 기본값. 크롤러별 'content_policy'가 있으면 덮어쓴다.
+    # sections: 남길 섹션 이름 목록(None이면 전부), max_chars: 섹션당 최대 글자 수, fold_whitespace: 공백 정리 여부
+    CONTENT_POLICY: Dict[str, Any] = {
+        "sections": None,
+        "max_chars": 4000,
+        "fold_whitespace": True,
+    }
+
     # 크롤러별 설정 일원 관리
     CRAWLERS: Dict[str, Any] = {
         'inter_park': {
@@ -74,6 +133,10 @@ class Settings(BaseSettings):
                 'GENRE_CLA_ALL': '클래식'
             },
             'pages': [1, 2, 3],
+            'content_policy': {
+                'sections': ['기본정보', '공연소개', '기획사 정보', '출연진'],
+                'max_chars': 3000,
+            },
             'detail_selectors': {
                 'title': 'p.tit_consert',
                 'base_box': 'div.box_concert_time',
@@ -103,7 +166,11 @@ class Settings(BaseSettings):
                 "sortOrder": "B.TICKET_OPEN_DATE",
                 "sortDirection": "DESC",
             },
-            "detail_endpoint": "/site/main/show/show_view?SN="
+            "detail_endpoint": "/site/main/show/show_view?SN=",
+            # 할인정보 탭은 가격표 전체라 길이만 크고 페이지 본문으로만 쓰인다.
+            "content_policy": {
+                "max_chars": 2000,
+            },
         },
         'ticket_link': {
             'base_url': "https://www.ticketlink.co.kr",
@@ -144,6 +211,10 @@ class Settings(BaseSettings):
         },
         'lg_art': {
             'base_url': "https://www.lgart.com",
+            # 공지 전문이 단일 섹션으로 들어온다.
+            "content_policy": {
+                "max_chars": 6000,
+            },
             'list_endpoint': "/community/ko/notice?q=M2M3ODcyOWFjYjQ5NDdiN2E4YTBmOWMzN2VlZDAwYWU%3d",
             "headers": {
                 "User-Agent": USER_AGENT,
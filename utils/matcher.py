@@ -0,0 +1,70 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class KeywordAutomaton:
+    """여러 키워드를 한 번에 찾는 Aho-Corasick 자동자.
+
+    키워드마다 정규식을 따로 돌리지 않고 본문을 한 번만 훑어
+    겹치는 매칭까지 모두 (시작 위치, 키워드) 형태로 돌려준다.
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        self._built = True
+        for keyword in keywords:
+            self.add(keyword)
+        self.build()
+
+    def add(self, keyword: str) -> None:
+        if not keyword:
+            return
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = nxt
+        if keyword not in self._output[node]:
+            self._output[node] = self._output[node] + (keyword,)
+        self._built = False
+
+    def build(self) -> None:
+        if self._built:
+            return
+        # 너비 우선으로 실패 링크를 잇고, 실패 노드의 출력을 합쳐 접미 매칭도 보고한다.
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fallback = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = fallback if fallback != nxt else 0
+                own = self._output[nxt]
+                inherited = self._output[self._fail[nxt]]
+                self._output[nxt] = own + tuple(k for k in inherited if k not in own)
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(시작 위치, 키워드)를 본문 순서대로 돌려준다. 겹치는 매칭도 모두 포함한다."""
+        self.build()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for idx, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for keyword in output[node]:
+                yield idx - len(keyword) + 1, keyword
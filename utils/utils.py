@@ -1,4 +1,10 @@
+import hashlib
+import json
+import os
 import re
+from collections import OrderedDict
+
+from .matcher import KeywordAutomaton
 
 def normalize_date_string(date_text: str) -> str:
     # 1. 괄호 내부 제거
@@ -9,14 +15,46 @@ def normalize_date_string(date_text: str) -> str:
 
     return text
 
+def _sub_enclosed(text: str, openers: str, closers: str, repl) -> str:
+    """re.sub(r'\\s*[여는괄호](.*?)[닫는괄호]\\s*', repl, text)와 같은 결과를 선형 시간에 만든다.
+
+    지연 와일드카드 정규식은 닫히지 않은 괄호가 많은 긴 본문에서 여는 괄호마다 줄 끝까지 다시 훑어
+    제곱 시간이 걸린다. 닫는 괄호가 없는 줄은 이후 여는 괄호도 매칭될 수 없으므로 줄 단위로 건너뛴다.
+    """
+    closer_pattern = re.compile("[%s\n]" % re.escape(closers))
+    opener_pattern = re.compile("[%s]" % re.escape(openers))
+    parts = []
+    last = pos = 0
+    while True:
+        opener = opener_pattern.search(text, pos)
+        if not opener:
+            break
+        start = opener.start()
+        closer = closer_pattern.search(text, start + 1)
+        if not closer or closer.group() == "\n":
+            # 이 줄에는 더 이상 매칭이 없다.
+            if not closer:
+                break
+            pos = closer.end()
+            continue
+        end = closer.end()
+        while end < len(text) and text[end].isspace():
+            end += 1
+        parts.append(text[last:start].rstrip())
+        parts.append(repl(text[start + 1:closer.start()]))
+        last = pos = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
 def normalize_title(text: str) -> str:
     # 제목 앞의 연도는 표기용으로 제거한다.
     text = re.sub(r'^\s*\d{4}\s+', ' ', text)
     # 소괄호는 보통 부가 정보로 보고 제거한다.
-    text = re.sub(r'\s*\(.*?\)\s*', ' ', text)
+    text = _sub_enclosed(text, "(", ")", lambda inner: " ")
 
-    def normalize_square_bracket(match: re.Match) -> str:
-        inner = match.group(1).strip()
+    def normalize_square_bracket(inner: str) -> str:
+        inner = inner.strip()
         drop_words = (
             "서울", "경기", "부산", "울산", "인천", "대구", "대전", "광주", "세종",
             "수원", "성남", "평택", "군포", "앵콜", "단독", "선예매",
@@ -26,7 +64,7 @@ def normalize_title(text: str) -> str:
         return f" 〈{inner}〉 "
 
     # 대괄호 안 작품명은 보존하고, 지역/판매 수식어만 제거한다.
-    text = re.sub(r'\s*[\[［](.*?)[\]］]\s*', normalize_square_bracket, text)
+    text = _sub_enclosed(text, "[［", "]］", normalize_square_bracket)
     # 특수 문자나 구분자를 공백으로 변환
     text = re.sub(r'[〈<《〔【]', '〈', text)
     text = re.sub(r'[>》〕】〉]', '〉', text)
@@ -141,32 +179,146 @@ UNSUPPORTED_REGION_KEYWORDS = (
     "진주", "전주", "여수", "순천", "목포", "청주", "천안", "아산", "당진",
     "춘천", "원주", "강릉", "서귀포", "음성",
 )
+# 지역 판정 우선순위 순서. 한 본문에서 여러 지역이 걸리면 앞쪽 지역을 택한다.
+REGION_KEYWORDS = {
+    "경기": ("경기", "수원", "용인", "성남", "안산", "의왕", "안양", "평촌", "고양", "파주", "부천", "하남", "과천",
+             "광명", "평택", "군포", "서울랜드"),
+    "부산": ("부산", "Busan", "사직실내체육관"),
+    "울산": ("울산", "HD아트센터", "울산북구문화예술회관"),
+    "서울": ("서울", "Seoul", "예스24라이브홀", "예스24스테이지", "예스24아트원", "스카이아트홀", "구름아래소극장",
+             "장충체육관", "KBS아레나", "예술의전당", "홍익대 대학로", "대학로", "세종문화회관"),
+}
 REGION_PATTERNS = {
-    "경기": r"(경기|수원|용인|성남|안산|의왕|안양|평촌|고양|파주|부천|하남|과천|광명|평택|군포|서울랜드)",
-    "부산": r"(부산|Busan|사직실내체육관)",
-    "울산": r"(울산|HD아트센터|울산북구문화예술회관)",
-    "서울": r"(서울|Seoul|예스24라이브홀|예스24스테이지|예스24아트원|스카이아트홀|구름아래소극장|장충체육관|KBS아레나|예술의전당|홍익대 대학로|대학로|세종문화회관)",
+    region: "(%s)" % "|".join(map(re.escape, keywords))
+    for region, keywords in REGION_KEYWORDS.items()
 }
 
 
+class RegionGazetteer:
+    """지역 키워드 사전을 하나의 자동자로 컴파일해 본문을 한 번만 훑는 지역 판정기.
+
+    값(공연장/제목) 단위로 걸린 지역 태그를 기억하고, 파일로 저장해 다음 실행에서도 재사용한다.
+    """
+
+    UNSUPPORTED = "!"
+    CACHE_LIMIT = 5000
+
+    def __init__(self, supported_regions, unsupported_keywords, region_keywords):
+        self.supported_regions = tuple(supported_regions)
+        self.region_order = tuple(region_keywords)
+        self._tags: dict[str, set[str]] = {}
+        for keyword in unsupported_keywords:
+            self._tags.setdefault(keyword.casefold(), set()).add(self.UNSUPPORTED)
+        for region, keywords in region_keywords.items():
+            for keyword in keywords:
+                self._tags.setdefault(keyword.casefold(), set()).add(region)
+        self._automaton = KeywordAutomaton(self._tags)
+        self.signature = hashlib.sha1(
+            json.dumps(
+                [self.supported_regions, sorted(unsupported_keywords), region_keywords],
+                ensure_ascii=False,
+            ).encode("utf-8")
+        ).hexdigest()
+        self._cache: "OrderedDict[str, frozenset[str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def scan(self, text: str) -> frozenset[str]:
+        """본문에서 걸린 지역 태그 집합을 돌려준다. 결과는 값 단위로 캐시한다."""
+        cached = self._cache.get(text)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(text)
+            return cached
+
+        self.misses += 1
+        folded = text.casefold()
+        tags: set[str] = set()
+        for start, keyword in self._automaton.iter_matches(folded):
+            # "세종"은 세종특별자치시(비수도권) 지역명이지만, "세종문화회관"은 서울 소재 공연장이라
+            # 단순 부분 문자열 매칭 시 오검출되므로 제외 처리한다.
+            if keyword == "세종" and folded.startswith("문화회관", start + len(keyword)):
+                continue
+            tags |= self._tags[keyword]
+        result = frozenset(tags)
+        self._cache[text] = result
+        if len(self._cache) > self.CACHE_LIMIT:
+            self._cache.popitem(last=False)
+        return result
+
+    def resolve(self, *values: str, default_region: str = "서울") -> str | None:
+        tags: set[str] = set()
+        for value in values:
+            tags |= self.scan(str(value or ""))
+
+        if self.UNSUPPORTED in tags:
+            return None
+        for region in self.region_order:
+            if region in tags:
+                return region
+        return default_region if default_region in self.supported_regions else None
+
+    def is_unsupported(self, *values: str) -> bool:
+        """목록 단계에서 상세 요청 전에 비수도권 공연을 걸러내기 위한 판정."""
+        return any(self.UNSUPPORTED in self.scan(str(value or "")) for value in values)
+
+    def load(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        # 키워드 사전이 바뀌었으면 이전 판정 결과는 버린다.
+        if data.get("signature") != self.signature:
+            return
+        for value, tags in data.get("values", {}).items():
+            self._cache[value] = frozenset(tags)
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "signature": self.signature,
+            "values": {value: sorted(tags) for value, tags in self._cache.items()},
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+REGION_GAZETTEER = RegionGazetteer(SUPPORTED_REGIONS, UNSUPPORTED_REGION_KEYWORDS, REGION_KEYWORDS)
+
+
 def resolve_region(*values: str, default_region: str = "서울") -> str | None:
-    corpus = " ".join(str(value or "") for value in values)
+    return REGION_GAZETTEER.resolve(*values, default_region=default_region)
 
-    # "세종"은 세종특별자치시(비수도권) 지역명이지만, "세종문화회관"은 서울 소재 공연장이라
-    # 단순 부분 문자열 매칭 시 오검출되므로 제외 처리한다.
-    unsupported_terms = [
-        rf"{re.escape(kw)}(?!문화회관)" if kw == "세종" else re.escape(kw)
-        for kw in UNSUPPORTED_REGION_KEYWORDS
-    ]
-    unsupported_pattern = r"(?:%s)" % "|".join(unsupported_terms)
-    if re.search(unsupported_pattern, corpus, re.I):
-        return None
 
-    for region, pattern in REGION_PATTERNS.items():
-        if re.search(pattern, corpus, re.I):
-            return region
+def is_unsupported_region(*values: str) -> bool:
+    return REGION_GAZETTEER.is_unsupported(*values)
+
 
-    return default_region if default_region in SUPPORTED_REGIONS else None
+def apply_content_policy(content: dict, policy: dict) -> dict:
+    """크롤러 content 섹션에 보존 정책(섹션 선택, 섹션당 글자 수 상한, 공백 정리)을 적용한다."""
+    sections = policy.get("sections")
+    max_chars = policy.get("max_chars")
+    fold_whitespace = policy.get("fold_whitespace", True)
+
+    result = {}
+    for key, value in content.items():
+        if sections is not None and key not in sections:
+            continue
+        text = str(value or "")
+        if fold_whitespace:
+            lines = (" ".join(line.split()) for line in text.splitlines())
+            text = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+        if max_chars and len(text) > max_chars:
+            # 가능하면 줄 경계에서 자르고, 잘렸다는 표시를 남긴다.
+            cut = text.rfind("\n", 0, max_chars)
+            text = text[:cut if cut > max_chars // 2 else max_chars].rstrip() + " …"
+        result[key] = text
+    return result
 
 
 def normalize_open_round(text: str | None) -> str | None: